@@ -0,0 +1,1145 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+import httpx
+
+from fireflyConverter import data
+from fireflyConverter.duplicateIndex import DuplicateIndex, accountNames
+from fireflyConverter.fireflyInterface import (
+    REFERENCE_ENDPOINTS,
+    REFERENCE_VERSION_LIMIT,
+    BaseFireflyInterface,
+    BulkDeleteResult,
+    DuplicateTransactionHandle,
+    ErrorCode,
+    FireflyApiError,
+    RuleGroupScope,
+    TransactionResult,
+    TransactionStatus,
+)
+from fireflyConverter.fireflyPayload import TransactionGrouping, selectSplits
+from fireflyConverter.payloadPipeline import PayloadPipeline
+from fireflyConverter.referenceCache import ReferenceKind, ReferenceMap
+
+logger = logging.getLogger(__name__)
+
+# Item type of paginated list endpoints
+T = TypeVar("T")
+
+
+class AsyncFireflyInterface(BaseFireflyInterface):
+    """Asyncio counterpart of `FireflyInterface` for the Firefly III REST API.
+
+    Offers the same methods as `FireflyInterface` as coroutines. All requests share one
+    `httpx.AsyncClient` whose connection pool limits the number of concurrent
+    connections to the server. Payloads are built by the same `PayloadFactory` and
+    duplicate transactions are handled in the same way.
+
+    The interface is an async context manager closing its client on exit:
+
+        async with AsyncFireflyInterface(base_url, api_token) as interface:
+            await interface.createTransaction(transaction)
+
+    Requires the optional dependency httpx (`pip install firefly-cash-converter[async]`).
+
+    Attributes:
+        _client (httpx.AsyncClient): HTTP client with authentication headers and connection limits.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_token: str,
+        default_balance_account_id: Optional[int] = None,
+        duplicate_transaction: DuplicateTransactionHandle | str = DuplicateTransactionHandle.ERROR,
+        max_connections: int = 10,
+        cache_ttl: float = 300.0,
+        cache_file: Optional[str] = None,
+        max_retries: int = 4,
+        backoff_factor: float = 0.5,
+        rate_limit: Optional[float] = None,
+        connect_timeout: Optional[float] = 10.0,
+        read_timeout: Optional[float] = 60.0,
+        keep_alive: bool = True,
+        pool_maxsize: int = 10,
+        lean_responses: bool = False,
+        adaptive_concurrency: Optional[int] = None,
+    ) -> None:
+        """Initialize the asyncio Firefly III API interface.
+
+        Args:
+            base_url (str): Base URL of the Firefly III instance (e.g., "https://firefly.example.com").
+            api_token (str): API token for authentication with the Firefly III instance.
+            default_balance_account_id (Optional[int]): Default account ID to use for balancing transactions.
+                Defaults to None.
+            duplicate_transaction (DuplicateTransactionHandle | str): How to handle duplicate transactions.
+                Can be a DuplicateTransactionHandle enum or string value ("ignore" or "error").
+                Defaults to DuplicateTransactionHandle.ERROR.
+            max_connections (int): Maximum number of concurrent connections to the server. Defaults to 10.
+            cache_ttl (float): Time to live of cached reference data in seconds. Zero disables
+                the cache. Defaults to 300.
+            cache_file (Optional[str]): File persisting reference data across invocations.
+                Defaults to None (not persisted).
+            max_retries (int): Maximum number of repetitions of a request after a transient
+                failure. Defaults to 4.
+            backoff_factor (float): Base delay of the exponential backoff between repetitions
+                in seconds. Defaults to 0.5.
+            rate_limit (Optional[float]): Maximum number of requests per second. Defaults to None
+                (not limited).
+            connect_timeout (Optional[float]): Timeout for establishing a connection in seconds.
+                None waits forever. Defaults to 10.
+            read_timeout (Optional[float]): Timeout for receiving a response in seconds. None waits
+                forever. Defaults to 60.
+            keep_alive (bool): Keep connections open for reuse by later requests. Defaults to True.
+            pool_maxsize (int): Maximum number of idle connections kept open, at most
+                max_connections. Defaults to 10.
+            lean_responses (bool): Only extract the ID from the responses to created transaction
+                groups instead of decoding the full group. Defaults to False.
+            adaptive_concurrency (Optional[int]): Maximum number of concurrent requests of an adaptive
+                limit, which grows while the latency stays flat and shrinks on rising latency, server
+                errors and 429. Defaults to None (not limited).
+        """
+        super().__init__(
+            base_url,
+            api_token,
+            default_balance_account_id,
+            duplicate_transaction,
+            cache_ttl,
+            cache_file,
+            max_retries,
+            backoff_factor,
+            rate_limit,
+            connect_timeout,
+            read_timeout,
+            keep_alive,
+            pool_maxsize,
+            lean_responses,
+            adaptive_concurrency,
+        )
+        keepaliveConnections = min(pool_maxsize, max_connections) if keep_alive else 0
+        self._client = httpx.AsyncClient(
+            headers=self._headers,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=keepaliveConnections),
+            timeout=httpx.Timeout(connect=connect_timeout, read=read_timeout, write=read_timeout, pool=None),
+        )
+
+    async def __aenter__(self) -> AsyncFireflyInterface:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its connections."""
+        await self._client.aclose()
+
+    async def _request(
+        self, method: str, url: str, attempts: Optional[List[Optional[int]]] = None, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request through the retry and rate limiting layer, see `FireflyInterface._request`.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL of the request.
+            attempts (Optional[List[Optional[int]]]): List the status of each attempt is appended
+                to, None for attempts without response. Defaults to None.
+            **kwargs (Any): Further arguments of httpx.AsyncClient.request, e.g. params or json.
+
+        Returns:
+            httpx.Response: Response of the last attempt.
+
+        Raises:
+            httpx.TransportError: If the server cannot be reached or the request times out and
+                the request is not repeated.
+        """
+        idempotent = self._isIdempotent(method, kwargs.get("json"))
+        retry = 0
+        while True:
+            if self._rateLimiter is not None:
+                await asyncio.sleep(self._rateLimiter.reserve())
+            acquired = None if self._concurrencyLimiter is None else await self._concurrencyLimiter.acquireAsync()
+            started = time.perf_counter()
+            response = None
+            try:
+                response = await self._client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                self._recordAttempt(method, url, started, retry)
+                if attempts is not None:
+                    attempts.append(None)
+                delay = self._retryDelay(f"{method} {url}", retry, idempotent, error=e)
+                if delay is None:
+                    raise
+            else:
+                self._recordAttempt(method, url, started, retry, response)
+                if attempts is not None:
+                    attempts.append(response.status_code)
+                delay = self._retryDelay(f"{method} {url}", retry, idempotent, response=response)
+                if delay is None:
+                    return response
+            finally:
+                self._releaseSlot(acquired, response)
+            await asyncio.sleep(delay)
+            retry += 1
+
+    async def _getPage(self, url: str, params: Dict[str, Any], page: int) -> Dict:
+        """Request one page of a list endpoint.
+
+        Args:
+            url (str): URL of the endpoint.
+            params (Dict[str, Any]): Query parameters without the page number.
+            page (int): Page number.
+
+        Returns:
+            Dict: Decoded JSON body of the response.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        response = await self._request("GET", url, params={**params, "page": page})
+        response.raise_for_status()
+        return response.json()
+
+    async def _iterPages(
+        self, endpoint: str, params: Dict[str, Any], parse: Callable[[Dict], List[T]], prefetch: int = 0
+    ) -> AsyncIterator[T]:
+        """Iterate over the items of a paginated list endpoint.
+
+        Follows the pagination metadata like `FireflyInterface._iterPages`. With
+        prefetching, the pages after the first are requested concurrently, with at most
+        `prefetch` pages in flight, and their items are yielded in page order.
+
+        Args:
+            endpoint (str): Path of the endpoint relative to the API URL, e.g. "accounts".
+            params (Dict[str, Any]): Query parameters, the page number is set per request.
+            parse (Callable[[Dict], List[T]]): Conversion of a response body into items.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0,
+                requesting the pages sequentially.
+
+        Yields:
+            T: Items of all pages, in the order of the server.
+
+        Raises:
+            ValueError: If prefetch is negative.
+            httpx.HTTPStatusError: If an HTTP request fails.
+        """
+        if prefetch < 0:
+            raise ValueError(f"Number of prefetched pages must not be negative, got {prefetch}")
+
+        url = f"{self._api_url}/{endpoint}"
+        body = await self._getPage(url, params, 1)
+        pageCount = self._pageCount(body)
+        for item in parse(body):
+            yield item
+
+        if prefetch == 0:
+            for page in range(2, pageCount + 1):
+                body = await self._getPage(url, params, page)
+                pageCount = self._pageCount(body)
+                for item in parse(body):
+                    yield item
+            return
+
+        pending: Deque[asyncio.Task[Dict]] = collections.deque()
+        try:
+            for page in range(2, pageCount + 1):
+                pending.append(asyncio.create_task(self._getPage(url, params, page)))
+                if len(pending) >= prefetch:
+                    for item in parse(await pending.popleft()):
+                        yield item
+            while pending:
+                for item in parse(await pending.popleft()):
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def iterAccounts(
+        self, limit: Optional[int] = None, type: Optional[str] = None, prefetch: int = 0
+    ) -> AsyncIterator[data.GetAccount]:
+        """Iterate over all accounts on the Firefly III server.
+
+        Args:
+            limit (Optional[int]): Number of items per page. Defaults to the server default.
+            type (Optional[str]): Filter on account type, e.g. asset, expense, revenue. Defaults to None.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Returns:
+            AsyncIterator[data.GetAccount]: Accounts of all pages.
+        """
+        params = self._payloadFactory.getAccounts(limit, account_type=type)
+        return self._iterPages("accounts", params, self._parseAccounts, prefetch)
+
+    def iterTransactions(
+        self,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        type: Optional[str] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[data.GetTransaction]:
+        """Iterate over all transactions on the Firefly III server.
+
+        Args:
+            limit (Optional[int]): Number of items per page. Defaults to the server default.
+            start (Optional[str]): Start date (YYYY-MM-DD format). Defaults to None.
+            end (Optional[str]): End date (YYYY-MM-DD format). Defaults to None.
+            type (Optional[str]): Filter by transaction type (withdrawal, deposit, etc.). Defaults to None.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Returns:
+            AsyncIterator[data.GetTransaction]: Transaction splits of all pages.
+        """
+        params = self._payloadFactory.getTransactions(limit, None, start, end, type)
+        return self._iterPages("transactions", params, self._parseTransactions, prefetch)
+
+    def searchTransactions(
+        self, query: str, limit: Optional[int] = None, prefetch: int = 0
+    ) -> AsyncIterator[data.GetTransaction]:
+        """Iterate over the transactions matching a search query.
+
+        Args:
+            query (str): Search query using the Firefly III search operators, e.g.
+                "updated_at_after:2025-07-01".
+            limit (Optional[int]): Number of items per page. Defaults to the server default.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Returns:
+            AsyncIterator[data.GetTransaction]: Transaction splits of all matching transaction groups.
+        """
+        params = self._payloadFactory.searchTransactions(query, limit)
+        return self._iterPages("search/transactions", params, self._parseTransactions, prefetch)
+
+    async def countTransactions(self) -> int:
+        """Count the transaction groups on the server with a single small request.
+
+        Returns:
+            int: Number of transaction groups on the server.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        return self._itemCount(await self._getPage(f"{self._api_url}/transactions", {"limit": 1}, 1))
+
+    def iterRules(self, limit: int = 100, prefetch: int = 0) -> AsyncIterator[data.GetRule]:
+        """Iterate over all rules on the Firefly III server.
+
+        Args:
+            limit (int): Number of items per page. Defaults to 100.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Returns:
+            AsyncIterator[data.GetRule]: Rules of all pages.
+        """
+        return self._iterPages("rules", self._payloadFactory.getRules(limit), self._parseRules, prefetch)
+
+    def iterRuleGroups(self, limit: int = 100, prefetch: int = 0) -> AsyncIterator[data.GetRuleGroup]:
+        """Iterate over all rule groups on the Firefly III server.
+
+        Args:
+            limit (int): Number of items per page. Defaults to 100.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Returns:
+            AsyncIterator[data.GetRuleGroup]: Rule groups of all pages.
+        """
+        params = self._payloadFactory.getRuleGroups(limit)
+        return self._iterPages("rule-groups", params, self._parseRuleGroups, prefetch)
+
+    def iterCurrencies(self, limit: int = 100, prefetch: int = 0) -> AsyncIterator[data.GetCurrency]:
+        """Iterate over all currencies on the Firefly III server.
+
+        Args:
+            limit (int): Number of items per page. Defaults to 100.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Returns:
+            AsyncIterator[data.GetCurrency]: Currencies of all pages.
+        """
+        params = self._payloadFactory.getCurrencies(limit)
+        return self._iterPages("currencies", params, self._parseCurrencies, prefetch)
+
+    async def _referenceVersion(self, kind: ReferenceKind) -> str:
+        """Compute the version of the listing of a kind of reference data with a single request.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+
+        Returns:
+            str: Version of the listing, see `_listingVersion`.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        url = f"{self._api_url}/{REFERENCE_ENDPOINTS[kind]}"
+        return self._listingVersion(await self._getPage(url, {"limit": REFERENCE_VERSION_LIMIT}, 1))
+
+    async def _loadReferences(self, kind: ReferenceKind, revalidate: bool = False) -> ReferenceMap:
+        """List the objects of a kind of reference data on the server.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+            revalidate (bool): Use persisted data after checking it against the server. Defaults to False.
+
+        Returns:
+            ReferenceMap: IDs of the objects by name.
+
+        Raises:
+            httpx.HTTPStatusError: If an HTTP request fails.
+        """
+        if self._referenceStore is None:
+            return await self._listReferences(kind)
+        stored = self._referenceStore.load(kind) if revalidate else None
+        version = await self._referenceVersion(kind)
+        if stored is not None and stored[1] == version:
+            logger.debug(f"Using stored {kind.value}, revalidated against the server")
+            return stored[0]
+        mapping = await self._listReferences(kind)
+        self._referenceStore.save(kind, mapping, version)
+        return mapping
+
+    async def _listReferences(self, kind: ReferenceKind) -> ReferenceMap:
+        """List all pages of a kind of reference data.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+
+        Returns:
+            ReferenceMap: IDs of the objects by name.
+
+        Raises:
+            httpx.HTTPStatusError: If an HTTP request fails.
+        """
+        iterators: Dict[ReferenceKind, Callable[[], AsyncIterator[Any]]] = {
+            ReferenceKind.ACCOUNTS: self.iterAccounts,
+            ReferenceKind.RULES: self.iterRules,
+            ReferenceKind.RULE_GROUPS: self.iterRuleGroups,
+            ReferenceKind.CURRENCIES: self.iterCurrencies,
+        }
+        return self._referenceMap(kind, [item async for item in iterators[kind]()])
+
+    async def _resolveReference(self, kind: ReferenceKind, name: str) -> Union[int, str]:
+        """Resolve the name of a reference object to its ID through the reference cache.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+            name (str): Account name, rule group title or currency code.
+
+        Returns:
+            Union[int, str]: ID of the object.
+
+        Raises:
+            ValueError: If no object or several objects have the name.
+            httpx.HTTPStatusError: If an HTTP request fails.
+        """
+        mapping = self._referenceCache.get(kind)
+        if mapping is None or name not in mapping:
+            mapping = await self._loadReferences(kind, revalidate=mapping is None)
+            self._referenceCache.put(kind, mapping)
+        return self._referenceCache.select(kind, mapping, name)
+
+    async def _sendResolved(
+        self,
+        kind: ReferenceKind,
+        key: Union[int, str],
+        send: Callable[[Union[int, str]], Awaitable[httpx.Response]],
+    ) -> Tuple[Union[int, str], httpx.Response]:
+        """Send a request for an object given by ID or by name, see `FireflyInterface._sendResolved`.
+
+        Args:
+            kind (ReferenceKind): Kind of the object.
+            key (Union[int, str]): ID or name of the object.
+            send (Callable[[Union[int, str]], Awaitable[httpx.Response]]): Sends the request for an ID.
+
+        Returns:
+            Tuple[Union[int, str], httpx.Response]: ID of the object and response of the request.
+
+        Raises:
+            ValueError: If key is a name and no object or several objects have the name.
+            httpx.HTTPStatusError: If resolving the name fails.
+        """
+        if not isinstance(key, str):
+            return key, await send(key)
+        id = await self._resolveReference(kind, key)
+        response = await send(id)
+        if response.status_code == 404:
+            logger.info(f"ID {id} of {key} is stale, reloading {kind.value}")
+            self._invalidateReferences(kind, persisted=True)
+            id = await self._resolveReference(kind, key)
+            response = await send(id)
+        return id, response
+
+    async def resolveAccountId(self, name: str) -> str:
+        """Resolve an account name to its ID.
+
+        Args:
+            name (str): Name of the account.
+
+        Returns:
+            str: ID of the account.
+
+        Raises:
+            ValueError: If no account or several accounts have the name.
+            httpx.HTTPStatusError: If an HTTP request fails.
+        """
+        return await self._resolveReference(ReferenceKind.ACCOUNTS, name)
+
+    async def resolveRuleId(self, title: str) -> int:
+        """Resolve a rule title to its ID.
+
+        Args:
+            title (str): Title of the rule.
+
+        Returns:
+            int: ID of the rule.
+
+        Raises:
+            ValueError: If no rule or several rules have the title.
+            httpx.HTTPStatusError: If an HTTP request fails.
+        """
+        return await self._resolveReference(ReferenceKind.RULES, title)
+
+    async def resolveRuleGroupId(self, title: str) -> int:
+        """Resolve a rule group title to its ID.
+
+        Args:
+            title (str): Title of the rule group.
+
+        Returns:
+            int: ID of the rule group.
+
+        Raises:
+            ValueError: If no rule group or several rule groups have the title.
+            httpx.HTTPStatusError: If an HTTP request fails.
+        """
+        return await self._resolveReference(ReferenceKind.RULE_GROUPS, title)
+
+    async def resolveCurrencyId(self, code: str) -> str:
+        """Resolve a currency code to its ID.
+
+        Args:
+            code (str): ISO 4217 code of the currency, e.g. EUR.
+
+        Returns:
+            str: ID of the currency.
+
+        Raises:
+            ValueError: If no currency has the code.
+            httpx.HTTPStatusError: If an HTTP request fails.
+        """
+        return await self._resolveReference(ReferenceKind.CURRENCIES, code)
+
+    async def getAccounts(self) -> List[data.GetAccount]:
+        """Retrieve the list of all accounts from the Firefly III server.
+
+        Returns:
+            List[data.GetAccount]: List of account objects with their attributes and metadata.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        logger.info("Retrieving accounts from Firefly III")
+        accounts = [account async for account in self.iterAccounts()]
+        logger.info(f"Retrieved {len(accounts)} accounts from Firefly III")
+        return accounts
+
+    async def createAccount(self, account: data.PostAccount) -> httpx.Response:
+        """Create a new account on the Firefly III server.
+
+        Args:
+            account (data.PostAccount): The account object to create.
+
+        Returns:
+            httpx.Response: The HTTP response from the Firefly API.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        logger.info(f"Creating account: {account.name}")
+        payload = self._payloadFactory.toPayload(account)
+        response = await self._request("POST", f"{self._api_url}/accounts", json=payload)
+        response.raise_for_status()
+        self._recordCreated(ReferenceKind.ACCOUNTS, account.name, self._responseBody(response))
+        logger.debug(f"Account {account.name} created successfully (status: {response.status_code})")
+        return response
+
+    async def deleteAccount(self, account_id: str) -> httpx.Response:
+        """Delete an account on the Firefly III server.
+
+        Args:
+            account_id (str): The Firefly account ID to delete.
+
+        Returns:
+            httpx.Response: The HTTP response from the Firefly API.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        logger.info(f"Deleting account: {account_id}")
+        response = await self._request("DELETE", f"{self._api_url}/accounts/{account_id}")
+        response.raise_for_status()
+        self._recordDeleted(ReferenceKind.ACCOUNTS, account_id)
+        logger.debug(f"Account {account_id} deleted successfully")
+        return response
+
+    async def deleteAccounts(self, account_ids: Optional[List[str]] = None, workers: int = 10) -> BulkDeleteResult:
+        """Delete one or more accounts from the Firefly III server.
+
+        Args:
+            account_ids (Optional[List[str]]): List of Firefly account IDs to delete.
+                If None, all accounts on the server will be fetched and deleted.
+                Defaults to None.
+            workers (int): Number of concurrent deletion requests. Defaults to 10.
+
+        Returns:
+            BulkDeleteResult: Deleted accounts and the error of each failed deletion.
+
+        Raises:
+            ValueError: If workers is smaller than 1.
+            httpx.HTTPStatusError: If fetching the accounts fails.
+        """
+        if account_ids is None:
+            logger.info("No account IDs provided, fetching all accounts for deletion")
+            account_ids = [account.id for account in await self.getAccounts()]
+
+        return await self._deleteConcurrently("accounts", account_ids, self.deleteAccount, workers)
+
+    async def _deleteConcurrently(
+        self,
+        label: str,
+        ids: List[Union[int, str]],
+        delete: Callable[[Any], Awaitable[httpx.Response]],
+        workers: int,
+    ) -> BulkDeleteResult:
+        """Delete objects with bounded concurrency, collecting failures.
+
+        Args:
+            label (str): Plural label of the objects, e.g. "accounts".
+            ids (List[Union[int, str]]): IDs of the objects to delete.
+            delete (Callable[[Any], Awaitable[httpx.Response]]): Deletes a single object, raising on failure.
+            workers (int): Number of concurrent deletion requests.
+
+        Returns:
+            BulkDeleteResult: Deleted objects and the error of each failed deletion.
+
+        Raises:
+            ValueError: If workers is smaller than 1.
+        """
+        if workers < 1:
+            raise ValueError(f"Number of workers must be at least 1, got {workers}")
+
+        logger.info(f"Deleting {len(ids)} {label} from Firefly III with {workers} workers")
+        result = BulkDeleteResult()
+        semaphore = asyncio.Semaphore(workers)
+
+        async def deleteOne(id: Union[int, str]) -> None:
+            async with semaphore:
+                try:
+                    await delete(id)
+                except (httpx.HTTPError, ValueError) as e:
+                    result.failed[id] = str(e)
+                else:
+                    result.deleted.append(id)
+            self._logDeleteProgress(label, result, len(ids))
+
+        await asyncio.gather(*(deleteOne(id) for id in ids))
+        self._logDeleteResult(label, result)
+        return result
+
+    async def deleteTransaction(self, transaction_id: str) -> httpx.Response:
+        """Delete a transaction on the Firefly III server.
+
+        Args:
+            transaction_id (str): The transaction journal ID to delete.
+
+        Returns:
+            httpx.Response: The HTTP response from the Firefly API.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        response = await self._request("DELETE", f"{self._api_url}/transactions/{transaction_id}")
+        response.raise_for_status()
+        return response
+
+    async def deleteTransactions(
+        self, transaction_ids: Optional[List[str]] = None, workers: int = 10
+    ) -> BulkDeleteResult:
+        """Delete one or more transactions from the Firefly III server.
+
+        Args:
+            transaction_ids (Optional[List[str]]): List of Firefly transaction IDs to delete.
+                If None, all transactions on the server will be fetched and deleted.
+                Defaults to None.
+            workers (int): Number of concurrent deletion requests. Defaults to 10.
+
+        Returns:
+            BulkDeleteResult: Deleted transactions and the error of each failed deletion.
+
+        Raises:
+            ValueError: If workers is smaller than 1.
+            httpx.HTTPStatusError: If fetching the transactions fails.
+        """
+        if transaction_ids is None:
+            logger.info("No transaction IDs provided, fetching all transactions for deletion")
+            groups = [str(transaction.transaction_id) async for transaction in self.iterTransactions(limit=500)]
+            transaction_ids = list(dict.fromkeys(groups))
+
+        return await self._deleteConcurrently("transactions", transaction_ids, self.deleteTransaction, workers)
+
+    async def purgeUserData(self, user_id: Optional[int] = None) -> httpx.Response:
+        """Purge all data for a user from the Firefly III server.
+
+        Args:
+            user_id (Optional[int]): ID of the user to purge. Defaults to current authenticated user.
+
+        Returns:
+            httpx.Response: The HTTP response from the Firefly API.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        params = {"user": user_id} if user_id is not None else None
+        response = await self._request("DELETE", f"{self._api_url}/data/purge", params=params)
+        response.raise_for_status()
+        self._invalidateReferences(persisted=True)
+        self._clearDefaultStore()
+        return response
+
+    async def createTransaction(self, transaction: data.BaseTransaction) -> httpx.Response:
+        """Create a single transaction on the Firefly III server.
+
+        Args:
+            transaction (data.BaseTransaction): The transaction to create.
+
+        Returns:
+            httpx.Response: The HTTP response from the Firefly API.
+
+        Raises:
+            FireflyApiError: If the API returns an error (422 status) and duplicate handling
+                is not set to IGNORE.
+            httpx.HTTPStatusError: If the HTTP request fails with a non-422 status code.
+        """
+        logger.debug(f"Creating transaction: {transaction.description} (amount: {transaction.amount})")
+        payload = self._payloadFactory.toPayload(transaction)
+        attempts: List[Optional[int]] = []
+        response = await self._request("POST", f"{self._api_url}/transactions", attempts, json=payload)
+        if response.status_code == 422:
+            self._handleUnprocessable(self._responseBody(response), self._repeatedAfterFailure(attempts))
+            return response
+        response.raise_for_status()
+        # Firefly III creates missing expense and revenue accounts named by the transaction
+        self._invalidateReferences(ReferenceKind.ACCOUNTS)
+        return response
+
+    async def buildDuplicateIndex(
+        self, transactions: Iterable[data.BaseTransaction], prefetch: int = 4
+    ) -> DuplicateIndex:
+        """Fetch the existing transactions of an import once and index them.
+
+        Args:
+            transactions (Iterable[data.BaseTransaction]): Transactions of the import.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 4.
+
+        Returns:
+            DuplicateIndex: Index of the existing transactions.
+
+        Raises:
+            httpx.HTTPStatusError: If an HTTP request fails.
+        """
+        transactions = list(transactions)
+        dateRange = DuplicateIndex.dateRange(transactions)
+        if dateRange is None:
+            return DuplicateIndex()
+
+        accounts = {accountNames(transaction) for transaction in transactions}
+        start, end = dateRange
+        duplicateIndex = DuplicateIndex()
+        async for transaction in self.iterTransactions(limit=500, start=start, end=end, prefetch=prefetch):
+            if accountNames(transaction) in accounts:
+                duplicateIndex.add(transaction)
+        logger.info(f"Indexed {len(duplicateIndex)} existing transactions between {start} and {end}")
+        return duplicateIndex
+
+    async def ruleGroupScope(self, transactions: Iterable[data.BaseTransaction]) -> RuleGroupScope:
+        """Limit the application of rule groups to the range and accounts of transferred transactions.
+
+        See `FireflyInterface.ruleGroupScope`.
+
+        Args:
+            transactions (Iterable[data.BaseTransaction]): Transferred transactions.
+
+        Returns:
+            RuleGroupScope: Dates and asset account IDs of the transactions, unlimited if there are none.
+
+        Raises:
+            httpx.HTTPStatusError: If loading the accounts fails.
+        """
+        transactions = list(transactions)
+        dateRange = DuplicateIndex.dateRange(transactions)
+        if dateRange is None:
+            return RuleGroupScope()
+        ids, names = self._scopeAccounts(transactions)
+        try:
+            for name in names:
+                ids.add(str(await self._resolveReference(ReferenceKind.ACCOUNTS, name)))
+        except ValueError as e:
+            logger.warning(f"Not limiting rule groups to accounts: {e}")
+            return RuleGroupScope(*dateRange)
+        return RuleGroupScope(*dateRange, sorted(ids) if ids else None)
+
+    async def createTransactions(
+        self,
+        transactions: Iterable[data.BaseTransaction],
+        workers: int = 1,
+        batchSize: Optional[int] = None,
+        grouping: TransactionGrouping | str = TransactionGrouping.NONE,
+        maxSplits: int = 10,
+        preflight: bool = False,
+        pipeline: Optional[PayloadPipeline] = None,
+        dryRun: bool = False,
+        onResult: Optional[Callable[[TransactionResult], None]] = None,
+    ) -> AsyncIterator[TransactionResult]:
+        """Create transactions on the Firefly III server and report a result per transaction.
+
+        Runs up to `workers` requests at once and yields one result per transaction in
+        the order of the input, with the same semantics as
+        `FireflyInterface.createTransactions`.
+
+        Args:
+            transactions (Iterable[data.BaseTransaction]): Transactions to create.
+            workers (int): Number of concurrent requests. Defaults to 1.
+            batchSize (Optional[int]): Number of requests submitted ahead of the results.
+                Defaults to twice the number of workers.
+            grouping (TransactionGrouping | str): Which transactions to pack into one group.
+                Defaults to TransactionGrouping.NONE.
+            maxSplits (int): Maximum number of splits per group. Defaults to 10.
+            preflight (bool): Skip transactions existing on the server before posting. Defaults to False.
+            pipeline (Optional[PayloadPipeline]): Stage building the payloads ahead of time.
+                Defaults to None (built when posted, without validation).
+            dryRun (bool): Build and validate the payloads without posting them. Defaults to False.
+            onResult (Optional[Callable[[TransactionResult], None]]): Called with the result of each
+                transaction as soon as it completes, before it is yielded in input order. Defaults to None.
+
+        Yields:
+            TransactionResult: Result of each transaction, in input order.
+
+        Raises:
+            ValueError: If workers, batchSize or maxSplits is smaller than 1, or a dry run is combined
+                with the pre-flight check.
+            httpx.HTTPStatusError: If fetching the existing transactions for the pre-flight check fails.
+        """
+        batchSize = 2 * workers if batchSize is None else batchSize
+        if workers < 1:
+            raise ValueError(f"Number of workers must be at least 1, got {workers}")
+        if batchSize < 1:
+            raise ValueError(f"Batch size must be at least 1, got {batchSize}")
+        if dryRun and preflight:
+            raise ValueError("A dry run cannot check for existing transactions on the server")
+
+        duplicateIndex = None
+        if preflight:
+            transactions = list(transactions)
+            duplicateIndex = await self.buildDuplicateIndex(transactions, prefetch=workers)
+        groups, rejected = self._planGroups(transactions, grouping, maxSplits, duplicateIndex)
+        payloads, invalid = self._preparePayloads(groups, PayloadPipeline() if dryRun and pipeline is None else pipeline)
+        rejected = rejected + invalid
+        if dryRun:
+            for result in self._notifyResults(onResult, self._plannedResults(payloads, rejected)):
+                yield result
+            return
+
+        semaphore = asyncio.Semaphore(workers)
+
+        async def createGroup(indices: List[int], payload: Dict[str, Any]) -> List[TransactionResult]:
+            async with semaphore:
+                return self._notifyResults(onResult, await self._createGroupResults(indices, payload))
+
+        completed: Dict[int, TransactionResult] = {}
+        released, nextIndex = self._orderResults(completed, 0, self._notifyResults(onResult, rejected))
+        for result in released:
+            yield result
+        pending: Deque[asyncio.Task[List[TransactionResult]]] = collections.deque()
+        try:
+            for indices, payload in payloads:
+                pending.append(asyncio.create_task(createGroup(indices, payload)))
+                if len(pending) >= batchSize:
+                    released, nextIndex = self._orderResults(completed, nextIndex, await pending.popleft())
+                    for result in released:
+                        yield result
+            while pending:
+                released, nextIndex = self._orderResults(completed, nextIndex, await pending.popleft())
+                for result in released:
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _createGroupResults(self, indices: List[int], payload: Dict[str, Any]) -> List[TransactionResult]:
+        """Post a transaction group until every split is created or rejected.
+
+        Args:
+            indices (List[int]): Input positions of the splits, in split order.
+            payload (Dict[str, Any]): Payload of the transaction group.
+
+        Returns:
+            List[TransactionResult]: Result of each transaction.
+        """
+        descriptions = {index: split["description"] for index, split in zip(indices, payload["transactions"])}
+        results: List[TransactionResult] = []
+        posted = remaining = list(indices)
+        try:
+            while remaining:
+                if remaining != posted:
+                    payload = selectSplits(payload, [posted.index(index) for index in remaining])
+                    posted = remaining
+                attempts: List[Optional[int]] = []
+                response = await self._request("POST", f"{self._api_url}/transactions", attempts, json=payload)
+                settled, remaining = self._resolveGroupResponse(
+                    remaining, response, self._repeatedAfterFailure(attempts)
+                )
+                results += settled
+        except (FireflyApiError, httpx.HTTPError) as e:
+            if isinstance(e, FireflyApiError):
+                code = e.code
+            else:
+                code = ErrorCode.TRANSPORT if isinstance(e, httpx.TransportError) else ErrorCode.UNKNOWN
+            results += [
+                TransactionResult(index, TransactionStatus.FAILED, reason=str(e), code=code) for index in remaining
+            ]
+        if any(result.status == TransactionStatus.CREATED for result in results):
+            # Firefly III creates missing expense and revenue accounts named by the transactions
+            self._invalidateReferences(ReferenceKind.ACCOUNTS)
+        for result in results:
+            if result.status == TransactionStatus.FAILED:
+                logger.warning(f"Transaction {result.index} ({descriptions[result.index]}) failed: {result.reason}")
+        return results
+
+    async def getTransactions(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        type: Optional[str] = None,
+    ) -> List[data.GetTransaction]:
+        """Retrieve the list of transactions from the Firefly III server.
+
+        Args:
+            limit (Optional[int]): Number of items per page. Defaults to None.
+            page (Optional[int]): Page number for pagination. Defaults to None.
+            start (Optional[str]): Start date (YYYY-MM-DD format). Defaults to None.
+            end (Optional[str]): End date (YYYY-MM-DD format). Defaults to None.
+            type (Optional[str]): Filter by transaction type (withdrawal, deposit, etc.). Defaults to None.
+
+        Returns:
+            List[data.GetTransaction]: List of transaction objects with their attributes and metadata.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        params = self._payloadFactory.getTransactions(limit, page, start, end, type)
+        response = await self._request("GET", f"{self._api_url}/transactions", params=params)
+        response.raise_for_status()
+        return self._parseTransactions(response.json())
+
+    async def getRules(self, limit: int = 100, page: int = 1) -> List[data.GetRule]:
+        """Retrieve the list of rules from the Firefly III server.
+
+        Args:
+            limit (int): Number of items per page. Defaults to 100.
+            page (int): Page number for pagination. Defaults to 1.
+
+        Returns:
+            List[data.GetRule]: List of rule objects with their attributes and metadata.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        params = self._payloadFactory.getRules(limit, page)
+        response = await self._request("GET", f"{self._api_url}/rules", params=params)
+        response.raise_for_status()
+        return self._parseRules(response.json())
+
+    async def getRuleGroups(self, limit: int = 100, page: int = 1) -> List[data.GetRuleGroup]:
+        """Retrieve the list of rule groups from the Firefly III server.
+
+        Args:
+            limit (int): Number of items per page. Defaults to 100.
+            page (int): Page number for pagination. Defaults to 1.
+
+        Returns:
+            List[data.GetRuleGroup]: List of rule group objects with their attributes and metadata.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        params = self._payloadFactory.getRuleGroups(limit, page)
+        response = await self._request("GET", f"{self._api_url}/rule-groups", params=params)
+        response.raise_for_status()
+        return self._parseRuleGroups(response.json())
+
+    async def createRule(self, rule: data.PostRule) -> httpx.Response:
+        """Create a new rule on the Firefly III server.
+
+        Args:
+            rule (data.PostRule): The rule object to create.
+
+        Returns:
+            httpx.Response: The HTTP response from the Firefly API.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        logger.info(f"Creating rule: {rule.title}")
+        payload = self._payloadFactory.toPayload(rule)
+        response = await self._request("POST", f"{self._api_url}/rules", json=payload)
+        response.raise_for_status()
+        self._recordCreated(ReferenceKind.RULES, rule.title, self._responseBody(response))
+        logger.debug(f"Rule {rule.title} created successfully (status: {response.status_code})")
+        return response
+
+    async def deleteRule(self, rule_id: int) -> httpx.Response:
+        """Delete a rule on the Firefly III server.
+
+        Args:
+            rule_id (int): The Firefly rule ID to delete.
+
+        Returns:
+            httpx.Response: The HTTP response from the Firefly API.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        logger.info(f"Deleting rule: {rule_id}")
+        response = await self._request("DELETE", f"{self._api_url}/rules/{rule_id}")
+        response.raise_for_status()
+        self._recordDeleted(ReferenceKind.RULES, rule_id)
+        logger.debug(f"Rule {rule_id} deleted successfully")
+        return response
+
+    async def deleteRules(self, rule_ids: Optional[List[int]] = None, workers: int = 10) -> BulkDeleteResult:
+        """Delete one or more rules from the Firefly III server.
+
+        Args:
+            rule_ids (Optional[List[int]]): List of Firefly rule IDs to delete.
+                If None, all rules on the server will be fetched and deleted.
+                Defaults to None.
+            workers (int): Number of concurrent deletion requests. Defaults to 10.
+
+        Returns:
+            BulkDeleteResult: Deleted rules and the error of each failed deletion.
+
+        Raises:
+            ValueError: If workers is smaller than 1.
+            httpx.HTTPStatusError: If fetching the rules fails.
+        """
+        if rule_ids is None:
+            logger.info("No rule IDs provided, fetching all rules for deletion")
+            rule_ids = [rule.id async for rule in self.iterRules()]
+
+        return await self._deleteConcurrently("rules", rule_ids, self.deleteRule, workers)
+
+    async def createRuleGroup(self, rule_group: data.PostRuleGroup) -> httpx.Response:
+        """Create a new rule group on the Firefly III server.
+
+        Args:
+            rule_group (data.PostRuleGroup): The rule group object to create.
+
+        Returns:
+            httpx.Response: The HTTP response from the Firefly API.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        logger.info(f"Creating rule group: {rule_group.title}")
+        payload = self._payloadFactory.toPayload(rule_group)
+        response = await self._request("POST", f"{self._api_url}/rule-groups", json=payload)
+        response.raise_for_status()
+        self._recordCreated(ReferenceKind.RULE_GROUPS, rule_group.title, self._responseBody(response))
+        logger.debug(f"Rule group {rule_group.title} created successfully (status: {response.status_code})")
+        return response
+
+    async def applyRuleGroup(
+        self,
+        rule_group_id: Union[int, str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        accounts: Optional[List[str]] = None,
+    ) -> httpx.Response:
+        """Trigger/apply a rule group to existing transactions on the Firefly III server.
+
+        Args:
+            rule_group_id (Union[int, str]): The Firefly rule group ID or title to trigger.
+            start_date (Optional[str]): Start date for transactions to apply rules to (YYYY-MM-DD format). Defaults to None.
+            end_date (Optional[str]): End date for transactions to apply rules to (YYYY-MM-DD format). Defaults to None.
+            accounts (Optional[List[str]]): Array of account IDs to limit rule application to. Defaults to None.
+
+        Returns:
+            httpx.Response: The HTTP response from the Firefly API.
+
+        Raises:
+            ValueError: If rule_group_id is a title and no matching rule group is found or multiple matches exist.
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        payload = self._payloadFactory.postApplyRuleGroup(start_date, end_date, accounts)
+
+        async def trigger(id: Union[int, str]) -> httpx.Response:
+            logger.info(f"Triggering rule group: {id}")
+            return await self._request("POST", f"{self._api_url}/rule-groups/{id}/trigger", json=payload)
+
+        rule_group_id, response = await self._sendResolved(ReferenceKind.RULE_GROUPS, rule_group_id, trigger)
+        response.raise_for_status()
+        logger.debug(f"Rule group {rule_group_id} triggered successfully (status: {response.status_code})")
+        return response
+
+    async def deleteRuleGroup(self, rule_group_id: Union[int, str]) -> httpx.Response:
+        """Delete a rule group on the Firefly III server.
+
+        Args:
+            rule_group_id (Union[int, str]): The Firefly rule group ID or title to delete.
+
+        Returns:
+            httpx.Response: The HTTP response from the Firefly API.
+
+        Raises:
+            ValueError: If rule_group_id is a title and no matching rule group is found or multiple matches exist.
+            httpx.HTTPStatusError: If the HTTP request fails.
+        """
+        async def delete(id: Union[int, str]) -> httpx.Response:
+            logger.info(f"Deleting rule group: {id}")
+            return await self._request("DELETE", f"{self._api_url}/rule-groups/{id}")
+
+        rule_group_id, response = await self._sendResolved(ReferenceKind.RULE_GROUPS, rule_group_id, delete)
+        response.raise_for_status()
+        self._recordDeleted(ReferenceKind.RULE_GROUPS, rule_group_id)
+        logger.debug(f"Rule group {rule_group_id} deleted successfully")
+        return response
+
+    async def deleteRuleGroups(
+        self, rule_group_ids: Optional[Union[List[int], List[str]]] = None, workers: int = 10
+    ) -> BulkDeleteResult:
+        """Delete one or more rule groups from the Firefly III server.
+
+        Args:
+            rule_group_ids (Optional[Union[List[int], List[str]]]): List of Firefly rule group IDs or titles to delete.
+                If None, all rule groups on the server will be fetched and deleted.
+                Defaults to None.
+            workers (int): Number of concurrent deletion requests. Defaults to 10.
+
+        Returns:
+            BulkDeleteResult: Deleted rule groups and the error of each failed deletion.
+
+        Raises:
+            ValueError: If workers is smaller than 1.
+            httpx.HTTPStatusError: If fetching the rule groups fails.
+        """
+        if rule_group_ids is None:
+            logger.info("No rule group IDs provided, fetching all rule groups for deletion")
+            rule_group_ids = [rule_group.id async for rule_group in self.iterRuleGroups()]
+
+        return await self._deleteConcurrently("rule groups", rule_group_ids, self.deleteRuleGroup, workers)
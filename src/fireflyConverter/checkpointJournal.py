@@ -0,0 +1,198 @@
+import collections
+import dataclasses as dc
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from fireflyConverter import data
+from fireflyConverter.fireflyInterface import TransactionResult, TransactionStatus
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of a previous run that are not repeated on resume
+COMPLETED_STATUSES: Tuple[TransactionStatus, ...] = (TransactionStatus.CREATED, TransactionStatus.DUPLICATE)
+
+# Creates transactions, passing each result to a completion callback, and yields the results in input order
+CreateTransactions = Callable[
+    [List[data.BaseTransaction], Callable[[TransactionResult], None]], Iterable[TransactionResult]
+]
+
+
+def transactionFingerprint(transaction: data.BaseTransaction) -> str:
+    """Compute a stable fingerprint of the content of a transaction.
+
+    The fingerprint is the SHA-256 hash of all fields of the transaction, so it only
+    changes if the row itself changes, not with its position in the input.
+
+    Args:
+        transaction (data.BaseTransaction): Transaction to fingerprint.
+
+    Returns:
+        str: Hexadecimal fingerprint.
+    """
+    content = json.dumps(
+        [type(transaction).__name__, dc.asdict(transaction)], sort_keys=True, default=str, separators=(",", ":")
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def transactionFingerprints(transactions: Iterable[data.BaseTransaction]) -> List[str]:
+    """Compute the fingerprints of the transactions of an input.
+
+    Identical rows, e.g. two equal purchases on the same day, are told apart by the
+    number of their occurrence, which is appended to the content fingerprint.
+
+    Args:
+        transactions (Iterable[data.BaseTransaction]): Transactions of the input.
+
+    Returns:
+        List[str]: Fingerprint of each transaction, in input order.
+    """
+    occurrences: Dict[str, int] = collections.Counter()
+    fingerprints = []
+    for transaction in transactions:
+        fingerprint = transactionFingerprint(transaction)
+        fingerprints.append(f"{fingerprint}:{occurrences[fingerprint]}")
+        occurrences[fingerprint] += 1
+    return fingerprints
+
+
+class CheckpointJournal:
+    """On-disk journal of the outcome of each transaction of a transfer.
+
+    Outcomes are stored in a SQLite database keyed by the transaction fingerprint and
+    committed as soon as they are recorded, so an interrupted transfer can be resumed
+    without posting the completed rows again. The database uses write-ahead logging,
+    which keeps a commit per row cheap. Outcomes may be recorded from worker threads.
+
+    Attributes:
+        _path (str): Path of the database file.
+        _connection (sqlite3.Connection): Connection to the database.
+        _lock (threading.Lock): Lock serializing the use of the connection.
+        _clock (Callable[[], float]): Wall clock in seconds since the epoch.
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        """Open the journal, creating the database if it does not exist.
+
+        Args:
+            path (str): Path of the database file.
+            clock (Callable[[], float]): Wall clock in seconds since the epoch. Defaults to time.time.
+        """
+        self._path = path
+        self._clock = clock
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS outcomes ("
+            "fingerprint TEXT PRIMARY KEY, status TEXT NOT NULL, id TEXT, reason TEXT, recorded REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def __enter__(self) -> "CheckpointJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM outcomes").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        self._connection.close()
+
+    def record(self, fingerprint: str, result: TransactionResult) -> None:
+        """Record the outcome of a transaction, replacing an earlier outcome.
+
+        Args:
+            fingerprint (str): Fingerprint of the transaction.
+            result (TransactionResult): Outcome of the transaction.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO outcomes (fingerprint, status, id, reason, recorded) VALUES (?, ?, ?, ?, ?)",
+                (fingerprint, result.status.value, result.id, result.reason, self._clock()),
+            )
+            self._connection.commit()
+
+    def completed(self, fingerprints: Iterable[str]) -> Dict[str, Tuple[TransactionStatus, Optional[str]]]:
+        """Look up the transactions completed by previous runs.
+
+        Args:
+            fingerprints (Iterable[str]): Fingerprints of the transactions to look up.
+
+        Returns:
+            Dict[str, Tuple[TransactionStatus, Optional[str]]]: Status and Firefly III ID of
+                each completed transaction by fingerprint.
+        """
+        wanted = set(fingerprints)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT fingerprint, status, id FROM outcomes WHERE status IN (?, ?)",
+                tuple(status.value for status in COMPLETED_STATUSES),
+            ).fetchall()
+        return {
+            fingerprint: (TransactionStatus(status), id) for fingerprint, status, id in rows if fingerprint in wanted
+        }
+
+    def run(
+        self,
+        transactions: List[data.BaseTransaction],
+        create: CreateTransactions,
+        resume: bool = False,
+    ) -> Iterator[TransactionResult]:
+        """Create transactions and record the outcome of each one as it completes.
+
+        Outcomes are recorded by the completion callback passed to `create`, so rows that
+        completed while waiting for an earlier row to be yielded are already journaled if
+        the run is interrupted. Results that were not passed to the callback are recorded
+        before they are yielded.
+
+        On resume, transactions completed by a previous run are reported as skipped
+        without being passed to `create`, so the server is not contacted for them.
+
+        Args:
+            transactions (List[data.BaseTransaction]): Transactions to create.
+            create (CreateTransactions): Creates transactions, calls the completion callback with
+                each result as soon as it completes and yields the results in input order, e.g.
+                `FireflyInterface.createTransactions` with the callback passed as `onResult`.
+            resume (bool): Skip the transactions completed by a previous run. Defaults to False.
+
+        Yields:
+            TransactionResult: Result of each transaction, in input order.
+        """
+        fingerprints = transactionFingerprints(transactions)
+        completed = self.completed(fingerprints) if resume else {}
+        if completed:
+            logger.info(f"Skipping {len(completed)} transactions completed by a previous run")
+
+        pending = [index for index, fingerprint in enumerate(fingerprints) if fingerprint not in completed]
+        recorded: Set[int] = set()
+
+        def recordCompleted(result: TransactionResult) -> None:
+            index = pending[result.index]
+            self.record(fingerprints[index], dc.replace(result, index=index))
+            recorded.add(index)
+
+        results = iter(create([transactions[index] for index in pending], recordCompleted))
+        for index, fingerprint in enumerate(fingerprints):
+            if fingerprint in completed:
+                _, id = completed[fingerprint]
+                yield TransactionResult(index, TransactionStatus.SKIPPED, id=id, reason="Completed by a previous run")
+                continue
+            result = dc.replace(next(results), index=index)
+            if index not in recorded:
+                self.record(fingerprint, result)
+            yield result
@@ -1,13 +1,20 @@
+import contextlib
 import enum
 import logging
 from argparse import ArgumentParser, Namespace, _SubParsersAction
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Iterable, List, Optional
 
 import toml
 
 from fireflyConverter import convertData as cdt
+from fireflyConverter import data
 from fireflyConverter import fireflyInterface as ffi
 from fireflyConverter import loadData as ldb
+from fireflyConverter.checkpointJournal import CheckpointJournal
+from fireflyConverter.fireflyPayload import TransactionGrouping
+from fireflyConverter.payloadPipeline import PayloadPipeline
+from fireflyConverter.referenceCache import defaultStorePath
+from fireflyConverter.runReport import RunRecorder
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +67,12 @@ def defineTransferParser(subparsers: _SubParsersAction):
         help="Optional data query to filter transactions before transfer.",
         default=None,
     )
+    parser.add_argument(
+        "--timezone",
+        type=str,
+        help="IANA timezone of dates without UTC offset in the input data, e.g. 'Europe/Berlin'. Defaults to the timezone of the server.",
+        default=None,
+    )
     parser.add_argument(
         "--apply_rule_groups",
         type=str,
@@ -67,6 +80,84 @@ def defineTransferParser(subparsers: _SubParsersAction):
         help="List of rule group titles to apply after transferring transactions.",
         default=None,
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of transactions posted concurrently to Firefly III.",
+        default=1,
+    )
+    parser.add_argument(
+        "--grouping",
+        type=str,
+        choices=[grouping.value for grouping in TransactionGrouping],
+        help="Pack related transactions as splits into one transaction group per request.",
+        default=TransactionGrouping.NONE.value,
+    )
+    parser.add_argument(
+        "--max_splits",
+        type=int,
+        help="Maximum number of splits per transaction group.",
+        default=10,
+    )
+    parser.add_argument(
+        "--preflight",
+        action="store_true",
+        help="Fetch existing transactions once and skip duplicates before posting.",
+    )
+    parser.add_argument(
+        "--reference_cache",
+        type=str,
+        nargs="?",
+        const=str(defaultStorePath()),
+        help=(
+            "Persist the IDs of accounts, rules, rule groups and currencies between runs in this file. "
+            f"Without a path, '{defaultStorePath()}' is used."
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        help="Path of a journal recording the outcome of each transaction as it completes.",
+        default=None,
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip transactions completed according to the checkpoint journal without contacting the server.",
+    )
+    parser.add_argument(
+        "--dry_run",
+        action="store_true",
+        help="Build and validate the request payloads without sending them to the server.",
+    )
+    parser.add_argument(
+        "--payload_file",
+        type=str,
+        help="Path of a JSON Lines file the request payloads are written to before posting.",
+        default=None,
+    )
+    parser.add_argument(
+        "--payload_processes",
+        type=int,
+        help="Number of processes building and validating the request payloads before posting.",
+        default=0,
+    )
+    parser.add_argument(
+        "--full_rule_run",
+        action="store_true",
+        help="Apply the rule groups to all transactions instead of the dates and accounts of the transfer.",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adapt the number of concurrent requests between 1 and --workers to the latency and errors of the server.",
+    )
+    parser.add_argument(
+        "--report",
+        type=str,
+        help="Path of a JSON report of the run with throughput, latencies and outcomes, '-' for standard output.",
+        default=None,
+    )
 
 
 def defineConvertParser(subparsers: _SubParsersAction):
@@ -108,6 +199,12 @@ def defineConvertParser(subparsers: _SubParsersAction):
         help="Optional data query to filter transactions before conversion.",
         default=None,
     )
+    parser.add_argument(
+        "--timezone",
+        type=str,
+        help="IANA timezone of dates without UTC offset in the input data, e.g. 'Europe/Berlin'. Defaults to the timezone of the server.",
+        default=None,
+    )
 
 
 PARSER_DEFINITIONS: List[Callable[[_SubParsersAction], None]] = [
@@ -125,7 +222,9 @@ def convert(arguments: Namespace):
     logger.info(f"Starting convert command for source: {arguments.source}")
     logger.debug(f"Input file: {arguments.input_file}")
 
-    loader = ldb.loaderMapping[arguments.source](arguments.input_file, accountName=arguments.account_name)
+    loader = ldb.loaderMapping[arguments.source](
+        arguments.input_file, accountName=arguments.account_name, timezone=arguments.timezone
+    )
     logger.info(f"Loading transactions from {arguments.source}")
     transactions = loader.load()
     logger.info(f"Loaded {len(transactions)} transactions")
@@ -148,51 +247,140 @@ def transfer(arguments: Namespace):
 
     Args:
         arguments (Namespace): Parsed CLI arguments.
+
+    Raises:
+        ValueError: If the arguments or the configuration are invalid.
+        RuntimeError: If any transaction failed to transfer. Rule groups are not applied then.
     """
     logger.info(f"Starting transfer command for source: {arguments.source}")
+    if arguments.resume and arguments.checkpoint is None:
+        raise ValueError("--resume requires a --checkpoint journal")
+    if arguments.dry_run and arguments.checkpoint is not None:
+        raise ValueError("--dry_run cannot record outcomes in a --checkpoint journal")
+    recorder = RunRecorder()
 
     inputName = arguments.source if arguments.input_name is None else arguments.input_name
     accountName = arguments.source if arguments.account_name is None else arguments.account_name
     inputFile = f"{arguments.input_directory}/{inputName}"
     logger.debug(f"Input file: {inputFile}, Account: {accountName}")
 
-    loader = ldb.loaderMapping[arguments.source](inputFile, accountName=accountName)
+    loader = ldb.loaderMapping[arguments.source](inputFile, accountName=accountName, timezone=arguments.timezone)
     logger.info(f"Loading transactions from {inputFile}")
-    transactions = loader.load()
+    with recorder.stage("load"):
+        transactions = loader.load()
     logger.info(f"Loaded {len(transactions)} transactions")
 
     logger.info(f"Loading Firefly interface configuration from {arguments.config_path}")
     config = toml.load(arguments.config_path)
     if "firefly_interface" not in config:
         raise ValueError("Configuration file must contain a [firefly_interface] section")
-    interface = ffi.FireflyInterface(**config["firefly_interface"])
+    interfaceConfig = dict(config["firefly_interface"])
+    if arguments.reference_cache:
+        interfaceConfig["cache_file"] = arguments.reference_cache
+    if arguments.adaptive:
+        interfaceConfig["adaptive_concurrency"] = arguments.workers
+    interface = ffi.FireflyInterface(**interfaceConfig)
+    interface.recorder = recorder
     logger.debug("Firefly interface initialized successfully")
 
     if arguments.filter_query:
         logger.info(f"Applying filter query: {arguments.filter_query}")
-        transactions = cdt.ConvertData(transactions).filterByQuery(arguments.filter_query).transactions
+        with recorder.stage("filter"):
+            transactions = cdt.ConvertData(transactions).filterByQuery(arguments.filter_query).transactions
         logger.info(f"After filtering: {len(transactions)} transactions remain")
 
     logger.info(f"Transferring {len(transactions)} transactions to Firefly III")
-    processed_count = 0
-    for transaction in transactions:
-        response = interface.createTransaction(transaction)
-        processed_count += 1
-        if response.status_code == 200:
-            logger.debug(f"Transaction {processed_count}/{len(transactions)} created successfully (status: {response.status_code})")
+    statusCounts = {status: 0 for status in ffi.TransactionStatus}
+    transferred: List[data.BaseTransaction] = []
+    pipeline = None
+    if arguments.dry_run or arguments.payload_file is not None or arguments.payload_processes > 0:
+        pipeline = PayloadPipeline(processes=arguments.payload_processes, payloadFile=arguments.payload_file)
+
+    def create(
+        pending: List[data.BaseTransaction], onResult: Optional[Callable[[ffi.TransactionResult], None]] = None
+    ) -> Iterable[ffi.TransactionResult]:
+        return interface.createTransactions(
+            pending,
+            workers=arguments.workers,
+            grouping=arguments.grouping,
+            maxSplits=arguments.max_splits,
+            preflight=arguments.preflight,
+            pipeline=pipeline,
+            dryRun=arguments.dry_run,
+            onResult=onResult,
+        )
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(recorder.stage("transfer"))
+        if arguments.checkpoint is None:
+            results = create(transactions)
         else:
-            logger.info(f"Transaction {processed_count}/{len(transactions)} processed with status: {response.status_code}")
-
-    logger.info(f"Transfer command completed successfully. Processed {processed_count} transactions")
-
-    if arguments.apply_rule_groups:
+            logger.info(f"Recording outcomes in checkpoint journal {arguments.checkpoint}")
+            journal = stack.enter_context(CheckpointJournal(arguments.checkpoint))
+            results = journal.run(transactions, create, resume=arguments.resume)
+        for result in results:
+            statusCounts[result.status] += 1
+            recorder.recordOutcome(result.status.value)
+            if result.status in (ffi.TransactionStatus.CREATED, ffi.TransactionStatus.SKIPPED):
+                transferred.append(transactions[result.index])
+            position = f"{result.index + 1}/{len(transactions)}"
+            if result.status == ffi.TransactionStatus.CREATED:
+                logger.debug(f"Transaction {position} created successfully (id: {result.id})")
+            elif result.status == ffi.TransactionStatus.DUPLICATE:
+                logger.info(f"Transaction {position} skipped as duplicate")
+            elif result.status == ffi.TransactionStatus.SKIPPED:
+                logger.debug(f"Transaction {position} completed by a previous run (id: {result.id})")
+            elif result.status == ffi.TransactionStatus.PLANNED:
+                logger.debug(f"Transaction {position} would be posted")
+            else:
+                logger.error(f"Transaction {position} failed: {result.reason}")
+
+    summary = ", ".join(f"{count} {status.value}" for status, count in statusCounts.items())
+    logger.info(f"Transfer command completed. Processed {len(transactions)} transactions: {summary}")
+    limiter = interface.concurrencyLimiter
+    if limiter is not None:
+        logger.info(f"Adaptive concurrency settled at {limiter.limit} requests (peak {limiter.peak})")
+        recorder.recordGauge("concurrency_limit", limiter.limit)
+        recorder.recordGauge("concurrency_peak", limiter.peak)
+
+    failed = statusCounts[ffi.TransactionStatus.FAILED]
+    if arguments.apply_rule_groups and arguments.dry_run:
+        logger.info("Dry run, not applying rule groups")
+    elif arguments.apply_rule_groups and failed:
+        logger.warning(f"{failed} transactions failed, not applying rule groups")
+    elif arguments.apply_rule_groups and not transferred and not arguments.full_rule_run:
+        logger.info("No transactions transferred, not applying rule groups")
+    elif arguments.apply_rule_groups:
         logger.info(f"Applying rule groups: {arguments.apply_rule_groups}")
-        for rule_group_title in arguments.apply_rule_groups:
-            response = interface.applyRuleGroup(rule_group_title)
-            if response.status_code == 204:
-                logger.info(f"Rule group '{rule_group_title}' applied successfully.")
+        with recorder.stage("apply_rule_groups"):
+            if arguments.full_rule_run:
+                scope = ffi.RuleGroupScope()
             else:
-                logger.warning(f"Failed to apply rule group '{rule_group_title}'. Status code: {response.status_code}")
+                scope = interface.ruleGroupScope(transferred)
+                accounts = ", ".join(scope.accounts) if scope.accounts else "all"
+                logger.info(f"Limiting rule groups to {scope.start_date} - {scope.end_date}, accounts: {accounts}")
+            for rule_group_title in arguments.apply_rule_groups:
+                response = interface.applyRuleGroup(rule_group_title, scope.start_date, scope.end_date, scope.accounts)
+                if response.status_code == 204:
+                    logger.info(f"Rule group '{rule_group_title}' applied successfully.")
+                else:
+                    logger.warning(
+                        f"Failed to apply rule group '{rule_group_title}'. Status code: {response.status_code}"
+                    )
+        cache = interface.referenceCache
+        logger.debug(f"Resolved rule group titles with {cache.hits} cache hits and {cache.misses} misses")
+
+    report = recorder.report()
+    posts = report["latency"].get("POST", {})
+    logger.info(
+        f"Sent {report['requests']['total']} requests ({report['requests']['per_second']:.1f}/s, "
+        f"{report['requests']['retried']} retried), POST latency p50 {posts.get('p50_ms', 0.0):.0f} ms, "
+        f"p95 {posts.get('p95_ms', 0.0):.0f} ms"
+    )
+    if arguments.report is not None:
+        recorder.write(arguments.report)
+    if failed:
+        raise RuntimeError(f"{failed} of {len(transactions)} transactions failed to transfer")
 
 
 COMMAND_EXECUTION: Dict[CommandType, Callable[[Namespace], None]] = {
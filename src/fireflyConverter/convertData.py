@@ -1,11 +1,120 @@
+import copy
+import dataclasses as dc
 import re
-import tomllib
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from fireflyConverter import data
+from fireflyConverter import queryCompiler as qc
+
+
+class QueryCache:
+    """Per-dataset cache of the transaction DataFrame and query bitmaps.
+
+    Each query is compiled (see ``queryCompiler``) and evaluated at most once per
+    dataset into a boolean mask. Masks are keyed by the query expression rather than
+    the query name, so a named query is re-evaluated when its definition changes.
+    Combinations of queries are computed by combining the cached masks instead of
+    re-evaluating the underlying expressions.
+
+    If date indexing is enabled, a sorted index over the native datetime values of
+    the ``date`` column is built on first use, and range predicates on the date
+    (e.g. ``date >= '2025-01-01' and date <= '2025-12-31'``) are resolved by binary
+    search.
+
+    Attributes:
+        _transactions (List[data.BaseTransaction]): Dataset the cache belongs to.
+        _dateIndex (bool): Whether date range predicates use a sorted index.
+        _dataframe (Optional[pd.DataFrame]): Cached DataFrame of the dataset.
+        _indexes (Optional[qc.Indexes]): Cached sorted column indexes.
+        _masks (Dict[str, np.ndarray]): Boolean masks keyed by query expression.
+        hits (int): Number of mask lookups served from the cache.
+        misses (int): Number of mask lookups that evaluated the query.
+    """
+
+    def __init__(self, transactions: List[data.BaseTransaction], dateIndex: bool = False):
+        """Create an empty cache for a dataset.
+
+        Args:
+            transactions (List[data.BaseTransaction]): Dataset the cache belongs to.
+            dateIndex (bool): Resolve date range predicates with a sorted index. Defaults to False.
+        """
+        self._transactions = transactions
+        self._dateIndex = dateIndex
+        self._dataframe: Optional[pd.DataFrame] = None
+        self._indexes: Optional[qc.Indexes] = None
+        self._masks: Dict[str, np.ndarray] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._transactions)
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """Return the DataFrame of the dataset, building it on first access.
+
+        Returns:
+            pd.DataFrame: One row per transaction.
+        """
+        if self._dataframe is None:
+            self._dataframe = ConvertData._toDataFrame(self._transactions)
+        return self._dataframe
+
+    @property
+    def indexes(self) -> qc.Indexes:
+        """Return the sorted column indexes, building them on first access.
+
+        Returns:
+            qc.Indexes: Sorted indexes keyed by column name. Empty if indexing is disabled.
+        """
+        if self._indexes is None:
+            self._indexes = {}
+            if self._dateIndex and len(self._transactions) > 0:
+                self._indexes["date"] = qc.SortedIndex.forDates(self.dataframe["date"])
+        return self._indexes
+
+    def mask(self, query: str | qc.Query) -> np.ndarray:
+        """Return the boolean mask of a query, evaluating it on a cache miss.
+
+        Args:
+            query (str | qc.Query): A pandas-compatible query expression or a compiled query.
+
+        Returns:
+            np.ndarray: Boolean mask with one entry per transaction.
+
+        Raises:
+            ValueError: If the query is invalid or fails to execute.
+        """
+        if isinstance(query, str):
+            query = qc.compileQuery(query)
+
+        mask = self._masks.get(query.expression)
+        if mask is not None:
+            self.hits += 1
+            return mask
+
+        self.misses += 1
+        try:
+            mask = query.evaluate(self.dataframe, self.indexes)
+        except Exception as e:
+            raise ValueError(f"Failed to execute query '{query.expression}': {e}")
+        mask.flags.writeable = False
+        self._masks[query.expression] = mask
+        return mask
+
+    def invalidate(self, masksOnly: bool = False) -> None:
+        """Drop cached query masks and optionally the cached DataFrame.
+
+        Args:
+            masksOnly (bool): Keep the DataFrame and only drop the masks. Defaults to False.
+        """
+        self._masks.clear()
+        if not masksOnly:
+            self._dataframe = None
+            self._indexes = None
 
 
 class ConvertData:
@@ -14,21 +123,54 @@ class ConvertData:
     Handles conversion of BaseTransaction objects by mapping transaction descriptions
     to accounts using regex patterns and supports exporting transaction data to CSV format.
 
+    In lazy mode, filters do not materialize intermediate transaction lists. Each filter
+    appends a predicate to a plan that is evaluated on first access of ``transactions``
+    (or by ``saveCsv``), where all pending predicates are fused into a single boolean
+    mask and the transactions are selected in one pass.
+
     Attributes:
         _transactions (List[data.BaseTransaction]): List of transactions to process.
         _unmappedAccountName (str): Default account name for unmapped transactions.
         _accountMap (Dict[str, str]): Mapping of account names to description regex patterns.
+        _lazy (bool): Whether filters are deferred until the transactions are consumed.
+        _plan (List[Callable[[QueryCache], np.ndarray]]): Pending filter predicates.
+        _cache (QueryCache): DataFrame and query bitmap cache of the current dataset.
+            Lazy converters derived from the same dataset share the cache.
+        _queries (Dict[str, str]): Named query expressions.
+        _compiledQueries (Dict[str, qc.Query]): Named queries compiled on load.
+        _dateIndex (bool): Whether date range predicates use a sorted date index.
     """
 
     @property
     def transactions(self) -> List[data.BaseTransaction]:
         """Return the list of transactions to be converted.
 
+        Evaluates pending lazy filters before returning the transactions.
+
         Returns:
             List[data.BaseTransaction]: Currently-loaded transactions.
         """
+        self._materialize()
         return self._transactions
 
+    @property
+    def lazy(self) -> bool:
+        """Return whether filters are evaluated lazily.
+
+        Returns:
+            bool: True if filters are deferred until the transactions are consumed.
+        """
+        return self._lazy
+
+    @property
+    def cache(self) -> QueryCache:
+        """Return the query cache of the current dataset.
+
+        Returns:
+            QueryCache: Cache of the DataFrame and query bitmaps.
+        """
+        return self._cache
+
     @property
     def queries(self) -> Dict[str, str]:
         """Return the currently-loaded query definitions.
@@ -40,21 +182,31 @@ class ConvertData:
 
     @queries.setter
     def queries(self, queries: Dict[str, str] | str) -> None:
-        """Set the query definitions.
+        """Set and compile the query definitions.
 
         Args:
-            queries (Dict[str, str] | str): Query definitions to set.
+            queries (Dict[str, str] | str): Query definitions to set, or a path to a TOML
+                file with a [queries] section.
+
+        Raises:
+            FileNotFoundError: If the configuration file does not exist.
+            ValueError: If the TOML file does not contain a [queries] section.
+            qc.QueryCompileError: If a query expression is invalid.
         """
         if isinstance(queries, str):
-            self._queries = self._loadQueryConfig(queries)
+            self._queries, self._compiledQueries = qc.loadQueryFile(queries)
         else:
             self._queries = queries
+            self._compiledQueries = qc.compileQueries(queries)
+        self._cache.invalidate(masksOnly=True)
 
     def __init__(
         self,
         data: List[data.BaseTransaction],
         accountMap: Optional[Dict[str, str]] = None,
         queries: Optional[Dict[str, str] | str] = None,
+        lazy: bool = False,
+        dateIndex: bool = False,
     ):
         """Initialize the converter with transaction data and optional account mapping.
 
@@ -65,12 +217,27 @@ class ConvertData:
                 Defaults to None (empty mapping).
             queries (Optional[Dict[str, str] | str]): Query definitions for filtering transactions.
                 Can be a dictionary of query definitions or a path to a TOML config file.
-                Defaults to None (empty queries).
+                The queries are compiled and validated on load. Defaults to None (empty queries).
+            lazy (bool): Defer filters until the transactions are consumed and fuse them
+                into a single evaluation. Defaults to False.
+            dateIndex (bool): Keep a sorted index of the transaction dates and resolve date
+                range predicates by binary search. Defaults to False.
         """
         self._transactions = data
+        self._dateIndex = dateIndex
+        self._cache = QueryCache(data, dateIndex)
         self._unmappedAccountName = ""
         self._accountMap = accountMap if accountMap is not None else {}
         self.queries = queries if queries is not None else {}
+        self._lazy = lazy
+        self._plan: List[Callable[[QueryCache], np.ndarray]] = []
+
+    def invalidateCache(self) -> None:
+        """Drop the cached DataFrame and query bitmaps of the current dataset.
+
+        Call this after modifying transaction objects in place.
+        """
+        self._cache.invalidate()
 
     def _findAccountName(self, description: str) -> str:
         """Find the account name for a transaction based on its description.
@@ -101,7 +268,7 @@ class ConvertData:
         Raises:
             ValueError: If a transaction has an unknown or invalid type.
         """
-        for transaction in self._transactions:
+        for transaction in self.transactions:
             accountName = self._findAccountName(transaction.description)
 
             if transaction.type is data.TransactionType.WITHDRAWAL.value:
@@ -110,6 +277,7 @@ class ConvertData:
                 transaction.source_name = accountName
             else:
                 raise ValueError(f"Unknown transaction type: {transaction.type}")
+        self.invalidateCache()
 
     def _convert(self) -> pd.DataFrame:
         """Convert transaction data to a pandas DataFrame.
@@ -120,21 +288,115 @@ class ConvertData:
         Returns:
             pd.DataFrame: DataFrame representation of the transactions.
         """
-        # Placeholder for conversion logic
-        # This should be replaced with actual conversion code
-        return pd.DataFrame(self._transactions)
+        return self._toDataFrame(self.transactions)
+
+    @staticmethod
+    def _toDataFrame(transactions: List[data.BaseTransaction]) -> pd.DataFrame:
+        """Build a DataFrame from a list of transactions.
+
+        An empty list yields an empty DataFrame with the BaseTransaction columns so
+        that queries on an empty selection resolve column names. Dates become a
+        timezone-aware datetime64 column, converted to UTC if the transactions use
+        different timezones.
+
+        Args:
+            transactions (List[data.BaseTransaction]): Transactions to convert.
+
+        Returns:
+            pd.DataFrame: One row per transaction.
+        """
+        if not transactions:
+            return pd.DataFrame(columns=[field.name for field in dc.fields(data.BaseTransaction)])
+        dataframe = pd.DataFrame(transactions)
+        if dataframe["date"].dtype == object:
+            dataframe["date"] = pd.to_datetime(dataframe["date"], utc=True)
+        return dataframe
+
+    def _evaluatePlan(self) -> List[data.BaseTransaction]:
+        """Evaluate all pending predicates and select the matching transactions.
+
+        The predicates are evaluated against the query cache of the source transactions
+        and combined into one mask, so the transaction list is materialized once
+        regardless of the number of chained filters.
+
+        Returns:
+            List[data.BaseTransaction]: Copies of the transactions matching all predicates.
+        """
+        mask = np.ones(len(self._transactions), dtype=bool)
+        for predicate in self._plan:
+            mask &= predicate(self._cache)
+        return [copy.copy(transaction) for transaction, keep in zip(self._transactions, mask) if keep]
+
+    def _materialize(self) -> None:
+        """Evaluate the pending plan and replace the transactions by its result."""
+        if self._plan:
+            self._transactions = self._evaluatePlan()
+            self._cache = QueryCache(self._transactions, self._dateIndex)
+            self._plan = []
+
+    def _filter(self, predicate: Callable[[QueryCache], np.ndarray]) -> "ConvertData":
+        """Create a converter restricted to the transactions matching a predicate.
+
+        In lazy mode the predicate is appended to the plan of the new converter and
+        evaluated later. Otherwise it is evaluated immediately.
+
+        Args:
+            predicate (Callable[[QueryCache], np.ndarray]): Maps the query cache of a
+                dataset to a boolean mask.
+
+        Returns:
+            ConvertData: New ConvertData instance with the predicate applied.
+        """
+        transactions = self._transactions if self._lazy else self.transactions
+        converter = ConvertData(
+            transactions,
+            self._accountMap,
+            lazy=self._lazy,
+            dateIndex=self._dateIndex,
+        )
+        # Share the compiled queries and the cache of the dataset the predicate refers to
+        converter._queries = self._queries
+        converter._compiledQueries = self._compiledQueries
+        converter._cache = self._cache
+        converter._plan = [*self._plan, predicate]
+        if not self._lazy:
+            converter._materialize()
+        return converter
+
+    def _resolveNamedQuery(self, queryName: str) -> qc.Query:
+        """Return the compiled query of a named query.
+
+        Args:
+            queryName (str): Name of the query as defined in the TOML configuration.
+
+        Returns:
+            qc.Query: The compiled query.
+
+        Raises:
+            ValueError: If no queries are loaded or the query name does not exist.
+        """
+        if not self._queries:
+            raise ValueError("No queries loaded.")
+
+        if queryName not in self._queries:
+            raise ValueError(f"Query '{queryName}' not found. Available queries: {', '.join(self._queries.keys())}")
+
+        return self._compiledQueries[queryName]
 
     def saveCsv(self, filePath: str):
         """Save the transaction data to a CSV file.
 
         Converts the internal transaction data to a DataFrame and exports it
-        to a CSV file with comma separation.
+        to a CSV file with comma separation. Dates are written in ISO 8601 format
+        including the UTC offset.
 
         Args:
             filePath (str): The file path where the CSV file will be saved.
         """
         separator = ","
-        self._convert().to_csv(filePath, sep=separator, index=False)
+        dataframe = self._convert()
+        dataframe["date"] = dataframe["date"].map(data.toIsoFormat, na_action="ignore")
+        dataframe.to_csv(filePath, sep=separator, index=False)
 
     def filterByQuery(self, query: str) -> "ConvertData":
         """Filter transactions using a pandas query expression.
@@ -153,15 +415,11 @@ class ConvertData:
             ConvertData: New ConvertData instance with filtered transactions.
 
         Raises:
-            ValueError: If the query is invalid or fails to execute.
+            ValueError: If the query is invalid or fails to execute. In lazy mode
+                execution errors are raised when the transactions are consumed.
         """
-        try:
-            dataframe = self._convert()
-            filtered_dataframe = dataframe.query(query)
-            transactions = [data.BaseTransaction(**row.to_dict()) for _, row in filtered_dataframe.iterrows()]
-            return ConvertData(transactions, self._accountMap, self._queries)
-        except Exception as e:
-            raise ValueError(f"Failed to execute query '{query}': {e}")
+        compiled = qc.compileQuery(query)
+        return self._filter(lambda cache: cache.mask(compiled))
 
     def filterByNamedQuery(self, queryName: str) -> "ConvertData":
         """Apply a named query from the loaded configuration.
@@ -175,17 +433,16 @@ class ConvertData:
         Raises:
             ValueError: If the query name does not exist or execution fails.
         """
-        if not self._queries:
-            raise ValueError("No queries loaded.")
-
-        if queryName not in self._queries:
-            raise ValueError(f"Query '{queryName}' not found. Available queries: {', '.join(self._queries.keys())}")
-
-        return self.filterByQuery(self._queries[queryName])
+        compiled = self._resolveNamedQuery(queryName)
+        return self._filter(lambda cache: cache.mask(compiled))
 
     def filterByNamedQueries(self, *queryNames: str, logic: str = "and") -> "ConvertData":
         """Apply multiple named queries combined with AND or OR logic.
 
+        Each named query is evaluated once per dataset into a cached bitmap and the
+        bitmaps are combined, so repeated combinations of the same queries do not
+        re-evaluate them.
+
         Args:
             *queryNames: Names of queries to apply.
             logic (str): "and" or "or" - how to combine query results. Defaults to "and".
@@ -199,23 +456,23 @@ class ConvertData:
         if logic not in ("and", "or"):
             raise ValueError("logic must be 'and' or 'or'")
 
-        if not self._queries:
-            raise ValueError("No queries loaded.")
+        queries = [self._resolveNamedQuery(queryName) for queryName in queryNames]
+        combine = np.logical_and if logic == "and" else np.logical_or
 
-        queries = []
-        for queryName in queryNames:
-            if queryName not in self._queries:
-                raise ValueError(f"Query '{queryName}' not found. Available queries: {', '.join(self._queries.keys())}")
-            queries.append(self._queries[queryName])
+        def predicate(cache: QueryCache) -> np.ndarray:
+            mask = np.full(len(cache), logic == "and")
+            for query in queries:
+                mask = combine(mask, cache.mask(query))
+            return mask
 
-        combined_query = f" {logic} ".join(f"({q})" for q in queries)
-        return self.filterByQuery(combined_query)
+        return self._filter(predicate)
 
     def filterByNamedQueryExpression(self, parts: List[str]) -> "ConvertData":
         """Apply a sequence of named queries combined by explicit logic operators.
 
         The list must alternate query names and logic operators (`and` / `or`),
-        starting and ending with a query name.
+        starting and ending with a query name. `and` binds stronger than `or`. The
+        cached bitmaps of the named queries are combined accordingly.
 
         Examples:
             ["large_transactions", "and", "deposits_only"]
@@ -241,22 +498,30 @@ class ConvertData:
         if len(parts) % 2 == 0:
             raise ValueError("Expression must alternate query names and operators, starting with a query name.")
 
-        combined_parts: List[str] = []
+        # Disjunction of conjunctions of query expressions
+        terms: List[List[qc.Query]] = [[]]
         for idx, token in enumerate(parts):
             if idx % 2 == 0:
                 # Expect a query name
-                if token not in self._queries:
-                    raise ValueError(f"Query '{token}' not found. Available queries: {', '.join(self._queries.keys())}")
-                combined_parts.append(f"({self._queries[token]})")
+                terms[-1].append(self._resolveNamedQuery(token))
             else:
                 # Expect an operator
                 op = token.lower()
                 if op not in ("and", "or"):
                     raise ValueError("Only 'and' or 'or' operators are supported.")
-                combined_parts.append(f" {op} ")
+                if op == "or":
+                    terms.append([])
+
+        def predicate(cache: QueryCache) -> np.ndarray:
+            mask = np.zeros(len(cache), dtype=bool)
+            for term in terms:
+                termMask = np.ones(len(cache), dtype=bool)
+                for query in term:
+                    termMask &= cache.mask(query)
+                mask |= termMask
+            return mask
 
-        combined_query = "".join(combined_parts)
-        return self.filterByQuery(combined_query)
+        return self._filter(predicate)
 
     def listQueries(self) -> List[str]:
         """List all available named queries from the loaded configuration.
@@ -265,26 +530,3 @@ class ConvertData:
             List[str]: List of query names.
         """
         return list(self._queries.keys())
-
-    @staticmethod
-    def _loadQueryConfig(configPath: str) -> Dict[str, str]:
-        """Load pandas query definitions from a TOML file.
-
-        Args:
-            configPath (str): Path to the TOML configuration file.
-
-        Raises:
-            FileNotFoundError: If the configuration file does not exist.
-            ValueError: If the TOML file does not contain a [queries] section.
-        """
-        config_file = Path(configPath)
-        if not config_file.exists():
-            raise FileNotFoundError(f"Query configuration file not found: {configPath}")
-
-        with open(config_file, "rb") as f:
-            config = tomllib.load(f)
-
-        if "queries" not in config:
-            raise ValueError(f"Configuration file {configPath} must contain a [queries] section")
-
-        return config["queries"]
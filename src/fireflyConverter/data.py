@@ -1,5 +1,10 @@
 import dataclasses as dc
+import datetime as dt
 import enum
+from typing import Dict, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import pandas as pd
 
 
 class TransactionType(enum.Enum):
@@ -7,12 +12,94 @@ class TransactionType(enum.Enum):
     DEPOSIT = "deposit"
 
 
+# IANA regions of timezone abbreviations used in bank exports that zoneinfo does not know,
+# including German ones. Regions observe daylight saving time like the abbreviated zone.
+TIMEZONE_ABBREVIATIONS: Dict[str, str] = {
+    "MEZ": "Europe/Berlin",
+    "MESZ": "Europe/Berlin",
+    "CEST": "Europe/Berlin",
+    "OEZ": "Europe/Helsinki",
+    "OESZ": "Europe/Helsinki",
+    "EEST": "Europe/Helsinki",
+    "WEST": "Europe/Lisbon",
+    "EDT": "America/New_York",
+    "CDT": "America/Chicago",
+    "MDT": "America/Denver",
+    "PST": "America/Los_Angeles",
+    "PDT": "America/Los_Angeles",
+}
+
+
+def resolveTimezone(timezone: Optional[str | dt.tzinfo] = None) -> Optional[dt.tzinfo]:
+    """Resolve a timezone name to a tzinfo object.
+
+    Names known to zoneinfo, such as "CET" or "EST", resolve to their zone. Other common
+    abbreviations resolve to the IANA region observing them, e.g. "MEZ" to "Europe/Berlin".
+    Ambiguous abbreviations such as "BST" are not resolved.
+
+    Args:
+        timezone (Optional[str | dt.tzinfo]): IANA timezone name (e.g. "Europe/Berlin"), timezone
+            abbreviation (e.g. "CEST" or "MEZ") or tzinfo. Defaults to None (no timezone).
+
+    Returns:
+        Optional[dt.tzinfo]: The resolved timezone, None if no timezone is given.
+
+    Raises:
+        zoneinfo.ZoneInfoNotFoundError: If the name is neither a known abbreviation nor an IANA timezone.
+    """
+    if not isinstance(timezone, str):
+        return timezone
+    name = timezone.strip()
+    try:
+        return ZoneInfo(name)
+    except ZoneInfoNotFoundError:
+        region = TIMEZONE_ABBREVIATIONS.get(name.upper())
+        if region is None:
+            raise
+        return ZoneInfo(region)
+
+
+def toTimestamp(value: str | dt.datetime, timezone: Optional[str | dt.tzinfo] = None) -> pd.Timestamp:
+    """Parse a date into a timestamp.
+
+    Args:
+        value (str | dt.datetime): ISO 8601 date string or datetime.
+        timezone (Optional[str | dt.tzinfo]): Timezone assigned to naive dates.
+            Defaults to None (naive dates stay naive).
+
+    Returns:
+        pd.Timestamp: Timestamp, naive only if the date has no UTC offset and no timezone is given.
+    """
+    timestamp = pd.Timestamp(value)
+    timezone = resolveTimezone(timezone)
+    if timestamp.tzinfo is None and timezone is not None:
+        timestamp = timestamp.tz_localize(timezone, ambiguous=True, nonexistent="shift_forward")
+    return timestamp
+
+
+def toIsoFormat(value: str | dt.datetime) -> str:
+    """Format a date as ISO 8601 string for output.
+
+    Args:
+        value (str | dt.datetime): Date to format. Strings are returned unchanged.
+
+    Returns:
+        str: ISO 8601 representation including the UTC offset for aware dates.
+    """
+    if isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
 @dc.dataclass
 class BaseTransaction:
     """Base transaction data class for financial transactions.
 
+    Dates are stored as timestamps. ISO 8601 strings passed as date are parsed on
+    construction. Dates without UTC offset stay naive and are interpreted by the server.
+
     Attributes:
-        date (str): Transaction date.
+        date (dt.datetime): Transaction date.
         amount (float): Transaction amount.
         description (str): Transaction description or memo.
         type (str): Transaction type (withdrawal or deposit).
@@ -53,7 +140,7 @@ class BaseTransaction:
         process_date (str | None): Process date.
     """
 
-    date: str
+    date: dt.datetime
     amount: float
     description: str
     type: str
@@ -96,6 +183,10 @@ class BaseTransaction:
     payment_date: str | None
     invoice_date: str | None
 
+    def __post_init__(self):
+        if isinstance(self.date, str) or (isinstance(self.date, dt.datetime) and self.date.tzinfo is None):
+            self.date = toTimestamp(self.date)
+
 
 @dc.dataclass
 class GetTransaction(BaseTransaction):
@@ -650,4 +741,25 @@ class PostRuleGroup(BaseRuleGroup):
 
     description: str | None = None
     order: int | None = None
-    active: bool | None = None
\ No newline at end of file
+    active: bool | None = None
+
+
+@dc.dataclass
+class GetCurrency:
+    """Currency data class for retrieving currency information from Firefly III.
+
+    Attributes:
+        id (str): Currency ID.
+        code (str): ISO 4217 currency code.
+        name (str | None): Currency name. Defaults to None.
+        symbol (str | None): Currency symbol. Defaults to None.
+        decimal_places (int | None): Number of decimal places. Defaults to None.
+        enabled (bool | None): Whether the currency is enabled. Defaults to None.
+    """
+
+    id: str
+    code: str
+    name: str | None = None
+    symbol: str | None = None
+    decimal_places: int | None = None
+    enabled: bool | None = None
@@ -0,0 +1,119 @@
+import logging
+from typing import Hashable, Iterable, Optional, Set, Tuple
+
+import pandas as pd
+
+from fireflyConverter import data
+
+logger = logging.getLogger(__name__)
+
+
+def accountNames(transaction: data.BaseTransaction) -> Tuple[Optional[str], ...]:
+    """Names of the accounts identifying the owner side of a transaction.
+
+    Source files only name the asset account of a transaction, while the server also
+    reports the balancing account. Withdrawals are therefore identified by their source,
+    deposits by their destination and all other types by both accounts.
+
+    Args:
+        transaction (data.BaseTransaction): Transaction to identify.
+
+    Returns:
+        Tuple[Optional[str], ...]: Account names identifying the transaction.
+    """
+    if transaction.type == data.TransactionType.WITHDRAWAL.value:
+        return (transaction.source_name,)
+    if transaction.type == data.TransactionType.DEPOSIT.value:
+        return (transaction.destination_name,)
+    return (transaction.source_name, transaction.destination_name)
+
+
+def transactionKey(transaction: data.BaseTransaction, wallTime: bool = False) -> Hashable:
+    """Compute the key of a transaction used to detect duplicates.
+
+    The key consists of the type, the date, the absolute amount rounded to cents, the
+    description and the account names of the transaction. Aware dates are keyed by their
+    point in time, naive dates by their wall time.
+
+    Args:
+        transaction (data.BaseTransaction): Transaction to compute the key for.
+        wallTime (bool): Key aware dates by their wall time in their own timezone. Defaults to False.
+
+    Returns:
+        Hashable: Key of the transaction.
+    """
+    timestamp = data.toTimestamp(transaction.date)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_localize(None) if wallTime else timestamp.tz_convert("UTC")
+    timestamp = timestamp.floor("s")
+    return (
+        transaction.type,
+        timestamp,
+        round(abs(float(transaction.amount)), 2),
+        (transaction.description or "").strip(),
+        accountNames(transaction),
+    )
+
+
+class DuplicateIndex:
+    """Hash index of existing transactions to detect duplicates before posting them.
+
+    Holds the keys of the transactions known to the server, so that a re-import can skip
+    rows that already exist without a request per row. The index only covers the fields
+    of `transactionKey`; rows differing in other fields are still considered duplicates.
+
+    Rows with naive dates are matched by wall time, since the server interprets them in
+    its own timezone and reports them in that timezone.
+
+    Attributes:
+        _keys (Set[Hashable]): Keys of the indexed transactions.
+        _wallTimeKeys (Set[Hashable]): Wall time keys of the indexed transactions.
+    """
+
+    def __init__(self, transactions: Iterable[data.BaseTransaction] = ()):
+        """Build an index over transactions.
+
+        Args:
+            transactions (Iterable[data.BaseTransaction]): Transactions to index. Defaults to none.
+        """
+        self._keys: Set[Hashable] = set()
+        self._wallTimeKeys: Set[Hashable] = set()
+        for transaction in transactions:
+            self.add(transaction)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, transaction: data.BaseTransaction) -> bool:
+        if data.toTimestamp(transaction.date).tzinfo is None:
+            return transactionKey(transaction) in self._wallTimeKeys
+        return transactionKey(transaction) in self._keys
+
+    def add(self, transaction: data.BaseTransaction) -> None:
+        """Add a transaction to the index.
+
+        Args:
+            transaction (data.BaseTransaction): Transaction to index.
+        """
+        self._keys.add(transactionKey(transaction))
+        self._wallTimeKeys.add(transactionKey(transaction, wallTime=True))
+
+    @staticmethod
+    def dateRange(transactions: Iterable[data.BaseTransaction]) -> Optional[Tuple[str, str]]:
+        """Compute the range of dates to fetch for an import.
+
+        The range is widened by one day on each side, since the server filters on dates
+        in its own timezone.
+
+        Args:
+            transactions (Iterable[data.BaseTransaction]): Transactions of the import.
+
+        Returns:
+            Optional[Tuple[str, str]]: Start and end date in YYYY-MM-DD format, None if there
+                are no transactions.
+        """
+        dates = [data.toTimestamp(transaction.date).tz_localize(None) for transaction in transactions]
+        if not dates:
+            return None
+        day = pd.Timedelta(days=1)
+        return (min(dates) - day).strftime("%Y-%m-%d"), (max(dates) + day).strftime("%Y-%m-%d")
@@ -0,0 +1,455 @@
+import collections
+import dataclasses as dc
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from fireflyConverter import data
+
+logger = logging.getLogger(__name__)
+
+# Status, JSON body and headers of a response
+Response = Tuple[int, Optional[Dict[str, Any]], Dict[str, str]]
+
+# Endpoints storing objects created by POST requests
+STORES: Tuple[str, ...] = ("accounts", "transactions", "rules", "rule-groups")
+
+# Data classes whose fields make up the attributes of the stored objects
+ATTRIBUTE_CLASSES: Dict[str, type] = {
+    "accounts": data.GetAccount,
+    "rules": data.GetRule,
+    "rule-groups": data.GetRuleGroup,
+}
+
+# Currencies known to the server
+CURRENCIES: List[Dict[str, Any]] = [
+    {"code": "EUR", "name": "Euro", "symbol": "€", "decimal_places": 2, "enabled": True, "primary": True},
+    {"code": "USD", "name": "US Dollar", "symbol": "$", "decimal_places": 2, "enabled": True, "primary": False},
+]
+
+# Account types Firefly III creates for unknown counterparties of withdrawals and deposits
+COUNTERPARTY_TYPES: Dict[str, Tuple[str, str]] = {
+    "withdrawal": ("destination", "expense"),
+    "deposit": ("source", "revenue"),
+}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _attributes(cls: type, values: Dict[str, Any], excluded: Tuple[str, ...] = ("id",)) -> Dict[str, Any]:
+    """Fill the attributes of a data class with the posted values, dropping unknown keys.
+
+    Args:
+        cls (type): Data class of the object returned by the API.
+        values (Dict[str, Any]): Posted values.
+        excluded (Tuple[str, ...]): Fields not part of the attributes. Defaults to ("id",).
+
+    Returns:
+        Dict[str, Any]: Attributes with every field of the data class.
+    """
+    attributes = {field.name: None for field in dc.fields(cls) if field.name not in excluded}
+    attributes.update((key, value) for key, value in values.items() if key in attributes)
+    return attributes
+
+
+def _splitHash(split: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(split, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@dc.dataclass
+class FakeFireflyStats:
+    """Counters of the requests handled by a fake server.
+
+    Attributes:
+        requests (collections.Counter): Number of requests by method and endpoint, e.g. ("POST", "transactions").
+        injected (int): Number of injected error responses.
+        inFlight (int): Number of requests currently being handled.
+        maxInFlight (int): Maximum number of requests handled at once.
+    """
+
+    requests: collections.Counter = dc.field(default_factory=collections.Counter)
+    injected: int = 0
+    inFlight: int = 0
+    maxInFlight: int = 0
+
+    @property
+    def total(self) -> int:
+        """Total number of requests."""
+        return sum(self.requests.values())
+
+
+class FakeFirefly:
+    """In-memory stand-in for the parts of the Firefly III API used by the client.
+
+    Implements accounts, transactions, rules, rule groups, currencies, transaction
+    search, rule triggers and the purge of user data. Posted transactions are rejected
+    with a 422 response naming the split if `error_if_duplicate_hash` is set and an
+    identical split was posted before. Withdrawals and deposits create missing expense
+    and revenue accounts, as Firefly III does.
+
+    Every request can be delayed by a fixed latency plus random jitter, and error
+    responses can be injected at random or queued for the next requests, to benchmark
+    and test throughput, concurrency and retries without a Firefly III instance.
+
+    Attributes:
+        latency (float): Delay of every response in seconds.
+        jitter (float): Maximum random delay added to the latency in seconds.
+        errorRate (float): Probability of answering a request with an injected error.
+        errorStatus (int): Status of the randomly injected errors.
+        apiToken (Optional[str]): Bearer token required by every request, None to accept any request.
+        stats (FakeFireflyStats): Counters of the handled requests.
+        triggers (List[Tuple[str, str, Dict[str, Any]]]): Endpoint, ID and payload of each rule trigger.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        errorRate: float = 0.0,
+        errorStatus: int = 503,
+        apiToken: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        """Create an empty server state.
+
+        Args:
+            latency (float): Delay of every response in seconds. Defaults to 0.
+            jitter (float): Maximum random delay added to the latency in seconds. Defaults to 0.
+            errorRate (float): Probability of answering a request with an injected error. Defaults to 0.
+            errorStatus (int): Status of the randomly injected errors. Defaults to 503.
+            apiToken (Optional[str]): Bearer token required by every request. Defaults to None (any request).
+            seed (Optional[int]): Seed of the random jitter and error injection. Defaults to None.
+
+        Raises:
+            ValueError: If latency or jitter is negative or errorRate is not between 0 and 1.
+        """
+        if latency < 0 or jitter < 0:
+            raise ValueError(f"Latency and jitter must not be negative, got {latency} and {jitter}")
+        if not 0.0 <= errorRate <= 1.0:
+            raise ValueError(f"Error rate must be between 0 and 1, got {errorRate}")
+        self.latency = latency
+        self.jitter = jitter
+        self.errorRate = errorRate
+        self.errorStatus = errorStatus
+        self.apiToken = apiToken
+        self.stats = FakeFireflyStats()
+        self.triggers: List[Tuple[str, str, Dict[str, Any]]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._faults: Deque[Tuple[int, Optional[float]]] = collections.deque()
+        self._stores: Dict[str, Dict[str, Dict[str, Any]]] = {kind: {} for kind in STORES}
+        self._hashes: Dict[str, str] = {}
+        self._nextId = 0
+
+    def failNext(self, status: int = 503, count: int = 1, retryAfter: Optional[float] = None) -> None:
+        """Answer the next requests with an error instead of handling them.
+
+        Args:
+            status (int): Status of the error responses. Defaults to 503.
+            count (int): Number of requests to fail. Defaults to 1.
+            retryAfter (Optional[float]): Value of the Retry-After header in seconds. Defaults to None.
+        """
+        with self._lock:
+            self._faults.extend([(status, retryAfter)] * count)
+
+    def objects(self, kind: str) -> List[Dict[str, Any]]:
+        """List the stored objects of an endpoint.
+
+        Args:
+            kind (str): Endpoint of the objects, one of STORES.
+
+        Returns:
+            List[Dict[str, Any]]: ID and attributes of each object, in creation order.
+        """
+        with self._lock:
+            return [dict(item) for item in self._stores[kind].values()]
+
+    def handle(
+        self, method: str, path: str, body: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None
+    ) -> Response:
+        """Handle an API request.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Request path with query string, e.g. "/api/v1/accounts?limit=50".
+            body (Optional[Dict[str, Any]]): Decoded JSON body. Defaults to None.
+            headers (Optional[Dict[str, str]]): Request headers. Defaults to None.
+
+        Returns:
+            Response: Status, JSON body and headers of the response.
+        """
+        url = urlparse(path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = url.path.removeprefix("/api/v1").strip("/").split("/")
+        with self._lock:
+            self.stats.requests[(method, parts[0])] += 1
+            self.stats.inFlight += 1
+            self.stats.maxInFlight = max(self.stats.maxInFlight, self.stats.inFlight)
+            fault = self._faults.popleft() if self._faults else None
+            if fault is None and self.errorRate and self._random.random() < self.errorRate:
+                fault = (self.errorStatus, None)
+            delay = self.latency + (self._random.uniform(0.0, self.jitter) if self.jitter else 0.0)
+        try:
+            if delay:
+                time.sleep(delay)
+            if fault is not None:
+                with self._lock:
+                    self.stats.injected += 1
+                status, retryAfter = fault
+                return status, {"message": "Injected error"}, {} if retryAfter is None else {"Retry-After": str(retryAfter)}
+            if self.apiToken is not None and (headers or {}).get("Authorization") != f"Bearer {self.apiToken}":
+                return 401, {"message": "Unauthenticated."}, {}
+            with self._lock:
+                return self._route(method, parts, query, body or {})
+        finally:
+            with self._lock:
+                self.stats.inFlight -= 1
+
+    def _route(self, method: str, parts: List[str], query: Dict[str, str], body: Dict[str, Any]) -> Response:
+        kind = parts[0]
+        if parts == ["data", "purge"] and method == "DELETE":
+            for store in self._stores.values():
+                store.clear()
+            self._hashes.clear()
+            return 204, None, {}
+        if parts == ["search", "transactions"] and method == "GET":
+            return 200, self._page("transactions", self._searchTransactions(query.get("query", "")), query), {}
+        if parts == ["currencies"] and method == "GET":
+            currencies = [{"id": str(id), "attributes": dict(c)} for id, c in enumerate(CURRENCIES, start=1)]
+            return 200, self._page("currencies", currencies, query), {}
+        if kind not in STORES:
+            return 404, {"message": "Resource not found"}, {}
+
+        store = self._stores[kind]
+        if len(parts) == 1 and method == "GET":
+            return 200, self._page(kind, self._filter(kind, query), query), {}
+        if len(parts) == 1 and method == "POST":
+            return self._create(kind, body)
+        if len(parts) >= 2 and parts[1] not in store:
+            return 404, {"message": "Resource not found"}, {}
+        if len(parts) == 2 and method == "GET":
+            return 200, {"data": {"type": kind, **store[parts[1]]}}, {}
+        if len(parts) == 2 and method == "DELETE":
+            del store[parts[1]]
+            return 204, None, {}
+        if len(parts) == 3 and parts[2] == "trigger" and method == "POST" and kind in ("rules", "rule-groups"):
+            self.triggers.append((kind, parts[1], body))
+            return 204, None, {}
+        return 405, {"message": "Method not allowed"}, {}
+
+    def _id(self) -> str:
+        self._nextId += 1
+        return str(self._nextId)
+
+    def _page(self, kind: str, items: List[Dict[str, Any]], query: Dict[str, str]) -> Dict[str, Any]:
+        limit = max(1, int(query.get("limit", 50)))
+        page = max(1, int(query.get("page", 1)))
+        selected = items[(page - 1) * limit : page * limit]
+        pagination = {
+            "total": len(items),
+            "count": len(selected),
+            "per_page": limit,
+            "current_page": page,
+            "total_pages": max(1, -(-len(items) // limit)),
+        }
+        return {"data": [{"type": kind, **item} for item in selected], "meta": {"pagination": pagination}}
+
+    def _filter(self, kind: str, query: Dict[str, str]) -> List[Dict[str, Any]]:
+        items = list(self._stores[kind].values())
+        if kind == "accounts" and query.get("type", "all") != "all":
+            items = [item for item in items if item["attributes"]["type"] == query["type"]]
+        if kind != "transactions":
+            return items
+
+        def matches(split: Dict[str, Any]) -> bool:
+            day = str(split["date"])[:10]
+            return (
+                (not query.get("start") or day >= query["start"])
+                and (not query.get("end") or day <= query["end"])
+                and (query.get("type", "all") == "all" or split["type"] == query["type"])
+            )
+
+        return [item for item in items if any(matches(split) for split in item["attributes"]["transactions"])]
+
+    def _searchTransactions(self, search: str) -> List[Dict[str, Any]]:
+        # Only the updated_at_after operator is supported, other terms are ignored
+        items = list(self._stores["transactions"].values())
+        for term in search.split():
+            operator, _, value = term.partition(":")
+            if operator == "updated_at_after":
+                items = [item for item in items if item["attributes"]["updated_at"][:10] >= value]
+        return items
+
+    def _create(self, kind: str, body: Dict[str, Any]) -> Response:
+        if kind == "transactions":
+            return self._createTransaction(body)
+        attributes = _attributes(ATTRIBUTE_CLASSES[kind], body)
+        attributes["created_at"] = attributes["updated_at"] = _now()
+        id = self._id()
+        self._stores[kind][id] = {"id": id, "attributes": attributes}
+        return 200, {"data": {"type": kind, "id": id, "attributes": attributes}}, {}
+
+    def _createTransaction(self, body: Dict[str, Any]) -> Response:
+        splits = body.get("transactions") or []
+        if not splits:
+            return 422, {"message": "Need at least one transaction.", "errors": {"transactions": ["Required."]}}, {}
+        if body.get("error_if_duplicate_hash"):
+            errors = {
+                f"transactions.{position}.description": [f"Duplicate of transaction #{self._hashes[_splitHash(split)]}."]
+                for position, split in enumerate(splits)
+                if _splitHash(split) in self._hashes
+            }
+            if errors:
+                return 422, {"message": next(iter(errors.values()))[0], "errors": errors}, {}
+
+        id = self._id()
+        stored = []
+        for split in splits:
+            self._hashes[_splitHash(split)] = id
+            self._createCounterparty(split)
+            attributes = _attributes(data.GetTransaction, split, excluded=("transaction_id", "user"))
+            attributes["transaction_journal_id"] = self._id()
+            attributes["created_at"] = attributes["updated_at"] = _now()
+            stored.append(attributes)
+        now = _now()
+        attributes = {"group_title": body.get("group_title"), "user": "1", "transactions": stored}
+        attributes["created_at"] = attributes["updated_at"] = now
+        self._stores["transactions"][id] = {"id": id, "attributes": attributes}
+        return 200, {"data": {"type": "transactions", "id": id, "attributes": attributes}}, {}
+
+    def _createCounterparty(self, split: Dict[str, Any]) -> None:
+        side, accountType = COUNTERPARTY_TYPES.get(split.get("type"), (None, None))
+        if side is None or split.get(f"{side}_id") is not None:
+            return
+        name = split.get(f"{side}_name") or "(no name)"
+        accounts = self._stores["accounts"].values()
+        if not any(a["attributes"]["name"] == name and a["attributes"]["type"] == accountType for a in accounts):
+            self._create("accounts", {"name": name, "type": accountType})
+
+
+class FakeFireflyServer:
+    """HTTP server answering requests with a FakeFirefly in a background thread.
+
+    Example:
+        >>> with FakeFireflyServer(latency=0.01) as server:
+        ...     interface = FireflyInterface(base_url=server.url, api_token="token")
+
+    Attributes:
+        fake (FakeFirefly): State and behaviour of the server.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, fake: Optional[FakeFirefly] = None, **options):
+        """Bind the server to an address.
+
+        Args:
+            host (str): Host to listen on. Defaults to "127.0.0.1".
+            port (int): Port to listen on. Defaults to 0 (any free port).
+            fake (Optional[FakeFirefly]): Server state. Defaults to a new FakeFirefly created with `options`.
+            **options: Arguments of FakeFirefly, e.g. latency or errorRate.
+        """
+        self.fake = FakeFirefly(**options) if fake is None else fake
+        self._server = ThreadingHTTPServer((host, port), self._handlerClass())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "FakeFireflyServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, to be passed as base_url of FireflyInterface."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-firefly", daemon=True)
+        self._thread.start()
+        logger.info(f"Fake Firefly III server listening on {self.url}")
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serveForever(self) -> None:
+        """Serve requests in the calling thread until interrupted."""
+        logger.info(f"Fake Firefly III server listening on {self.url}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def _handlerClass(self) -> type:
+        fake = self.fake
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(format % args)
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                status, content, headers = fake.handle(self.command, self.path, body, dict(self.headers))
+                raw = b"" if content is None else json.dumps(content).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(raw)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+        return Handler
+
+
+def main():
+    """Run a fake Firefly III server from the command line until interrupted."""
+    parser = ArgumentParser("fake-firefly", description="Serve a fake Firefly III API for tests and benchmarks.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Host to listen on.")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay of every response in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random delay added to the latency.")
+    parser.add_argument("--error_rate", type=float, default=0.0, help="Probability of an injected error response.")
+    parser.add_argument("--error_status", type=int, default=503, help="Status of the injected error responses.")
+    parser.add_argument("--api_token", type=str, default=None, help="Bearer token required by every request.")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    server = FakeFireflyServer(
+        arguments.host,
+        arguments.port,
+        latency=arguments.latency,
+        jitter=arguments.jitter,
+        errorRate=arguments.error_rate,
+        errorStatus=arguments.error_status,
+        apiToken=arguments.api_token,
+    )
+    try:
+        server.serveForever()
+    except KeyboardInterrupt:
+        logger.info(f"Handled {server.fake.stats.total} requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,66 @@
 from __future__ import annotations
 
-import ast
+import collections
+import dataclasses as dc
 import enum
+import hashlib
+import json
 import logging
-from typing import Dict, List, Optional, Union, overload
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar, Union, overload
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from fireflyConverter import data
-from fireflyConverter.fireflyPayload import PayloadFactory
+from fireflyConverter.duplicateIndex import DuplicateIndex, accountNames
+from fireflyConverter.fireflyPayload import PayloadFactory, TransactionGrouping, groupTransactions, selectSplits
+from fireflyConverter.payloadPipeline import PayloadPipeline, PreparedGroup
+from fireflyConverter.referenceCache import (
+    REFERENCE_LABELS,
+    ReferenceCache,
+    ReferenceKind,
+    ReferenceMap,
+    ReferenceStore,
+    defaultStorePath,
+)
+from fireflyConverter.requestPolicy import IDEMPOTENT_METHODS, AdaptiveLimiter, RetryPolicy, TokenBucket
+from fireflyConverter.runReport import RequestSample, RunRecorder
 
 logger = logging.getLogger(__name__)
 
+# Item type of paginated list endpoints
+T = TypeVar("T")
+
+# Matches the split position in the error keys of a 422 response, e.g. "transactions.1.description"
+SPLIT_ERROR_KEY = re.compile(r"^transactions\.(\d+)\.")
+
+# Matches the ID of the created object at the start of a response, e.g. {"data":{"type":"transaction_groups","id":"42"
+CREATED_ID = re.compile(rb'^\s*\{\s*"data"\s*:\s*\{[^{}]*?"id"\s*:\s*"?(\d+)')
+
+# Number of leading bytes of a response searched for the ID of the created object
+CREATED_ID_PREFIX = 512
+
+# Matches object IDs in request paths, replaced to aggregate the requests per endpoint
+ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+# ID of the existing group named by a duplicate error, e.g. "Duplicate of transaction #12."
+DUPLICATE_OF = re.compile(r"#(\d+)")
+
+# List endpoint of each kind of reference data
+REFERENCE_ENDPOINTS: Dict[ReferenceKind, str] = {
+    ReferenceKind.ACCOUNTS: "accounts",
+    ReferenceKind.RULES: "rules",
+    ReferenceKind.RULE_GROUPS: "rule-groups",
+    ReferenceKind.CURRENCIES: "currencies",
+}
+
+# Number of objects on the first page of a reference listing that make up its version
+REFERENCE_VERSION_LIMIT = 100
+
 
 class DuplicateTransactionHandle(enum.Enum):
     """Enumeration for handling duplicate transaction detection.
@@ -28,15 +77,172 @@ class DuplicateTransactionHandle(enum.Enum):
     ERROR = "error"
 
 
-class FireflyInterface:
-    """Minimal Firefly III REST API interface for creating and managing transactions.
+class TransactionStatus(enum.Enum):
+    """Outcome of creating a single transaction in a batch.
 
-    This class provides methods to interact with a Firefly III instance via its REST API,
-    including creating accounts, managing transactions, and retrieving account information.
+    Attributes:
+        CREATED (str): The transaction was created.
+        DUPLICATE (str): The transaction is a duplicate and was ignored.
+        FAILED (str): The transaction could not be created.
+        SKIPPED (str): The transaction was completed by a previous run and not posted again.
+        PLANNED (str): The transaction would be posted, reported by a dry run.
+    """
 
-    The class handles API authentication, duplicate transaction detection, and error handling.
-    Transactions are created with a single side mapped to the provided account and a balancing
-    side using the default balance account.
+    CREATED = "created"
+    DUPLICATE = "duplicate"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+    PLANNED = "planned"
+
+
+class ErrorCode(enum.Enum):
+    """Category of an error reported by the Firefly III API or the transport.
+
+    Attributes:
+        DUPLICATE (str): The transaction duplicates an existing one (422).
+        VALIDATION (str): The payload was rejected by the validation (422).
+        UNAUTHORIZED (str): The API token is missing, invalid or lacks permissions (401, 403).
+        NOT_FOUND (str): A referenced object does not exist (404).
+        RATE_LIMITED (str): Too many requests (429).
+        SERVER (str): The server failed to process the request (5xx).
+        TRANSPORT (str): No response was received, e.g. connection failures and timeouts.
+        UNKNOWN (str): Any other error.
+    """
+
+    DUPLICATE = "duplicate"
+    VALIDATION = "validation"
+    UNAUTHORIZED = "unauthorized"
+    NOT_FOUND = "not_found"
+    RATE_LIMITED = "rate_limited"
+    SERVER = "server"
+    TRANSPORT = "transport"
+    UNKNOWN = "unknown"
+
+    @classmethod
+    def fromStatus(cls, statusCode: int, message: str = "") -> ErrorCode:
+        """Categorize an error response.
+
+        Args:
+            statusCode (int): HTTP status code of the response.
+            message (str): Error message of the response. Defaults to "".
+
+        Returns:
+            ErrorCode: Category of the error.
+        """
+        if statusCode == 422:
+            return cls.DUPLICATE if "duplicate" in message.lower() else cls.VALIDATION
+        if statusCode in (401, 403):
+            return cls.UNAUTHORIZED
+        if statusCode == 404:
+            return cls.NOT_FOUND
+        if statusCode == 429:
+            return cls.RATE_LIMITED
+        if statusCode >= 500:
+            return cls.SERVER
+        return cls.UNKNOWN
+
+
+class FireflyApiError(Exception):
+    """Error response of the Firefly III API.
+
+    Attributes:
+        statusCode (int): HTTP status code of the response.
+        code (ErrorCode): Category of the error.
+        message (str): Error message of the response.
+        errors (Dict[str, List[str]]): Validation errors per payload field.
+    """
+
+    def __init__(
+        self, statusCode: int, code: ErrorCode, message: str, errors: Optional[Dict[str, List[str]]] = None
+    ) -> None:
+        super().__init__(message)
+        self.statusCode = statusCode
+        self.code = code
+        self.message = message
+        self.errors = errors or {}
+
+    @classmethod
+    def fromBody(cls, statusCode: int, body: Dict) -> FireflyApiError:
+        """Build the error from the decoded body of an error response.
+
+        Firefly III reports errors as `{"message": ..., "errors": {field: [messages]}}`.
+
+        Args:
+            statusCode (int): HTTP status code of the response.
+            body (Dict): Decoded JSON body of the response.
+
+        Returns:
+            FireflyApiError: Error described by the response.
+        """
+        message = str(body.get("message") or "")
+        errors = body.get("errors")
+        errors = {
+            str(field): [str(error) for error in (messages if isinstance(messages, list) else [messages])]
+            for field, messages in (errors.items() if isinstance(errors, dict) else [])
+        }
+        details = " ".join(error for messages in errors.values() for error in messages)
+        return cls(statusCode, ErrorCode.fromStatus(statusCode, f"{message} {details}"), message, errors)
+
+
+@dc.dataclass(frozen=True)
+class TransactionResult:
+    """Result of creating a single transaction in a batch.
+
+    Attributes:
+        index (int): Position of the transaction in the input.
+        status (TransactionStatus): Outcome of the request.
+        id (Optional[str]): ID of the created transaction group. Defaults to None.
+        reason (Optional[str]): Error message of a failed transaction. Defaults to None.
+        code (Optional[ErrorCode]): Category of the error of a rejected or failed transaction.
+            Defaults to None.
+    """
+
+    index: int
+    status: TransactionStatus
+    id: Optional[str] = None
+    reason: Optional[str] = None
+    code: Optional[ErrorCode] = None
+
+
+@dc.dataclass
+class BulkDeleteResult:
+    """Outcome of deleting many objects of one kind.
+
+    Attributes:
+        deleted (List[Union[int, str]]): IDs of the deleted objects, in order of completion.
+        failed (Dict[Union[int, str], str]): Error message by ID of the objects that could not be deleted.
+    """
+
+    deleted: List[Union[int, str]] = dc.field(default_factory=list)
+    failed: Dict[Union[int, str], str] = dc.field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every object was deleted."""
+        return not self.failed
+
+
+@dc.dataclass(frozen=True)
+class RuleGroupScope:
+    """Transactions a rule group is applied to, all transactions if every field is None.
+
+    Attributes:
+        start_date (Optional[str]): First date in YYYY-MM-DD format. Defaults to None.
+        end_date (Optional[str]): Last date in YYYY-MM-DD format. Defaults to None.
+        accounts (Optional[List[str]]): IDs of the asset accounts. Defaults to None.
+    """
+
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    accounts: Optional[List[str]] = None
+
+
+class BaseFireflyInterface:
+    """Transport independent part of the Firefly III REST API interfaces.
+
+    Holds the configuration shared by the blocking and the asyncio interface and
+    converts API responses into data objects, so both interfaces only differ in how
+    requests are sent.
 
     Attributes:
         _base_url (str): Base URL of the Firefly III instance (without trailing slash).
@@ -45,12 +251,15 @@ class FireflyInterface:
         _duplicate_transaction (DuplicateTransactionHandle): How to handle duplicate transactions.
         _default_balance_account_id (Optional[int]): Default account ID for balancing transactions.
         _payloadFactory (PayloadFactory): Factory for building API payloads.
-        _session (requests.Session): Persistent HTTP session with authentication headers.
-
-    Notes:
-        - Requires a Firefly III API token with permissions to create transactions and accounts.
-        - Provide account mappings to convert between internal account names and Firefly account IDs.
-        - For each transaction created, a balancing side is generated to keep transactions balanced.
+        _referenceCache (ReferenceCache): Cache of the IDs of reference data resolved by name.
+        _referenceStore (Optional[ReferenceStore]): Reference data persisted across invocations.
+        _retryPolicy (RetryPolicy): When and how long to wait before repeating a failed request.
+        _rateLimiter (Optional[TokenBucket]): Client-side pacing of the requests.
+        _connectTimeout (Optional[float]): Timeout for establishing a connection in seconds.
+        _readTimeout (Optional[float]): Timeout for receiving a response in seconds.
+        _keepAlive (bool): Whether connections are kept open for reuse.
+        _poolMaxsize (int): Maximum number of idle connections kept open per host.
+        _leanResponses (bool): Whether only the ID is extracted from successful creates.
     """
 
     def __init__(
@@ -59,6 +268,17 @@ class FireflyInterface:
         api_token: str,
         default_balance_account_id: Optional[int] = None,
         duplicate_transaction: DuplicateTransactionHandle | str = DuplicateTransactionHandle.ERROR,
+        cache_ttl: float = 300.0,
+        cache_file: Optional[str] = None,
+        max_retries: int = 4,
+        backoff_factor: float = 0.5,
+        rate_limit: Optional[float] = None,
+        connect_timeout: Optional[float] = 10.0,
+        read_timeout: Optional[float] = 60.0,
+        keep_alive: bool = True,
+        pool_maxsize: int = 10,
+        lean_responses: bool = False,
+        adaptive_concurrency: Optional[int] = None,
     ) -> None:
         """Initialize the Firefly III API interface.
 
@@ -70,6 +290,27 @@ class FireflyInterface:
             duplicate_transaction (DuplicateTransactionHandle | str): How to handle duplicate transactions.
                 Can be a DuplicateTransactionHandle enum or string value ("ignore" or "error").
                 Defaults to DuplicateTransactionHandle.ERROR.
+            cache_ttl (float): Time to live of cached reference data in seconds. Zero disables
+                the cache. Defaults to 300.
+            cache_file (Optional[str]): File persisting reference data across invocations.
+                Defaults to None (not persisted).
+            max_retries (int): Maximum number of repetitions of a request after a transient
+                failure. Defaults to 4.
+            backoff_factor (float): Base delay of the exponential backoff between repetitions
+                in seconds. Defaults to 0.5.
+            rate_limit (Optional[float]): Maximum number of requests per second. Defaults to None
+                (not limited).
+            connect_timeout (Optional[float]): Timeout for establishing a connection in seconds.
+                None waits forever. Defaults to 10.
+            read_timeout (Optional[float]): Timeout for receiving a response in seconds. None waits
+                forever. Defaults to 60.
+            keep_alive (bool): Keep connections open for reuse by later requests. Defaults to True.
+            pool_maxsize (int): Maximum number of idle connections kept open per host. Defaults to 10.
+            lean_responses (bool): Only extract the ID from the responses to created transaction
+                groups instead of decoding the full group. Defaults to False.
+            adaptive_concurrency (Optional[int]): Maximum number of concurrent requests of an adaptive
+                limit, which grows while the latency stays flat and shrinks on rising latency, server
+                errors and 429. Defaults to None (not limited).
         """
         self._base_url = base_url.rstrip("/")
         self._api_url = f"{self._base_url}/api/v1"
@@ -81,14 +322,900 @@ class FireflyInterface:
         )
         self._default_balance_account_id = default_balance_account_id
         self._payloadFactory = PayloadFactory()
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Authorization": f"Bearer {self._api_token}",
-                "accept": "application/json",
-                "Content-Type": "application/json",
-            }
+        self._referenceCache = ReferenceCache(cache_ttl)
+        self._referenceStore = ReferenceStore(cache_file, base_url, api_token) if cache_file else None
+        self._retryPolicy = RetryPolicy(maxRetries=max_retries, backoffFactor=backoff_factor)
+        self._rateLimiter = TokenBucket(rate_limit) if rate_limit else None
+        self._connectTimeout = connect_timeout
+        self._readTimeout = read_timeout
+        self._keepAlive = keep_alive
+        self._poolMaxsize = pool_maxsize
+        self._leanResponses = lean_responses
+        self._concurrencyLimiter = (
+            AdaptiveLimiter(initial=2, maximum=adaptive_concurrency) if adaptive_concurrency else None
+        )
+        self._recorder: Optional[RunRecorder] = None
+
+    @property
+    def _headers(self) -> Dict[str, str]:
+        """HTTP headers with authentication sent with every request.
+
+        Returns:
+            Dict[str, str]: Request headers.
+        """
+        return {
+            "Authorization": f"Bearer {self._api_token}",
+            "accept": "application/json",
+            "Content-Type": "application/json",
+        }
+
+    @staticmethod
+    def _isIdempotent(method: str, payload: Optional[Dict] = None) -> bool:
+        """Whether a request is safe to repeat after a failure.
+
+        Transactions posted with duplicate protection are safe to repeat, since Firefly III
+        rejects the repetition as duplicate if the first attempt was processed. Such a
+        duplicate is reported as created, see `_repeatedAfterFailure`.
+
+        Args:
+            method (str): HTTP method of the request.
+            payload (Optional[Dict]): JSON payload of the request. Defaults to None.
+
+        Returns:
+            bool: True if the request may be repeated.
+        """
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return bool(payload and payload.get("error_if_duplicate_hash"))
+
+    @staticmethod
+    def _repeatedAfterFailure(attempts: Sequence[Optional[int]]) -> bool:
+        """Whether a request was repeated after an attempt the server may have processed.
+
+        Attempts without response and with server errors may have been processed before
+        they failed, unlike rate-limited attempts.
+
+        Args:
+            attempts (Sequence[Optional[int]]): Status of each attempt, None for attempts without response.
+
+        Returns:
+            bool: True if an attempt before the last one may have been processed.
+        """
+        return any(status is None or status >= 500 for status in attempts[:-1])
+
+    def _retryDelay(
+        self,
+        request: str,
+        retry: int,
+        idempotent: bool,
+        response: Optional[Any] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Decide whether to repeat a request after a response or a connection failure.
+
+        Args:
+            request (str): Method and URL of the request, used in log messages.
+            retry (int): Number of repetitions so far.
+            idempotent (bool): Whether the request is safe to repeat.
+            response (Optional[Any]): Response of requests or httpx. Defaults to None.
+            error (Optional[Exception]): Connection failure. Defaults to None.
+
+        Returns:
+            Optional[float]: Delay in seconds before repeating the request, None to give up.
+        """
+        if retry >= self._retryPolicy.maxRetries:
+            return None
+        if response is not None:
+            if not self._retryPolicy.retryStatus(response.status_code, idempotent):
+                return None
+            delay = self._retryPolicy.delay(retry, response.headers.get("Retry-After"))
+            logger.warning(f"{request} returned {response.status_code}, retrying in {delay:.1f}s")
+            return delay
+        if not idempotent:
+            return None
+        delay = self._retryPolicy.delay(retry)
+        logger.warning(f"{request} failed ({error}), retrying in {delay:.1f}s")
+        return delay
+
+    def _releaseSlot(self, acquired: Optional[float], response: Optional[Any] = None) -> None:
+        """Return the slot of a request attempt to the adaptive concurrency limiter.
+
+        Args:
+            acquired (Optional[float]): Time the slot was taken, None without limiter.
+            response (Optional[Any]): Response of requests or httpx, None if the attempt failed. Defaults to None.
+        """
+        if acquired is None:
+            return
+        overloaded = response is None or response.status_code == 429 or response.status_code >= 500
+        self._concurrencyLimiter.release(acquired, overloaded)
+
+    def _recordAttempt(
+        self, method: str, url: str, started: float, retry: int, response: Optional[Any] = None
+    ) -> None:
+        """Pass the measurement of a request attempt to the run recorder, if one is attached.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL of the request.
+            started (float): Time the attempt was sent, from time.perf_counter.
+            retry (int): Number of the repetition, 0 for the first attempt.
+            response (Optional[Any]): Response of requests or httpx, None if the attempt failed. Defaults to None.
+        """
+        if self._recorder is None:
+            return
+        latency = time.perf_counter() - started
+        endpoint = ID_SEGMENT.sub("/{id}", url.removeprefix(self._api_url).split("?")[0])
+        sent = received = 0
+        if response is not None:
+            request = response.request
+            body = getattr(request, "body", None) if isinstance(response, requests.Response) else request.content
+            sent = len(body or b"")
+            received = len(response.content or b"")
+        status = None if response is None else response.status_code
+        self._recorder.recordRequest(RequestSample(method, endpoint, status, latency, sent, received, retry))
+
+    def _handleUnprocessable(self, body: Dict, repeated: bool = False) -> None:
+        """Handle a 422 response to a transaction post.
+
+        Args:
+            body (Dict): Decoded JSON body of the 422 response.
+            repeated (bool): Whether the post was repeated after an attempt the server may have
+                processed, so that a duplicate is the transaction stored by that attempt. Defaults to False.
+
+        Raises:
+            FireflyApiError: If the error is not a duplicate or duplicate handling is not set to IGNORE.
+        """
+        error = FireflyApiError.fromBody(422, body)
+        if error.code == ErrorCode.DUPLICATE and repeated:
+            logger.info("Transaction was stored by an earlier attempt of the repeated request.")
+            return
+        if error.code == ErrorCode.DUPLICATE and self._duplicate_transaction == DuplicateTransactionHandle.IGNORE:
+            logger.debug("Duplicate transaction detected.")
+            return
+        logger.error(f"Error creating transaction: {error.message}")
+        raise error
+
+    def _createdGroupId(self, response: Union[requests.Response, Any]) -> Optional[str]:
+        """Extract the ID of the transaction group created by a request.
+
+        In lean mode, the ID is taken from the start of the raw body, which Firefly III
+        sends before the attributes of the group, and the body is only decoded if the ID
+        is not found there.
+
+        Args:
+            response (Union[requests.Response, Any]): Successful response of requests or httpx.
+
+        Returns:
+            Optional[str]: ID of the created group, None if the response does not contain one.
+        """
+        if self._leanResponses:
+            match = CREATED_ID.match(response.content[:CREATED_ID_PREFIX])
+            if match:
+                return match.group(1).decode()
+        groupId = (self._responseBody(response).get("data") or {}).get("id")
+        return None if groupId is None else str(groupId)
+
+    def _resolveGroupResponse(
+        self, indices: Sequence[int], response: Union[requests.Response, Any], repeated: bool = False
+    ) -> Tuple[List[TransactionResult], List[int]]:
+        """Map the response to a transaction group post back to the source rows.
+
+        A 422 response of Firefly III reports errors per split. If only some splits of a
+        group are rejected, the rejected rows are settled and the remaining rows have to be
+        posted again as a new group. Rejected duplicates are reported as such if duplicate
+        handling is set to IGNORE and as failures otherwise. If the post was repeated after
+        an attempt the server may have processed, duplicates are the transactions stored by
+        that attempt and are reported as created with the ID named by the error.
+
+        Args:
+            indices (Sequence[int]): Input positions of the posted splits, in split order.
+            response (Union[requests.Response, Any]): Response of requests or httpx.
+            repeated (bool): Whether the post was repeated after an attempt the server may have
+                processed. Defaults to False.
+
+        Returns:
+            Tuple[List[TransactionResult], List[int]]: Results of the settled rows and the
+                input positions of the rows to post again.
+        """
+        if response.status_code < 400:
+            groupId = self._createdGroupId(response)
+            return [TransactionResult(index, TransactionStatus.CREATED, id=groupId) for index in indices], []
+        error = FireflyApiError.fromBody(response.status_code, self._responseBody(response))
+        message = error.message
+        if response.status_code != 422:
+            reason = f"HTTP {response.status_code}: {message}"
+            return [
+                TransactionResult(index, TransactionStatus.FAILED, reason=reason, code=error.code) for index in indices
+            ], []
+
+        splitErrors: Dict[int, List[str]] = {}
+        for key, errors in error.errors.items():
+            match = SPLIT_ERROR_KEY.match(key)
+            if match and int(match.group(1)) < len(indices):
+                splitErrors.setdefault(int(match.group(1)), []).extend(errors)
+        if not splitErrors or len(splitErrors) == len(indices):
+            # The errors cannot be attributed to single splits, or all splits are rejected
+            splitErrors = {position: splitErrors.get(position, [message]) for position in range(len(indices))}
+
+        results = [
+            self._rejectedResult(indices[position], " ".join(errors), repeated) for position, errors in splitErrors.items()
+        ]
+        remaining = [index for position, index in enumerate(indices) if position not in splitErrors]
+        return results, remaining
+
+    def _rejectedResult(self, index: int, reason: str, repeated: bool = False) -> TransactionResult:
+        """Report a rejected transaction as duplicate or failure.
+
+        Args:
+            index (int): Position of the transaction in the input.
+            reason (str): Reason of the rejection.
+            repeated (bool): Whether the post was repeated after an attempt the server may have
+                processed. Defaults to False.
+
+        Returns:
+            TransactionResult: Created result if the reason is a duplicate of a repeated post,
+                duplicate result if the reason is a duplicate and duplicate handling is set to
+                IGNORE, failed result otherwise.
+        """
+        code = ErrorCode.fromStatus(422, reason)
+        if code == ErrorCode.DUPLICATE and repeated:
+            match = DUPLICATE_OF.search(reason)
+            logger.info(f"Transaction {index} was stored by an earlier attempt of the repeated request")
+            return TransactionResult(index, TransactionStatus.CREATED, id=match.group(1) if match else None)
+        if code == ErrorCode.DUPLICATE and self._duplicate_transaction == DuplicateTransactionHandle.IGNORE:
+            return TransactionResult(index, TransactionStatus.DUPLICATE, reason=reason, code=code)
+        return TransactionResult(index, TransactionStatus.FAILED, reason=reason, code=code)
+
+    def _planGroups(
+        self,
+        transactions: Iterable[data.BaseTransaction],
+        grouping: TransactionGrouping | str,
+        maxSplits: int,
+        duplicateIndex: Optional[DuplicateIndex] = None,
+    ) -> Tuple[Iterable[Tuple[List[int], List[data.BaseTransaction]]], List[TransactionResult]]:
+        """Plan the requests of a batch of transactions.
+
+        Rows found in the duplicate index are rejected without a request. The other rows
+        are partitioned into transaction groups. Without grouping and index, the input is
+        consumed lazily.
+
+        Args:
+            transactions (Iterable[data.BaseTransaction]): Transactions to create.
+            grouping (TransactionGrouping | str): Which transactions to pack into one group.
+            maxSplits (int): Maximum number of splits per group.
+            duplicateIndex (Optional[DuplicateIndex]): Index of existing transactions. Defaults to None.
+
+        Returns:
+            Tuple[Iterable[Tuple[List[int], List[data.BaseTransaction]]], List[TransactionResult]]:
+                Input positions and transactions of each group, and the results of the rejected rows.
+        """
+        grouping = TransactionGrouping(grouping)
+        if grouping == TransactionGrouping.NONE and duplicateIndex is None:
+            return (([index], [transaction]) for index, transaction in enumerate(transactions)), []
+
+        transactions = list(transactions)
+        rejected: List[TransactionResult] = []
+        candidates: List[int] = []
+        for index, transaction in enumerate(transactions):
+            if duplicateIndex is not None and transaction in duplicateIndex:
+                rejected.append(self._rejectedResult(index, "Duplicate of an existing transaction (pre-flight check)"))
+            else:
+                candidates.append(index)
+        if rejected:
+            logger.info(f"Pre-flight check found {len(rejected)} existing transactions")
+
+        groups = []
+        for positions in groupTransactions([transactions[index] for index in candidates], grouping, maxSplits):
+            indices = [candidates[position] for position in positions]
+            groups.append((indices, [transactions[index] for index in indices]))
+        return groups, rejected
+
+    @staticmethod
+    def _responseBody(response: Union[requests.Response, Any]) -> Dict:
+        """Decode the JSON body of a response, falling back to its text as message.
+
+        Args:
+            response (Union[requests.Response, Any]): Response of requests or httpx.
+
+        Returns:
+            Dict: Decoded body, or a dictionary with the text of the response as message.
+        """
+        try:
+            body = response.json()
+        except ValueError:
+            return {"message": response.text}
+        return body if isinstance(body, dict) else {"message": response.text}
+
+    @staticmethod
+    def _scopeAccounts(transactions: Iterable[data.BaseTransaction]) -> Tuple[Set[str], Set[str]]:
+        """Collect the asset accounts of transactions, see `ruleGroupScope`.
+
+        Withdrawals are booked on their source, deposits on their destination and all
+        other types on both accounts.
+
+        Args:
+            transactions (Iterable[data.BaseTransaction]): Transferred transactions.
+
+        Returns:
+            Tuple[Set[str], Set[str]]: IDs of the accounts given by ID and names of the accounts given by name.
+        """
+        ids: Set[str] = set()
+        names: Set[str] = set()
+        for transaction in transactions:
+            if transaction.type == data.TransactionType.WITHDRAWAL.value:
+                sides: Tuple[str, ...] = ("source",)
+            elif transaction.type == data.TransactionType.DEPOSIT.value:
+                sides = ("destination",)
+            else:
+                sides = ("source", "destination")
+            for side in sides:
+                id, name = getattr(transaction, f"{side}_id"), getattr(transaction, f"{side}_name")
+                if id is not None:
+                    ids.add(str(id))
+                elif name is not None:
+                    names.add(name)
+        return ids, names
+
+    def _preparePayloads(
+        self,
+        groups: Iterable[Tuple[List[int], List[data.BaseTransaction]]],
+        pipeline: Optional[PayloadPipeline] = None,
+    ) -> Tuple[Iterable[PreparedGroup], List[TransactionResult]]:
+        """Turn planned transaction groups into request payloads.
+
+        Without pipeline, each payload is built lazily when its group is submitted.
+        With pipeline, all payloads are validated and built before the first request.
+
+        Args:
+            groups (Iterable[Tuple[List[int], List[data.BaseTransaction]]]): Input positions and
+                transactions of each group.
+            pipeline (Optional[PayloadPipeline]): Stage building the payloads ahead of time. Defaults to None.
+
+        Returns:
+            Tuple[Iterable[PreparedGroup], List[TransactionResult]]: Input positions and payload of
+                each group, and the results of the rows failing validation.
+        """
+        if pipeline is None:
+            return ((indices, self._payloadFactory.postTransactionGroup(members)) for indices, members in groups), []
+        prepared, invalid = pipeline.prepare(self._payloadFactory, groups)
+        rejected = [
+            TransactionResult(index, TransactionStatus.FAILED, reason=reason, code=ErrorCode.VALIDATION)
+            for index, reason in invalid
+        ]
+        return prepared, rejected
+
+    @staticmethod
+    def _plannedResults(
+        prepared: Iterable[PreparedGroup], rejected: List[TransactionResult]
+    ) -> List[TransactionResult]:
+        """Report the outcome of a dry run without sending any request.
+
+        Args:
+            prepared (Iterable[PreparedGroup]): Input positions and payload of each group.
+            rejected (List[TransactionResult]): Results of the rows rejected before posting.
+
+        Returns:
+            List[TransactionResult]: Result of each transaction, in input order.
+        """
+        planned = [TransactionResult(index, TransactionStatus.PLANNED) for indices, _ in prepared for index in indices]
+        return sorted(rejected + planned, key=lambda result: result.index)
+
+    @staticmethod
+    def _notifyResults(
+        onResult: Optional[Callable[[TransactionResult], None]], results: List[TransactionResult]
+    ) -> List[TransactionResult]:
+        """Pass completed results to the completion callback of `createTransactions`.
+
+        Args:
+            onResult (Optional[Callable[[TransactionResult], None]]): Completion callback, None to skip.
+            results (List[TransactionResult]): Completed results.
+
+        Returns:
+            List[TransactionResult]: The results, unchanged.
+        """
+        if onResult is not None:
+            for result in results:
+                onResult(result)
+        return results
+
+    @staticmethod
+    def _orderResults(
+        completed: Dict[int, TransactionResult], nextIndex: int, results: Iterable[TransactionResult]
+    ) -> Tuple[List[TransactionResult], int]:
+        """Collect results and release those continuing the input order.
+
+        Args:
+            completed (Dict[int, TransactionResult]): Results waiting for earlier rows, updated in place.
+            nextIndex (int): Input position of the next result to release.
+            results (Iterable[TransactionResult]): Newly completed results.
+
+        Returns:
+            Tuple[List[TransactionResult], int]: Released results in input order and the next position.
+        """
+        completed.update((result.index, result) for result in results)
+        released: List[TransactionResult] = []
+        while nextIndex in completed:
+            released.append(completed.pop(nextIndex))
+            nextIndex += 1
+        return released, nextIndex
+
+    @staticmethod
+    def _pageCount(body: Dict) -> int:
+        """Read the number of pages from the pagination metadata of a list response.
+
+        Args:
+            body (Dict): Decoded JSON body of the response.
+
+        Returns:
+            int: Total number of pages, 1 if the response has no pagination metadata.
+        """
+        return int(body.get("meta", {}).get("pagination", {}).get("total_pages", 1))
+
+    @staticmethod
+    def _parseAccounts(body: Dict) -> List[data.GetAccount]:
+        """Convert an account list response into account objects.
+
+        Args:
+            body (Dict): Decoded JSON body of the response.
+
+        Returns:
+            List[data.GetAccount]: Accounts of the response.
+        """
+        accounts: List[data.GetAccount] = []
+        for response in body.get("data", []):
+            accountData = response.get("attributes", {})
+            accountData["id"] = response.get("id")
+            accounts.append(data.GetAccount(**accountData))
+        return accounts
+
+    @staticmethod
+    def _parseTransactions(body: Dict) -> List[data.GetTransaction]:
+        """Convert a transaction list response into transaction splits.
+
+        Args:
+            body (Dict): Decoded JSON body of the response.
+
+        Returns:
+            List[data.GetTransaction]: Splits of all transaction groups of the response.
+        """
+        transactions: List[data.GetTransaction] = []
+        for response in body.get("data", []):
+            transactionData = response.get("attributes", {})
+            # The transactions array contains the actual transaction splits
+            transactionSplits = transactionData.get("transactions", [])
+            for split in transactionSplits:
+                split["transaction_id"] = response.get("id")
+                split["transaction_journal_id"] = split.get("transaction_journal_id")
+                split["user"] = split.get("user")
+                transactions.append(data.GetTransaction(**split))
+        return transactions
+
+    @staticmethod
+    def _parseRules(body: Dict) -> List[data.GetRule]:
+        """Convert a rule list response into rule objects.
+
+        Args:
+            body (Dict): Decoded JSON body of the response.
+
+        Returns:
+            List[data.GetRule]: Rules of the response.
+        """
+        rules: List[data.GetRule] = []
+        for response in body.get("data", []):
+            ruleData = response.get("attributes", {})
+            ruleData["id"] = int(response.get("id"))
+            rules.append(data.GetRule(**ruleData))
+        return rules
+
+    @staticmethod
+    def _parseRuleGroups(body: Dict) -> List[data.GetRuleGroup]:
+        """Convert a rule group list response into rule group objects.
+
+        Args:
+            body (Dict): Decoded JSON body of the response.
+
+        Returns:
+            List[data.GetRuleGroup]: Rule groups of the response.
+        """
+        rule_groups: List[data.GetRuleGroup] = []
+        for response in body.get("data", []):
+            ruleGroupData = response.get("attributes", {})
+            ruleGroupData["id"] = int(response.get("id"))
+            rule_groups.append(data.GetRuleGroup(**ruleGroupData))
+        return rule_groups
+
+    @staticmethod
+    def _parseCurrencies(body: Dict) -> List[data.GetCurrency]:
+        """Convert a currency list response into currency objects.
+
+        Attributes not declared by GetCurrency are dropped, since the currency
+        attributes differ between Firefly III versions.
+
+        Args:
+            body (Dict): Decoded JSON body of the response.
+
+        Returns:
+            List[data.GetCurrency]: Currencies of the response.
+        """
+        fieldNames = {field.name for field in dc.fields(data.GetCurrency)}
+        currencies: List[data.GetCurrency] = []
+        for response in body.get("data", []):
+            currencyData = {k: v for k, v in response.get("attributes", {}).items() if k in fieldNames}
+            currencyData["id"] = response.get("id")
+            currencies.append(data.GetCurrency(**currencyData))
+        return currencies
+
+    @staticmethod
+    def _referenceMap(kind: ReferenceKind, items: Iterable[Any]) -> ReferenceMap:
+        """Map the names of reference objects to their IDs.
+
+        Args:
+            kind (ReferenceKind): Kind of the objects.
+            items (Iterable[Any]): Accounts, rule groups or currencies listed by the server.
+
+        Returns:
+            ReferenceMap: IDs of the objects by account name, rule group title or currency code.
+        """
+        _, attribute = REFERENCE_LABELS[kind]
+        mapping: ReferenceMap = {}
+        for item in items:
+            mapping.setdefault(getattr(item, attribute), []).append(item.id)
+        return mapping
+
+    @staticmethod
+    def _createdId(body: Dict) -> Optional[str]:
+        """Read the ID of a created object from the response of a POST request.
+
+        Args:
+            body (Dict): Decoded JSON body of the response.
+
+        Returns:
+            Optional[str]: ID of the created object, None if the response has none.
+        """
+        return body.get("data", {}).get("id")
+
+    @staticmethod
+    def _itemCount(body: Dict) -> int:
+        """Read the total number of items from the pagination metadata of a list response.
+
+        Args:
+            body (Dict): Decoded JSON body of the response.
+
+        Returns:
+            int: Total number of items, the number of items of the page if the response
+                has no pagination metadata.
+        """
+        return int(body.get("meta", {}).get("pagination", {}).get("total", len(body.get("data", []))))
+
+    @classmethod
+    def _listingVersion(cls, body: Dict) -> str:
+        """Compute the version of a reference listing from its first page.
+
+        The version covers the total number of objects and the ID and modification time of
+        each object on the page. It changes when objects are added or removed and when an
+        object on the page is renamed or recreated under a new ID.
+
+        Args:
+            body (Dict): Decoded JSON body of the first page of the listing.
+
+        Returns:
+            str: Version of the listing.
+        """
+        items = [[item.get("id"), item.get("attributes", {}).get("updated_at")] for item in body.get("data", [])]
+        return hashlib.sha256(json.dumps([cls._itemCount(body), items]).encode()).hexdigest()[:16]
+
+    def _recordCreated(self, kind: ReferenceKind, name: str, body: Dict) -> None:
+        """Record an object created by the client in the cached and stored reference data.
+
+        Args:
+            kind (ReferenceKind): Kind of the created object.
+            name (str): Account name, rule title or rule group title of the object.
+            body (Dict): Decoded JSON body of the creation response.
+        """
+        createdId = self._createdId(body)
+        if createdId is None:
+            self._invalidateReferences(kind, persisted=True)
+            return
+        if kind in (ReferenceKind.RULES, ReferenceKind.RULE_GROUPS):
+            createdId = int(createdId)
+        self._referenceCache.add(kind, name, createdId)
+        if self._referenceStore is not None:
+            self._referenceStore.add(kind, name, createdId)
+
+    def _recordDeleted(self, kind: ReferenceKind, id: Union[int, str]) -> None:
+        """Remove an object deleted by the client from the cached and stored reference data.
+
+        Args:
+            kind (ReferenceKind): Kind of the deleted object.
+            id (Union[int, str]): ID of the object.
+        """
+        self._referenceCache.discard(kind, id)
+        if self._referenceStore is not None:
+            self._referenceStore.discard(kind, id)
+
+    def _invalidateReferences(self, kind: Optional[ReferenceKind] = None, persisted: bool = False) -> None:
+        """Drop cached reference data.
+
+        Args:
+            kind (Optional[ReferenceKind]): Kind of reference data. Defaults to None, dropping all kinds.
+            persisted (bool): Also drop the data persisted across invocations. Stored data is
+                revalidated against the version of the listing on the server before use, so it
+                only needs to be dropped when that check cannot detect the change. Defaults to False.
+        """
+        self._referenceCache.invalidate(kind)
+        if persisted and self._referenceStore is not None:
+            self._referenceStore.clear(kind)
+
+    def _clearDefaultStore(self) -> None:
+        """Drop the reference data of the instance and user from the default store file.
+
+        Earlier runs, e.g. of the transfer command with `--reference_cache`, may have
+        persisted reference data there even if this interface uses another file or none.
+        """
+        path = defaultStorePath()
+        if path.exists():
+            ReferenceStore(path, self._base_url, self._api_token).clear()
+
+    @staticmethod
+    def _logDeleteProgress(label: str, result: BulkDeleteResult, total: int) -> None:
+        """Log the progress of a bulk deletion about every tenth of the objects.
+
+        Args:
+            label (str): Plural label of the objects, e.g. "accounts".
+            result (BulkDeleteResult): Outcome of the deletion so far.
+            total (int): Number of objects to delete.
+        """
+        done = len(result.deleted) + len(result.failed)
+        if done % max(1, total // 10) == 0 or done == total:
+            logger.info(f"Deleted {len(result.deleted)}/{total} {label} ({len(result.failed)} failed)")
+
+    @staticmethod
+    def _logDeleteResult(label: str, result: BulkDeleteResult) -> None:
+        """Log the outcome of a bulk deletion.
+
+        Args:
+            label (str): Plural label of the objects, e.g. "accounts".
+            result (BulkDeleteResult): Outcome of the deletion.
+        """
+        if result.ok:
+            logger.info(f"Successfully deleted all {len(result.deleted)} {label}")
+            return
+        for id, reason in result.failed.items():
+            logger.warning(f"Failed to delete {id}: {reason}")
+        logger.warning(f"Deleted {len(result.deleted)} {label}, {len(result.failed)} failed")
+
+    @property
+    def concurrencyLimiter(self) -> Optional[AdaptiveLimiter]:
+        """Adaptive limit on the concurrent requests, None if not enabled.
+
+        Returns:
+            Optional[AdaptiveLimiter]: The limiter shared by all requests of the interface.
+        """
+        return self._concurrencyLimiter
+
+    @property
+    def recorder(self) -> Optional[RunRecorder]:
+        """Recorder measuring every request attempt, None if requests are not recorded.
+
+        Returns:
+            Optional[RunRecorder]: The attached recorder.
+        """
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder: Optional[RunRecorder]) -> None:
+        self._recorder = recorder
+
+    @property
+    def referenceCache(self) -> ReferenceCache:
+        """Cache of the account, rule group and currency IDs resolved by name.
+
+        Returns:
+            ReferenceCache: Cache shared by all calls of the interface.
+        """
+        return self._referenceCache
+
+
+class FireflyInterface(BaseFireflyInterface):
+    """Minimal Firefly III REST API interface for creating and managing transactions.
+
+    This class provides methods to interact with a Firefly III instance via its REST API,
+    including creating accounts, managing transactions, and retrieving account information.
+
+    The class handles API authentication, duplicate transaction detection, and error handling.
+    Transactions are created with a single side mapped to the provided account and a balancing
+    side using the default balance account.
+
+    Attributes:
+        _base_url (str): Base URL of the Firefly III instance (without trailing slash).
+        _api_url (str): Full API endpoint URL (base_url/api/v1).
+        _api_token (str): API token for authentication.
+        _duplicate_transaction (DuplicateTransactionHandle): How to handle duplicate transactions.
+        _default_balance_account_id (Optional[int]): Default account ID for balancing transactions.
+        _payloadFactory (PayloadFactory): Factory for building API payloads.
+        _referenceCache (ReferenceCache): Cache of the IDs of reference data resolved by name.
+        _local (threading.local): Per-thread storage of the HTTP sessions.
+        _sessions (Dict[threading.Thread, requests.Session]): Sessions created by the interface by thread.
+        _sessionsLock (threading.Lock): Lock guarding the sessions by thread.
+        _poolConnections (int): Number of hosts whose connections are pooled by each session.
+
+    Notes:
+        - Requires a Firefly III API token with permissions to create transactions and accounts.
+        - Provide account mappings to convert between internal account names and Firefly account IDs.
+        - For each transaction created, a balancing side is generated to keep transactions balanced.
+        - Each thread uses its own persistent HTTP session, so one interface can be shared by
+          the worker threads of a concurrent transfer.
+        - Account names, rule group titles and currency codes are resolved to IDs through a
+          reference cache, which is updated when the interface creates or deletes objects.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_token: str,
+        default_balance_account_id: Optional[int] = None,
+        duplicate_transaction: DuplicateTransactionHandle | str = DuplicateTransactionHandle.ERROR,
+        cache_ttl: float = 300.0,
+        cache_file: Optional[str] = None,
+        max_retries: int = 4,
+        backoff_factor: float = 0.5,
+        rate_limit: Optional[float] = None,
+        connect_timeout: Optional[float] = 10.0,
+        read_timeout: Optional[float] = 60.0,
+        keep_alive: bool = True,
+        pool_maxsize: int = 10,
+        pool_connections: int = 10,
+        lean_responses: bool = False,
+        adaptive_concurrency: Optional[int] = None,
+    ) -> None:
+        """Initialize the Firefly III API interface.
+
+        Args:
+            base_url (str): Base URL of the Firefly III instance (e.g., "https://firefly.example.com").
+            api_token (str): API token for authentication with the Firefly III instance.
+            default_balance_account_id (Optional[int]): Default account ID to use for balancing transactions.
+                Defaults to None.
+            duplicate_transaction (DuplicateTransactionHandle | str): How to handle duplicate transactions.
+                Can be a DuplicateTransactionHandle enum or string value ("ignore" or "error").
+                Defaults to DuplicateTransactionHandle.ERROR.
+            cache_ttl (float): Time to live of cached reference data in seconds. Zero disables
+                the cache. Defaults to 300.
+            cache_file (Optional[str]): File persisting reference data across invocations.
+                Defaults to None (not persisted).
+            max_retries (int): Maximum number of repetitions of a request after a transient
+                failure. Defaults to 4.
+            backoff_factor (float): Base delay of the exponential backoff between repetitions
+                in seconds. Defaults to 0.5.
+            rate_limit (Optional[float]): Maximum number of requests per second. Defaults to None
+                (not limited).
+            connect_timeout (Optional[float]): Timeout for establishing a connection in seconds.
+                None waits forever. Defaults to 10.
+            read_timeout (Optional[float]): Timeout for receiving a response in seconds. None waits
+                forever. Defaults to 60.
+            keep_alive (bool): Keep connections open for reuse by later requests. Defaults to True.
+            pool_maxsize (int): Maximum number of idle connections kept open per host by the
+                session of each thread. Defaults to 10.
+            pool_connections (int): Number of hosts whose connections are pooled by the session of
+                each thread. Defaults to 10.
+            lean_responses (bool): Only extract the ID from the responses to created transaction
+                groups instead of decoding the full group. Defaults to False.
+            adaptive_concurrency (Optional[int]): Maximum number of concurrent requests of an adaptive
+                limit, which grows while the latency stays flat and shrinks on rising latency, server
+                errors and 429. Defaults to None (not limited).
+        """
+        super().__init__(
+            base_url,
+            api_token,
+            default_balance_account_id,
+            duplicate_transaction,
+            cache_ttl,
+            cache_file,
+            max_retries,
+            backoff_factor,
+            rate_limit,
+            connect_timeout,
+            read_timeout,
+            keep_alive,
+            pool_maxsize,
+            lean_responses,
+            adaptive_concurrency,
         )
+        self._poolConnections = pool_connections
+        self._local = threading.local()
+        self._sessions: Dict[threading.Thread, requests.Session] = {}
+        self._sessionsLock = threading.Lock()
+
+    @property
+    def _session(self) -> requests.Session:
+        """Persistent HTTP session of the calling thread with authentication headers.
+
+        requests.Session is not thread-safe, so every thread gets its own session. The
+        session mounts adapters sized by the pool settings; repeating failed requests is
+        left to `_request`. Sessions of threads that have finished, such as the workers of
+        earlier concurrent calls, are closed when a new session is created.
+
+        Returns:
+            requests.Session: Session of the calling thread.
+        """
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self._headers)
+            if not self._keepAlive:
+                session.headers["Connection"] = "close"
+            adapter = HTTPAdapter(pool_connections=self._poolConnections, pool_maxsize=self._poolMaxsize, max_retries=0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._local.session = session
+            with self._sessionsLock:
+                finished = [thread for thread in self._sessions if not thread.is_alive()]
+                stale = [self._sessions.pop(thread) for thread in finished]
+                self._sessions[threading.current_thread()] = session
+            for previous in stale:
+                previous.close()
+        return session
+
+    def close(self) -> None:
+        """Close the HTTP sessions of all threads."""
+        with self._sessionsLock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+
+    def _request(
+        self, method: str, url: str, attempts: Optional[List[Optional[int]]] = None, **kwargs: Any
+    ) -> requests.Response:
+        """Send a request through the retry and rate limiting layer.
+
+        Paces the request with the rate limiter, waits for a slot of the adaptive
+        concurrency limiter if enabled, and repeats the request after transient failures
+        according to the retry policy. The final response is returned without checking
+        its status.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL of the request.
+            attempts (Optional[List[Optional[int]]]): List the status of each attempt is appended
+                to, None for attempts without response. Defaults to None.
+            **kwargs (Any): Further arguments of requests.Session.request, e.g. params or json.
+
+        Returns:
+            requests.Response: Response of the last attempt.
+
+        Raises:
+            requests.ConnectionError: If the server cannot be reached and the request is not repeated.
+            requests.Timeout: If the request times out and is not repeated.
+        """
+        idempotent = self._isIdempotent(method, kwargs.get("json"))
+        kwargs.setdefault("timeout", (self._connectTimeout, self._readTimeout))
+        retry = 0
+        while True:
+            if self._rateLimiter is not None:
+                time.sleep(self._rateLimiter.reserve())
+            acquired = None if self._concurrencyLimiter is None else self._concurrencyLimiter.acquire()
+            started = time.perf_counter()
+            response = None
+            try:
+                response = self._session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._recordAttempt(method, url, started, retry)
+                if attempts is not None:
+                    attempts.append(None)
+                delay = self._retryDelay(f"{method} {url}", retry, idempotent, error=e)
+                if delay is None:
+                    raise
+            else:
+                self._recordAttempt(method, url, started, retry, response)
+                if attempts is not None:
+                    attempts.append(response.status_code)
+                delay = self._retryDelay(f"{method} {url}", retry, idempotent, response=response)
+                if delay is None:
+                    return response
+            finally:
+                self._releaseSlot(acquired, response)
+            time.sleep(delay)
+            retry += 1
 
     def _postTransaction(self, transaction: data.BaseTransaction) -> requests.Response:
         """Post a transaction to the Firefly III API with error handling.
@@ -103,32 +1230,404 @@ class FireflyInterface:
             requests.Response: The HTTP response from the API.
 
         Raises:
-            Exception: If the API returns an error and duplicate handling is not set to IGNORE.
+            FireflyApiError: If the API returns an error and duplicate handling is not set to IGNORE.
             requests.HTTPError: If the HTTP request fails with a non-422 status code.
         """
         logger.debug(f"Creating transaction: {transaction.description} (amount: {transaction.amount})")
         payload = self._payloadFactory.toPayload(transaction)
         url = f"{self._api_url}/transactions"
-        resp = self._session.post(url, json=payload)
+        attempts: List[Optional[int]] = []
+        resp = self._request("POST", url, attempts, json=payload)
 
         if resp.status_code == 422:
-            errorMessage: str = ast.literal_eval(resp.text).get("message")
-            isDuplicate = "duplicate" in errorMessage.lower()
-            if isDuplicate and self._duplicate_transaction == DuplicateTransactionHandle.IGNORE:
-                logger.debug("Duplicate transaction detected.")
-                return resp
-            else:
-                logger.error(f"Error creating transaction: {errorMessage}")
-                raise Exception(f"Error creating transaction: {errorMessage}")
+            self._handleUnprocessable(self._responseBody(resp), self._repeatedAfterFailure(attempts))
+            return resp
 
         resp.raise_for_status()
+        # Firefly III creates missing expense and revenue accounts named by the transaction
+        self._invalidateReferences(ReferenceKind.ACCOUNTS)
         return resp
 
+    def _getPage(self, url: str, params: Dict[str, Any], page: int) -> Dict:
+        """Request one page of a list endpoint.
+
+        Args:
+            url (str): URL of the endpoint.
+            params (Dict[str, Any]): Query parameters without the page number.
+            page (int): Page number.
+
+        Returns:
+            Dict: Decoded JSON body of the response.
+
+        Raises:
+            requests.HTTPError: If the HTTP request fails.
+        """
+        response = self._request("GET", url, params={**params, "page": page})
+        response.raise_for_status()
+        return response.json()
+
+    def _iterPages(
+        self, endpoint: str, params: Dict[str, Any], parse: Callable[[Dict], List[T]], prefetch: int = 0
+    ) -> Iterator[T]:
+        """Iterate over the items of a paginated list endpoint.
+
+        Requests the first page and follows the pagination metadata of the responses,
+        yielding the items of each page as it arrives. Without prefetching, the pages are
+        requested one after another and only one page is held in memory at a time. With
+        prefetching, the remaining pages are requested concurrently, with at most
+        `prefetch` pages in flight, and their items are still yielded in page order.
+
+        Args:
+            endpoint (str): Path of the endpoint relative to the API URL, e.g. "accounts".
+            params (Dict[str, Any]): Query parameters, the page number is set per request.
+            parse (Callable[[Dict], List[T]]): Conversion of a response body into items.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0,
+                requesting the pages sequentially.
+
+        Yields:
+            T: Items of all pages, in the order of the server.
+
+        Raises:
+            ValueError: If prefetch is negative.
+            requests.HTTPError: If an HTTP request fails.
+        """
+        if prefetch < 0:
+            raise ValueError(f"Number of prefetched pages must not be negative, got {prefetch}")
+
+        url = f"{self._api_url}/{endpoint}"
+        body = self._getPage(url, params, 1)
+        pageCount = self._pageCount(body)
+        yield from parse(body)
+
+        if prefetch == 0:
+            for page in range(2, pageCount + 1):
+                body = self._getPage(url, params, page)
+                pageCount = self._pageCount(body)
+                yield from parse(body)
+            return
+
+        logger.debug(f"Prefetching {pageCount - 1} pages of {endpoint} with {prefetch} requests in flight")
+        with ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="firefly-pages") as executor:
+            pending: Deque[Future[Dict]] = collections.deque()
+            try:
+                for page in range(2, pageCount + 1):
+                    pending.append(executor.submit(self._getPage, url, params, page))
+                    if len(pending) >= prefetch:
+                        yield from parse(pending.popleft().result())
+                while pending:
+                    yield from parse(pending.popleft().result())
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def iterAccounts(
+        self, limit: Optional[int] = None, type: Optional[str] = None, prefetch: int = 0
+    ) -> Iterator[data.GetAccount]:
+        """Iterate over all accounts on the Firefly III server.
+
+        Args:
+            limit (Optional[int]): Number of items per page. Defaults to the server default.
+            type (Optional[str]): Filter on account type, e.g. asset, expense, revenue. Defaults to None.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Yields:
+            data.GetAccount: Accounts of all pages.
+
+        Raises:
+            requests.HTTPError: If an HTTP request fails.
+        """
+        params = self._payloadFactory.getAccounts(limit, account_type=type)
+        yield from self._iterPages("accounts", params, self._parseAccounts, prefetch)
+
+    def iterTransactions(
+        self,
+        limit: Optional[int] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        type: Optional[str] = None,
+        prefetch: int = 0,
+    ) -> Iterator[data.GetTransaction]:
+        """Iterate over all transactions on the Firefly III server.
+
+        Args:
+            limit (Optional[int]): Number of items per page. Defaults to the server default.
+            start (Optional[str]): Start date (YYYY-MM-DD format). Defaults to None.
+            end (Optional[str]): End date (YYYY-MM-DD format). Defaults to None.
+            type (Optional[str]): Filter by transaction type (withdrawal, deposit, etc.). Defaults to None.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Yields:
+            data.GetTransaction: Transaction splits of all pages.
+
+        Raises:
+            requests.HTTPError: If an HTTP request fails.
+        """
+        params = self._payloadFactory.getTransactions(limit, None, start, end, type)
+        yield from self._iterPages("transactions", params, self._parseTransactions, prefetch)
+
+    def searchTransactions(
+        self, query: str, limit: Optional[int] = None, prefetch: int = 0
+    ) -> Iterator[data.GetTransaction]:
+        """Iterate over the transactions matching a search query.
+
+        Args:
+            query (str): Search query using the Firefly III search operators, e.g.
+                "updated_at_after:2025-07-01".
+            limit (Optional[int]): Number of items per page. Defaults to the server default.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Yields:
+            data.GetTransaction: Transaction splits of all matching transaction groups.
+
+        Raises:
+            requests.HTTPError: If an HTTP request fails.
+        """
+        params = self._payloadFactory.searchTransactions(query, limit)
+        yield from self._iterPages("search/transactions", params, self._parseTransactions, prefetch)
+
+    def countTransactions(self) -> int:
+        """Count the transaction groups on the server with a single small request.
+
+        Returns:
+            int: Number of transaction groups on the server.
+
+        Raises:
+            requests.HTTPError: If the HTTP request fails.
+        """
+        return self._itemCount(self._getPage(f"{self._api_url}/transactions", {"limit": 1}, 1))
+
+    def iterRules(self, limit: int = 100, prefetch: int = 0) -> Iterator[data.GetRule]:
+        """Iterate over all rules on the Firefly III server.
+
+        Args:
+            limit (int): Number of items per page. Defaults to 100.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Yields:
+            data.GetRule: Rules of all pages.
+
+        Raises:
+            requests.HTTPError: If an HTTP request fails.
+        """
+        params = self._payloadFactory.getRules(limit)
+        yield from self._iterPages("rules", params, self._parseRules, prefetch)
+
+    def iterRuleGroups(self, limit: int = 100, prefetch: int = 0) -> Iterator[data.GetRuleGroup]:
+        """Iterate over all rule groups on the Firefly III server.
+
+        Args:
+            limit (int): Number of items per page. Defaults to 100.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Yields:
+            data.GetRuleGroup: Rule groups of all pages.
+
+        Raises:
+            requests.HTTPError: If an HTTP request fails.
+        """
+        params = self._payloadFactory.getRuleGroups(limit)
+        yield from self._iterPages("rule-groups", params, self._parseRuleGroups, prefetch)
+
+    def iterCurrencies(self, limit: int = 100, prefetch: int = 0) -> Iterator[data.GetCurrency]:
+        """Iterate over all currencies on the Firefly III server.
+
+        Args:
+            limit (int): Number of items per page. Defaults to 100.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Yields:
+            data.GetCurrency: Currencies of all pages.
+
+        Raises:
+            requests.HTTPError: If an HTTP request fails.
+        """
+        params = self._payloadFactory.getCurrencies(limit)
+        yield from self._iterPages("currencies", params, self._parseCurrencies, prefetch)
+
+    def _referenceVersion(self, kind: ReferenceKind) -> str:
+        """Compute the version of the listing of a kind of reference data with a single request.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+
+        Returns:
+            str: Version of the listing, see `_listingVersion`.
+
+        Raises:
+            requests.HTTPError: If the HTTP request fails.
+        """
+        url = f"{self._api_url}/{REFERENCE_ENDPOINTS[kind]}"
+        return self._listingVersion(self._getPage(url, {"limit": REFERENCE_VERSION_LIMIT}, 1))
+
+    def _loadReferences(self, kind: ReferenceKind, revalidate: bool = False) -> ReferenceMap:
+        """List the objects of a kind of reference data on the server.
+
+        With revalidation, data persisted by an earlier invocation is used instead if the
+        version of the listing on the server is unchanged, which costs one request instead
+        of listing all pages. Changes beyond the first page that keep the number of objects
+        are not detected; stale IDs are then recovered from on use, see `_sendResolved`.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+            revalidate (bool): Use persisted data after checking it against the server. Defaults to False.
+
+        Returns:
+            ReferenceMap: IDs of the objects by name.
+
+        Raises:
+            requests.HTTPError: If an HTTP request fails.
+        """
+        if self._referenceStore is None:
+            return self._listReferences(kind)
+        stored = self._referenceStore.load(kind) if revalidate else None
+        version = self._referenceVersion(kind)
+        if stored is not None and stored[1] == version:
+            logger.debug(f"Using stored {kind.value}, revalidated against the server")
+            return stored[0]
+        mapping = self._listReferences(kind)
+        self._referenceStore.save(kind, mapping, version)
+        return mapping
+
+    def _listReferences(self, kind: ReferenceKind) -> ReferenceMap:
+        """List all pages of a kind of reference data.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+
+        Returns:
+            ReferenceMap: IDs of the objects by name.
+
+        Raises:
+            requests.HTTPError: If an HTTP request fails.
+        """
+        iterators: Dict[ReferenceKind, Callable[[], Iterator[Any]]] = {
+            ReferenceKind.ACCOUNTS: self.iterAccounts,
+            ReferenceKind.RULES: self.iterRules,
+            ReferenceKind.RULE_GROUPS: self.iterRuleGroups,
+            ReferenceKind.CURRENCIES: self.iterCurrencies,
+        }
+        return self._referenceMap(kind, iterators[kind]())
+
+    def _resolveReference(self, kind: ReferenceKind, name: str) -> Union[int, str]:
+        """Resolve the name of a reference object to its ID.
+
+        Serves the lookup from the reference cache. Expired entries and names missing
+        from the cached entry, e.g. objects created by another client, are reloaded.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+            name (str): Account name, rule title, rule group title or currency code.
+
+        Returns:
+            Union[int, str]: ID of the object.
+
+        Raises:
+            ValueError: If no object or several objects have the name.
+            requests.HTTPError: If an HTTP request fails.
+        """
+        mapping = self._referenceCache.get(kind)
+        if mapping is None or name not in mapping:
+            mapping = self._loadReferences(kind, revalidate=mapping is None)
+            self._referenceCache.put(kind, mapping)
+        return self._referenceCache.select(kind, mapping, name)
+
+    def _sendResolved(
+        self, kind: ReferenceKind, key: Union[int, str], send: Callable[[Union[int, str]], requests.Response]
+    ) -> Tuple[Union[int, str], requests.Response]:
+        """Send a request for an object given by ID or by name.
+
+        Names are resolved through the reference cache. If the server does not know the
+        resolved ID, the cached ID is stale, e.g. because another client recreated the
+        object, so the name is resolved again from the server and the request repeated once.
+
+        Args:
+            kind (ReferenceKind): Kind of the object.
+            key (Union[int, str]): ID or name of the object.
+            send (Callable[[Union[int, str]], requests.Response]): Sends the request for an ID.
+
+        Returns:
+            Tuple[Union[int, str], requests.Response]: ID of the object and response of the request.
+
+        Raises:
+            ValueError: If key is a name and no object or several objects have the name.
+            requests.HTTPError: If resolving the name fails.
+        """
+        if not isinstance(key, str):
+            return key, send(key)
+        id = self._resolveReference(kind, key)
+        response = send(id)
+        if response.status_code == 404:
+            logger.info(f"ID {id} of {key} is stale, reloading {kind.value}")
+            self._invalidateReferences(kind, persisted=True)
+            id = self._resolveReference(kind, key)
+            response = send(id)
+        return id, response
+
+    def resolveAccountId(self, name: str) -> str:
+        """Resolve an account name to its ID.
+
+        Args:
+            name (str): Name of the account.
+
+        Returns:
+            str: ID of the account.
+
+        Raises:
+            ValueError: If no account or several accounts have the name.
+            requests.HTTPError: If an HTTP request fails.
+        """
+        return self._resolveReference(ReferenceKind.ACCOUNTS, name)
+
+    def resolveRuleId(self, title: str) -> int:
+        """Resolve a rule title to its ID.
+
+        Args:
+            title (str): Title of the rule.
+
+        Returns:
+            int: ID of the rule.
+
+        Raises:
+            ValueError: If no rule or several rules have the title.
+            requests.HTTPError: If an HTTP request fails.
+        """
+        return self._resolveReference(ReferenceKind.RULES, title)
+
+    def resolveRuleGroupId(self, title: str) -> int:
+        """Resolve a rule group title to its ID.
+
+        Args:
+            title (str): Title of the rule group.
+
+        Returns:
+            int: ID of the rule group.
+
+        Raises:
+            ValueError: If no rule group or several rule groups have the title.
+            requests.HTTPError: If an HTTP request fails.
+        """
+        return self._resolveReference(ReferenceKind.RULE_GROUPS, title)
+
+    def resolveCurrencyId(self, code: str) -> str:
+        """Resolve a currency code to its ID.
+
+        Args:
+            code (str): ISO 4217 code of the currency, e.g. EUR.
+
+        Returns:
+            str: ID of the currency.
+
+        Raises:
+            ValueError: If no currency has the code.
+            requests.HTTPError: If an HTTP request fails.
+        """
+        return self._resolveReference(ReferenceKind.CURRENCIES, code)
+
     def getAccounts(self) -> List[data.GetAccount]:
         """Retrieve the list of accounts from the Firefly III server.
 
-        Fetches all accounts configured in the Firefly III instance and converts
-        the API response data into GetAccount objects.
+        Fetches all accounts configured in the Firefly III instance, following the
+        pagination of the API, and converts the API response data into GetAccount objects.
 
         Returns:
             List[data.GetAccount]: List of account objects with their attributes and metadata.
@@ -137,16 +1636,7 @@ class FireflyInterface:
             requests.HTTPError: If the HTTP request fails.
         """
         logger.info("Retrieving accounts from Firefly III")
-        url = f"{self._api_url}/accounts"
-        response = self._session.get(url)
-        response.raise_for_status()
-        accountResponses: Dict = response.json().get("data", [])
-
-        accounts: List[data.GetAccount] = []
-        for response in accountResponses:
-            accountData = response.get("attributes", {})
-            accountData["id"] = response.get("id")
-            accounts.append(data.GetAccount(**accountData))
+        accounts = list(self.iterAccounts())
         logger.info(f"Retrieved {len(accounts)} accounts from Firefly III")
         return accounts
 
@@ -165,8 +1655,9 @@ class FireflyInterface:
         logger.info(f"Creating account: {account.name}")
         url = f"{self._api_url}/accounts"
         payload = self._payloadFactory.toPayload(account)
-        resp = self._session.post(url, json=payload)
+        resp = self._request("POST", url, json=payload)
         resp.raise_for_status()
+        self._recordCreated(ReferenceKind.ACCOUNTS, account.name, self._responseBody(resp))
         logger.debug(f"Account {account.name} created successfully (status: {resp.status_code})")
         return resp
 
@@ -184,12 +1675,13 @@ class FireflyInterface:
         """
         logger.info(f"Deleting account: {account_id}")
         url = f"{self._api_url}/accounts/{account_id}"
-        resp = self._session.delete(url)
+        resp = self._request("DELETE", url)
         resp.raise_for_status()
+        self._recordDeleted(ReferenceKind.ACCOUNTS, account_id)
         logger.debug(f"Account {account_id} deleted successfully")
         return resp
 
-    def deleteAccounts(self, account_ids: Optional[List[str]] = None) -> None:
+    def deleteAccounts(self, account_ids: Optional[List[str]] = None, workers: int = 1) -> BulkDeleteResult:
         """Delete one or more accounts from the Firefly III server.
 
         If no account IDs are provided, fetches all accounts from the server and deletes them.
@@ -199,22 +1691,56 @@ class FireflyInterface:
             account_ids (Optional[List[str]]): List of Firefly account IDs to delete.
                 If None, all accounts on the server will be fetched and deleted.
                 Defaults to None.
+            workers (int): Number of concurrent deletion requests. Defaults to 1.
 
         Returns:
-            None
+            BulkDeleteResult: Deleted accounts and the error of each failed deletion.
 
         Raises:
-            requests.HTTPError: If any deletion request fails.
+            ValueError: If workers is smaller than 1.
+            requests.HTTPError: If fetching the accounts fails.
         """
         if account_ids is None:
             logger.info("No account IDs provided, fetching all accounts for deletion")
             accounts = self.getAccounts()
             account_ids = [account.id for account in accounts]
 
-        logger.info(f"Deleting {len(account_ids)} accounts from Firefly III")
-        for account_id in account_ids:
-            self.deleteAccount(account_id)
-        logger.info(f"Successfully deleted all {len(account_ids)} accounts")
+        return self._deleteConcurrently("accounts", account_ids, self.deleteAccount, workers)
+
+    def _deleteConcurrently(
+        self, label: str, ids: Sequence[Union[int, str]], delete: Callable[[Any], requests.Response], workers: int
+    ) -> BulkDeleteResult:
+        """Delete objects from a pool of worker threads, collecting failures.
+
+        Args:
+            label (str): Plural label of the objects, e.g. "accounts".
+            ids (Sequence[Union[int, str]]): IDs of the objects to delete.
+            delete (Callable[[Any], requests.Response]): Deletes a single object, raising on failure.
+            workers (int): Number of concurrent deletion requests.
+
+        Returns:
+            BulkDeleteResult: Deleted objects and the error of each failed deletion.
+
+        Raises:
+            ValueError: If workers is smaller than 1.
+        """
+        if workers < 1:
+            raise ValueError(f"Number of workers must be at least 1, got {workers}")
+
+        logger.info(f"Deleting {len(ids)} {label} from Firefly III with {workers} workers")
+        result = BulkDeleteResult()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="firefly") as executor:
+            futures = {executor.submit(delete, id): id for id in ids}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except (requests.RequestException, ValueError) as e:
+                    result.failed[futures[future]] = str(e)
+                else:
+                    result.deleted.append(futures[future])
+                self._logDeleteProgress(label, result, len(ids))
+        self._logDeleteResult(label, result)
+        return result
 
     def deleteTransaction(self, transaction_id: str) -> requests.Response:
         """Delete a transaction on the Firefly III server.
@@ -229,10 +1755,36 @@ class FireflyInterface:
             requests.HTTPError: If the HTTP request fails.
         """
         url = f"{self._api_url}/transactions/{transaction_id}"
-        resp = self._session.delete(url)
+        resp = self._request("DELETE", url)
         resp.raise_for_status()
         return resp
 
+    def deleteTransactions(self, transaction_ids: Optional[List[str]] = None, workers: int = 1) -> BulkDeleteResult:
+        """Delete one or more transactions from the Firefly III server.
+
+        If no transaction IDs are provided, fetches all transactions from the server and
+        deletes their transaction groups.
+
+        Args:
+            transaction_ids (Optional[List[str]]): List of Firefly transaction IDs to delete.
+                If None, all transactions on the server will be fetched and deleted.
+                Defaults to None.
+            workers (int): Number of concurrent deletion requests. Defaults to 1.
+
+        Returns:
+            BulkDeleteResult: Deleted transactions and the error of each failed deletion.
+
+        Raises:
+            ValueError: If workers is smaller than 1.
+            requests.HTTPError: If fetching the transactions fails.
+        """
+        if transaction_ids is None:
+            logger.info("No transaction IDs provided, fetching all transactions for deletion")
+            groups = [str(transaction.transaction_id) for transaction in self.iterTransactions(limit=500)]
+            transaction_ids = list(dict.fromkeys(groups))
+
+        return self._deleteConcurrently("transactions", transaction_ids, self.deleteTransaction, workers)
+
     def purgeUserData(self, user_id: Optional[int] = None) -> requests.Response:
         """Purge all data for a user from the Firefly III server.
 
@@ -247,8 +1799,10 @@ class FireflyInterface:
         """
         url = f"{self._api_url}/data/purge"
         params = {"user": user_id} if user_id is not None else None
-        resp = self._session.delete(url, params=params)
+        resp = self._request("DELETE", url, params=params)
         resp.raise_for_status()
+        self._invalidateReferences(persisted=True)
+        self._clearDefaultStore()
         return resp
 
     def createTransaction(self, transaction: data.BaseTransaction) -> requests.Response:
@@ -264,12 +1818,205 @@ class FireflyInterface:
             requests.Response: The HTTP response from the Firefly API.
 
         Raises:
-            Exception: If the API returns an error (422 status) and duplicate handling
+            FireflyApiError: If the API returns an error (422 status) and duplicate handling
                 is not set to IGNORE.
             requests.HTTPError: If the HTTP request fails with a non-422 status code.
         """
         return self._postTransaction(transaction)
 
+    def buildDuplicateIndex(self, transactions: Iterable[data.BaseTransaction], prefetch: int = 4) -> DuplicateIndex:
+        """Fetch the existing transactions of an import once and index them.
+
+        Requests the transactions in the date range of the import and indexes those
+        booked on the accounts of the import.
+
+        Args:
+            transactions (Iterable[data.BaseTransaction]): Transactions of the import.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 4.
+
+        Returns:
+            DuplicateIndex: Index of the existing transactions.
+
+        Raises:
+            requests.HTTPError: If an HTTP request fails.
+        """
+        transactions = list(transactions)
+        dateRange = DuplicateIndex.dateRange(transactions)
+        if dateRange is None:
+            return DuplicateIndex()
+
+        accounts = {accountNames(transaction) for transaction in transactions}
+        start, end = dateRange
+        existing = self.iterTransactions(limit=500, start=start, end=end, prefetch=prefetch)
+        duplicateIndex = DuplicateIndex(transaction for transaction in existing if accountNames(transaction) in accounts)
+        logger.info(f"Indexed {len(duplicateIndex)} existing transactions between {start} and {end}")
+        return duplicateIndex
+
+    def ruleGroupScope(self, transactions: Iterable[data.BaseTransaction]) -> RuleGroupScope:
+        """Limit the application of rule groups to the range and accounts of transferred transactions.
+
+        The date range is widened by one day on each side, since the server filters on
+        dates in its own timezone. Account names are resolved to IDs through the reference
+        cache. If a name cannot be resolved unambiguously, the scope is limited by date only.
+
+        Args:
+            transactions (Iterable[data.BaseTransaction]): Transferred transactions.
+
+        Returns:
+            RuleGroupScope: Dates and asset account IDs of the transactions, unlimited if there are none.
+
+        Raises:
+            requests.HTTPError: If loading the accounts fails.
+        """
+        transactions = list(transactions)
+        dateRange = DuplicateIndex.dateRange(transactions)
+        if dateRange is None:
+            return RuleGroupScope()
+        ids, names = self._scopeAccounts(transactions)
+        try:
+            ids |= {str(self._resolveReference(ReferenceKind.ACCOUNTS, name)) for name in names}
+        except ValueError as e:
+            logger.warning(f"Not limiting rule groups to accounts: {e}")
+            return RuleGroupScope(*dateRange)
+        return RuleGroupScope(*dateRange, sorted(ids) if ids else None)
+
+    def createTransactions(
+        self,
+        transactions: Iterable[data.BaseTransaction],
+        workers: int = 1,
+        batchSize: Optional[int] = None,
+        grouping: TransactionGrouping | str = TransactionGrouping.NONE,
+        maxSplits: int = 10,
+        preflight: bool = False,
+        pipeline: Optional[PayloadPipeline] = None,
+        dryRun: bool = False,
+        onResult: Optional[Callable[[TransactionResult], None]] = None,
+    ) -> Iterator[TransactionResult]:
+        """Create transactions on the Firefly III server and report a result per transaction.
+
+        Posts the transactions from a pool of worker threads and yields one result per
+        transaction in the order of the input. At most `batchSize` requests are submitted
+        ahead of the results being yielded; without grouping and pre-flight check the input
+        is consumed lazily. Errors of individual transactions do not stop the batch but are
+        reported as failed results. Duplicates are reported as such if duplicate handling is
+        set to IGNORE and as failures otherwise.
+
+        With grouping, related transactions are posted as splits of one transaction group,
+        which saves one request per packed transaction. If Firefly III rejects some splits
+        of a group, their rows are reported and the other splits are posted again.
+
+        With the pre-flight check, the existing transactions in the date range of the input
+        are fetched once (see `buildDuplicateIndex`) and rows already on the server are
+        reported as duplicates without being posted.
+
+        With a payload pipeline, all payloads are validated and built before the first
+        request and invalid rows are reported as failures without being posted. A dry run
+        stops after this stage and reports the remaining rows as planned, without any
+        request to the server.
+
+        Args:
+            transactions (Iterable[data.BaseTransaction]): Transactions to create.
+            workers (int): Number of concurrent requests. Defaults to 1.
+            batchSize (Optional[int]): Number of requests submitted ahead of the results.
+                Defaults to twice the number of workers.
+            grouping (TransactionGrouping | str): Which transactions to pack into one group.
+                Defaults to TransactionGrouping.NONE.
+            maxSplits (int): Maximum number of splits per group. Defaults to 10.
+            preflight (bool): Skip transactions existing on the server before posting. Defaults to False.
+            pipeline (Optional[PayloadPipeline]): Stage building the payloads ahead of time.
+                Defaults to None (built when posted, without validation).
+            dryRun (bool): Build and validate the payloads without posting them. Defaults to False.
+            onResult (Optional[Callable[[TransactionResult], None]]): Called from the worker thread
+                with the result of each transaction as soon as it completes, e.g. to journal it, before
+                it is yielded in input order. Defaults to None.
+
+        Yields:
+            TransactionResult: Result of each transaction, in input order.
+
+        Raises:
+            ValueError: If workers, batchSize or maxSplits is smaller than 1, or a dry run is combined
+                with the pre-flight check.
+            requests.HTTPError: If fetching the existing transactions for the pre-flight check fails.
+        """
+        batchSize = 2 * workers if batchSize is None else batchSize
+        if workers < 1:
+            raise ValueError(f"Number of workers must be at least 1, got {workers}")
+        if batchSize < 1:
+            raise ValueError(f"Batch size must be at least 1, got {batchSize}")
+        if dryRun and preflight:
+            raise ValueError("A dry run cannot check for existing transactions on the server")
+
+        duplicateIndex = None
+        if preflight:
+            transactions = list(transactions)
+            duplicateIndex = self.buildDuplicateIndex(transactions, prefetch=workers)
+        groups, rejected = self._planGroups(transactions, grouping, maxSplits, duplicateIndex)
+        payloads, invalid = self._preparePayloads(groups, PayloadPipeline() if dryRun and pipeline is None else pipeline)
+        rejected = rejected + invalid
+        if dryRun:
+            yield from self._notifyResults(onResult, self._plannedResults(payloads, rejected))
+            return
+
+        def createGroup(indices: List[int], payload: Dict[str, Any]) -> List[TransactionResult]:
+            return self._notifyResults(onResult, self._createGroupResults(indices, payload))
+
+        logger.info(f"Creating transactions with {workers} workers")
+        completed: Dict[int, TransactionResult] = {}
+        released, nextIndex = self._orderResults(completed, 0, self._notifyResults(onResult, rejected))
+        yield from released
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="firefly") as executor:
+            pending: Deque[Future[List[TransactionResult]]] = collections.deque()
+            try:
+                for indices, payload in payloads:
+                    pending.append(executor.submit(createGroup, indices, payload))
+                    if len(pending) >= batchSize:
+                        released, nextIndex = self._orderResults(completed, nextIndex, pending.popleft().result())
+                        yield from released
+                while pending:
+                    released, nextIndex = self._orderResults(completed, nextIndex, pending.popleft().result())
+                    yield from released
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _createGroupResults(self, indices: List[int], payload: Dict[str, Any]) -> List[TransactionResult]:
+        """Post a transaction group until every split is created or rejected.
+
+        Args:
+            indices (List[int]): Input positions of the splits, in split order.
+            payload (Dict[str, Any]): Payload of the transaction group.
+
+        Returns:
+            List[TransactionResult]: Result of each transaction.
+        """
+        url = f"{self._api_url}/transactions"
+        descriptions = {index: split["description"] for index, split in zip(indices, payload["transactions"])}
+        results: List[TransactionResult] = []
+        posted = remaining = list(indices)
+        try:
+            while remaining:
+                if remaining != posted:
+                    payload = selectSplits(payload, [posted.index(index) for index in remaining])
+                    posted = remaining
+                attempts: List[Optional[int]] = []
+                response = self._request("POST", url, attempts, json=payload)
+                settled, remaining = self._resolveGroupResponse(
+                    remaining, response, self._repeatedAfterFailure(attempts)
+                )
+                results += settled
+        except (FireflyApiError, requests.RequestException) as e:
+            code = e.code if isinstance(e, FireflyApiError) else ErrorCode.TRANSPORT
+            results += [
+                TransactionResult(index, TransactionStatus.FAILED, reason=str(e), code=code) for index in remaining
+            ]
+        if any(result.status == TransactionStatus.CREATED for result in results):
+            # Firefly III creates missing expense and revenue accounts named by the transactions
+            self._invalidateReferences(ReferenceKind.ACCOUNTS)
+        for result in results:
+            if result.status == TransactionStatus.FAILED:
+                logger.warning(f"Transaction {result.index} ({descriptions[result.index]}) failed: {result.reason}")
+        return results
+
     def getTransactions(
         self,
         limit: Optional[int] = None,
@@ -298,22 +2045,9 @@ class FireflyInterface:
         """
         url = f"{self._api_url}/transactions"
         params = self._payloadFactory.getTransactions(limit, page, start, end, type)
-        response = self._session.get(url, params=params)
+        response = self._request("GET", url, params=params)
         response.raise_for_status()
-        transactionResponses: Dict = response.json().get("data", [])
-
-        transactions: List[data.GetTransaction] = []
-
-        for response in transactionResponses:
-            transactionData = response.get("attributes", {})
-            # The transactions array contains the actual transaction splits
-            transactionSplits = transactionData.get("transactions", [])
-            for split in transactionSplits:
-                split["transaction_id"] = response.get("id")
-                split["transaction_journal_id"] = split.get("transaction_journal_id")
-                split["user"] = split.get("user")
-                transactions.append(data.GetTransaction(**split))
-        return transactions
+        return self._parseTransactions(response.json())
 
     def getRules(
         self,
@@ -337,16 +2071,9 @@ class FireflyInterface:
         """
         url = f"{self._api_url}/rules"
         params = self._payloadFactory.getRules(limit, page)
-        response = self._session.get(url, params=params)
+        response = self._request("GET", url, params=params)
         response.raise_for_status()
-        ruleResponses: Dict = response.json().get("data", [])
-
-        rules: List[data.GetRule] = []
-        for response in ruleResponses:
-            ruleData = response.get("attributes", {})
-            ruleData["id"] = int(response.get("id"))
-            rules.append(data.GetRule(**ruleData))
-        return rules
+        return self._parseRules(response.json())
 
     def getRuleGroups(
         self,
@@ -370,16 +2097,9 @@ class FireflyInterface:
         """
         url = f"{self._api_url}/rule-groups"
         params = self._payloadFactory.getRuleGroups(limit, page)
-        response = self._session.get(url, params=params)
+        response = self._request("GET", url, params=params)
         response.raise_for_status()
-        ruleGroupResponses: Dict = response.json().get("data", [])
-
-        rule_groups: List[data.GetRuleGroup] = []
-        for response in ruleGroupResponses:
-            ruleGroupData = response.get("attributes", {})
-            ruleGroupData["id"] = int(response.get("id"))
-            rule_groups.append(data.GetRuleGroup(**ruleGroupData))
-        return rule_groups
+        return self._parseRuleGroups(response.json())
 
     def createRule(self, rule: data.PostRule) -> requests.Response:
         """Create a new rule on the Firefly III server.
@@ -396,8 +2116,9 @@ class FireflyInterface:
         logger.info(f"Creating rule: {rule.title}")
         url = f"{self._api_url}/rules"
         payload = self._payloadFactory.toPayload(rule)
-        response = self._session.post(url, json=payload)
+        response = self._request("POST", url, json=payload)
         response.raise_for_status()
+        self._recordCreated(ReferenceKind.RULES, rule.title, self._responseBody(response))
         logger.debug(f"Rule {rule.title} created successfully (status: {response.status_code})")
         return response
 
@@ -415,12 +2136,13 @@ class FireflyInterface:
         """
         logger.info(f"Deleting rule: {rule_id}")
         url = f"{self._api_url}/rules/{rule_id}"
-        resp = self._session.delete(url)
+        resp = self._request("DELETE", url)
         resp.raise_for_status()
+        self._recordDeleted(ReferenceKind.RULES, rule_id)
         logger.debug(f"Rule {rule_id} deleted successfully")
         return resp
 
-    def deleteRules(self, rule_ids: Optional[List[int]] = None) -> None:
+    def deleteRules(self, rule_ids: Optional[List[int]] = None, workers: int = 1) -> BulkDeleteResult:
         """Delete one or more rules from the Firefly III server.
 
         If no rule IDs are provided, fetches all rules from the server and deletes them.
@@ -430,22 +2152,20 @@ class FireflyInterface:
             rule_ids (Optional[List[int]]): List of Firefly rule IDs to delete.
                 If None, all rules on the server will be fetched and deleted.
                 Defaults to None.
+            workers (int): Number of concurrent deletion requests. Defaults to 1.
 
         Returns:
-            None
+            BulkDeleteResult: Deleted rules and the error of each failed deletion.
 
         Raises:
-            requests.HTTPError: If any deletion request fails.
+            ValueError: If workers is smaller than 1.
+            requests.HTTPError: If fetching the rules fails.
         """
         if rule_ids is None:
             logger.info("No rule IDs provided, fetching all rules for deletion")
-            rules = self.getRules()
-            rule_ids = [rule.id for rule in rules]
+            rule_ids = [rule.id for rule in self.iterRules()]
 
-        logger.info(f"Deleting {len(rule_ids)} rules from Firefly III")
-        for rule_id in rule_ids:
-            self.deleteRule(rule_id)
-        logger.info(f"Successfully deleted all {len(rule_ids)} rules")
+        return self._deleteConcurrently("rules", rule_ids, self.deleteRule, workers)
 
     def createRuleGroup(self, rule_group: data.PostRuleGroup) -> requests.Response:
         """Create a new rule group on the Firefly III server.
@@ -461,8 +2181,9 @@ class FireflyInterface:
         logger.info(f"Creating rule group: {rule_group.title}")
         url = f"{self._api_url}/rule-groups"
         payload = self._payloadFactory.toPayload(rule_group)
-        response = self._session.post(url, json=payload)
+        response = self._request("POST", url, json=payload)
         response.raise_for_status()
+        self._recordCreated(ReferenceKind.RULE_GROUPS, rule_group.title, self._responseBody(response))
         logger.debug(f"Rule group {rule_group.title} created successfully (status: {response.status_code})")
         return response
 
@@ -546,20 +2267,14 @@ class FireflyInterface:
             ValueError: If rule_group_id is a title and no matching rule group is found or multiple matches exist.
             requests.HTTPError: If the HTTP request fails.
         """
-        # Resolve title to ID if needed
-        if isinstance(rule_group_id, str):
-            rule_groups = self.getRuleGroups()
-            matches = [rg for rg in rule_groups if rg.title == rule_group_id]
-            if len(matches) == 0:
-                raise ValueError(f"No rule group found with title: {rule_group_id}")
-            elif len(matches) > 1:
-                raise ValueError(f"Ambiguous rule group title '{rule_group_id}': found {len(matches)} matches")
-            rule_group_id = matches[0].id
-
-        logger.info(f"Triggering rule group: {rule_group_id}")
-        url = f"{self._api_url}/rule-groups/{rule_group_id}/trigger"
         payload = self._payloadFactory.postApplyRuleGroup(start_date, end_date, accounts)
-        response = self._session.post(url, json=payload)
+
+        def trigger(id: Union[int, str]) -> requests.Response:
+            logger.info(f"Triggering rule group: {id}")
+            return self._request("POST", f"{self._api_url}/rule-groups/{id}/trigger", json=payload)
+
+        # Resolve title to ID if needed
+        rule_group_id, response = self._sendResolved(ReferenceKind.RULE_GROUPS, rule_group_id, trigger)
         response.raise_for_status()
         logger.debug(f"Rule group {rule_group_id} triggered successfully (status: {response.status_code})")
         return response
@@ -608,25 +2323,19 @@ class FireflyInterface:
             ValueError: If rule_group_id is a title and no matching rule group is found or multiple matches exist.
             requests.HTTPError: If the HTTP request fails.
         """
+        def delete(id: Union[int, str]) -> requests.Response:
+            logger.info(f"Deleting rule group: {id}")
+            return self._request("DELETE", f"{self._api_url}/rule-groups/{id}")
+
         # Resolve title to ID if needed
-        if isinstance(rule_group_id, str):
-            rule_groups = self.getRuleGroups()
-            matches = [rg for rg in rule_groups if rg.title == rule_group_id]
-            if len(matches) == 0:
-                raise ValueError(f"No rule group found with title: {rule_group_id}")
-            elif len(matches) > 1:
-                raise ValueError(f"Ambiguous rule group title '{rule_group_id}': found {len(matches)} matches")
-            rule_group_id = matches[0].id
-
-        logger.info(f"Deleting rule group: {rule_group_id}")
-        url = f"{self._api_url}/rule-groups/{rule_group_id}"
-        resp = self._session.delete(url)
+        rule_group_id, resp = self._sendResolved(ReferenceKind.RULE_GROUPS, rule_group_id, delete)
         resp.raise_for_status()
+        self._recordDeleted(ReferenceKind.RULE_GROUPS, rule_group_id)
         logger.debug(f"Rule group {rule_group_id} deleted successfully")
         return resp
 
     @overload
-    def deleteRuleGroups(self, rule_group_ids: Optional[List[int]] = None) -> None:
+    def deleteRuleGroups(self, rule_group_ids: Optional[List[int]] = None, workers: int = 1) -> BulkDeleteResult:
         """Delete one or more rule groups from the Firefly III server.
 
         If no rule group IDs are provided, fetches all rule groups from the server and deletes them.
@@ -636,17 +2345,19 @@ class FireflyInterface:
             rule_group_ids (Optional[List[int]]): List of Firefly rule group IDs to delete.
                 If None, all rule groups on the server will be fetched and deleted.
                 Defaults to None.
+            workers (int): Number of concurrent deletion requests. Defaults to 1.
 
         Returns:
-            None
+            BulkDeleteResult: Deleted rule groups and the error of each failed deletion.
 
         Raises:
-            requests.HTTPError: If any deletion request fails.
+            ValueError: If workers is smaller than 1.
+            requests.HTTPError: If fetching the rule groups fails.
         """
         ...
 
     @overload
-    def deleteRuleGroups(self, rule_group_ids: Optional[List[str]] = None) -> None:
+    def deleteRuleGroups(self, rule_group_ids: Optional[List[str]] = None, workers: int = 1) -> BulkDeleteResult:
         """Delete one or more rule groups from the Firefly III server.
 
         If no rule group IDs are provided, fetches all rule groups from the server and deletes them.
@@ -656,17 +2367,20 @@ class FireflyInterface:
             rule_group_ids (Optional[List[str]]): List of Firefly rule group titles to delete.
                 If None, all rule groups on the server will be fetched and deleted.
                 Defaults to None.
+            workers (int): Number of concurrent deletion requests. Defaults to 1.
 
         Returns:
-            None
+            BulkDeleteResult: Deleted rule groups and the error of each failed deletion.
 
         Raises:
-            ValueError: If any rule_group_id is a title and no matching rule group is found or multiple matches exist.
-            requests.HTTPError: If any deletion request fails.
+            ValueError: If workers is smaller than 1.
+            requests.HTTPError: If fetching the rule groups fails.
         """
         ...
 
-    def deleteRuleGroups(self, rule_group_ids: Optional[Union[List[int], List[str]]] = None) -> None:
+    def deleteRuleGroups(
+        self, rule_group_ids: Optional[Union[List[int], List[str]]] = None, workers: int = 1
+    ) -> BulkDeleteResult:
         """Delete one or more rule groups from the Firefly III server.
 
         If no rule group IDs are provided, fetches all rule groups from the server and deletes them.
@@ -676,20 +2390,17 @@ class FireflyInterface:
             rule_group_ids (Optional[Union[List[int], List[str]]]): List of Firefly rule group IDs or titles to delete.
                 If None, all rule groups on the server will be fetched and deleted.
                 Defaults to None.
+            workers (int): Number of concurrent deletion requests. Defaults to 1.
 
         Returns:
-            None
+            BulkDeleteResult: Deleted rule groups and the error of each failed deletion.
 
         Raises:
-            ValueError: If any rule_group_id is a title and no matching rule group is found or multiple matches exist.
-            requests.HTTPError: If any deletion request fails.
+            ValueError: If workers is smaller than 1.
+            requests.HTTPError: If fetching the rule groups fails.
         """
         if rule_group_ids is None:
             logger.info("No rule group IDs provided, fetching all rule groups for deletion")
-            rule_groups = self.getRuleGroups()
-            rule_group_ids = [rule_group.id for rule_group in rule_groups]
+            rule_group_ids = [rule_group.id for rule_group in self.iterRuleGroups()]
 
-        logger.info(f"Deleting {len(rule_group_ids)} rule groups from Firefly III")
-        for rule_group_id in rule_group_ids:
-            self.deleteRuleGroup(rule_group_id)
-        logger.info(f"Successfully deleted all {len(rule_group_ids)} rule groups")
+        return self._deleteConcurrently("rule groups", rule_group_ids, self.deleteRuleGroup, workers)
@@ -1,6 +1,104 @@
-from typing import Any, Optional, Union, overload
+import datetime as dt
+import enum
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Union, overload
 
-from fireflyConverter.data import BaseTransaction, PostAccount, PostRule, PostRuleGroup
+from fireflyConverter.data import BaseTransaction, PostAccount, PostRule, PostRuleGroup, toIsoFormat
+
+
+class TransactionGrouping(enum.Enum):
+    """Modes of packing transactions as splits into one transaction group.
+
+    Only transactions of the same type, accounts and currency are packed together,
+    since Firefly III requires the splits of a group to share their type and asset account.
+
+    Attributes:
+        NONE (str): Every transaction is a group of its own.
+        DATE_ACCOUNT (str): Transactions on the same day are packed together.
+        TIMESTAMP (str): Transactions with the same timestamp are packed together, e.g. a
+            Trade Republic trade with its tax and fee rows.
+    """
+
+    NONE = "none"
+    DATE_ACCOUNT = "date_account"
+    TIMESTAMP = "timestamp"
+
+
+def _groupKey(transaction: BaseTransaction, date: Any) -> Hashable:
+    return (
+        transaction.type,
+        transaction.source_name,
+        transaction.source_id,
+        transaction.destination_name,
+        transaction.destination_id,
+        transaction.currency_code,
+        date,
+    )
+
+
+GROUP_KEYS: Dict[TransactionGrouping, Callable[[BaseTransaction], Hashable]] = {
+    TransactionGrouping.DATE_ACCOUNT: lambda transaction: _groupKey(
+        transaction, transaction.date.date() if isinstance(transaction.date, dt.datetime) else transaction.date[:10]
+    ),
+    TransactionGrouping.TIMESTAMP: lambda transaction: _groupKey(transaction, transaction.date),
+}
+
+
+def groupTransactions(
+    transactions: Iterable[BaseTransaction],
+    grouping: TransactionGrouping = TransactionGrouping.NONE,
+    maxSplits: int = 10,
+) -> List[List[int]]:
+    """Partition transactions into groups posted as one request each.
+
+    Args:
+        transactions (Iterable[BaseTransaction]): Transactions to partition.
+        grouping (TransactionGrouping): Which transactions to pack together. Defaults to NONE.
+        maxSplits (int): Maximum number of splits per group. Defaults to 10.
+
+    Returns:
+        List[List[int]]: Positions of the transactions of each group, ordered by their first position.
+
+    Raises:
+        ValueError: If maxSplits is smaller than 1.
+    """
+    if maxSplits < 1:
+        raise ValueError(f"Maximum number of splits must be at least 1, got {maxSplits}")
+    if grouping == TransactionGrouping.NONE:
+        return [[index] for index, _ in enumerate(transactions)]
+
+    groupKey = GROUP_KEYS[grouping]
+    openGroups: Dict[Hashable, List[int]] = {}
+    groups: List[List[int]] = []
+    for index, transaction in enumerate(transactions):
+        key = groupKey(transaction)
+        group = openGroups.get(key)
+        if group is None or len(group) >= maxSplits:
+            group = openGroups[key] = []
+            groups.append(group)
+        group.append(index)
+    return groups
+
+
+def selectSplits(payload: Dict[str, Any], positions: List[int]) -> Dict[str, Any]:
+    """Narrow a transaction group payload down to some of its splits.
+
+    Used to post the remaining splits of a group again after Firefly III rejected
+    others, without building their payloads again. The group title is the description
+    of the first remaining split, as for a group built from the remaining transactions.
+
+    Args:
+        payload (Dict[str, Any]): Transaction group payload, e.g. from `PayloadFactory.postTransactionGroup`.
+        positions (List[int]): Positions of the splits to keep, in split order.
+
+    Returns:
+        Dict[str, Any]: Payload with only the selected splits.
+    """
+    splits = [payload["transactions"][position] for position in positions]
+    selected = {key: value for key, value in payload.items() if key not in ("transactions", "group_title")}
+    selected["transactions"] = splits
+    if len(splits) > 1:
+        selected["group_title"] = splits[0]["description"]
+    return selected
 
 
 class PayloadFactory:
@@ -108,7 +206,7 @@ class PayloadFactory:
     def postTransaction(
         self,
         type: str,
-        date: str,
+        date: Union[str, dt.datetime],
         amount: Union[str, float],
         description: str,
         source_name: Optional[str] = None,
@@ -161,7 +259,7 @@ class PayloadFactory:
 
         Args:
             type (str): Transaction type ("withdrawal", "deposit").
-            date (str): Transaction date in ISO 8601 format.
+            date (Union[str, dt.datetime]): Transaction date. Datetimes are formatted in ISO 8601.
             amount (Union[str, float]): Transaction amount.
             description (str): Transaction description.
             source_name (Optional[str]): Source account name. Defaults to None.
@@ -212,7 +310,7 @@ class PayloadFactory:
         # Build the transaction object
         transaction: dict[str, Any] = {
             "type": type,
-            "date": date,
+            "date": toIsoFormat(date),
             "amount": str(amount),
             "description": description,
             "order": order,
@@ -319,6 +417,36 @@ class PayloadFactory:
 
         return payload
 
+    def postTransactionGroup(
+        self,
+        transactions: List[BaseTransaction],
+        group_title: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Build a payload with several transactions as splits of one transaction group.
+
+        The splits are identical to the single transaction payloads, so that duplicate
+        hashes do not depend on how transactions are grouped.
+
+        Args:
+            transactions (List[BaseTransaction]): Transactions to post as splits, in split order.
+            group_title (Optional[str]): Title of the transaction group. Firefly III requires a title
+                for groups with more than one split. Defaults to the description of the first split.
+
+        Returns:
+            dict[str, Any]: API payload with one split per transaction.
+
+        Raises:
+            ValueError: If no transactions are given.
+        """
+        if not transactions:
+            raise ValueError("A transaction group requires at least one transaction")
+
+        payload = self._toTransactionPayload(transactions[0])
+        payload["transactions"] += [self._toTransactionPayload(transaction)["transactions"][0] for transaction in transactions[1:]]
+        if len(transactions) > 1:
+            payload["group_title"] = group_title or transactions[0].description
+        return payload
+
     def postAccount(
         self,
         name: str,
@@ -549,6 +677,52 @@ class PayloadFactory:
         """
         return {"limit": limit, "page": page}
 
+    def getCurrencies(
+        self,
+        limit: int = 100,
+        page: int = 1,
+    ) -> dict[str, Any]:
+        """Build query parameters for listing currencies.
+
+        Constructs parameters for a GET request to the Firefly III currencies endpoint
+        (/v1/currencies).
+
+        Args:
+            limit (int): Number of items per page. Defaults to 100.
+            page (int): Page number. Defaults to 1.
+
+        Returns:
+            dict[str, Any]: Query parameters dictionary.
+        """
+        return {"limit": limit, "page": page}
+
+    def searchTransactions(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """Build query parameters for searching transactions.
+
+        Constructs parameters for a GET request to the Firefly III transaction search
+        endpoint (/v1/search/transactions). Only non-None parameters are included.
+
+        Args:
+            query (str): Search query using the Firefly III search operators, e.g.
+                "updated_at_after:2025-07-01".
+            limit (Optional[int]): Number of items per page. Defaults to None.
+            page (Optional[int]): Page number for pagination. Defaults to None.
+
+        Returns:
+            dict[str, Any]: Query parameters dictionary.
+        """
+        params: dict[str, Any] = {"query": query}
+        if limit is not None:
+            params["limit"] = limit
+        if page is not None:
+            params["page"] = page
+        return params
+
     def postRule(
         self,
         title: str,
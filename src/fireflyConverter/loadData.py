@@ -1,14 +1,18 @@
 import abc
 import dataclasses as dc
 import enum
+import logging
 from types import NoneType, UnionType
 from typing import Any, Callable, Dict, List, Optional, Tuple, get_args
+from zoneinfo import ZoneInfoNotFoundError
 
 import numpy as np
 import pandas as pd
 
 from fireflyConverter import data
 
+logger = logging.getLogger(__name__)
+
 
 class Fields(enum.IntEnum):
     """Enumeration of supported transaction field positions.
@@ -41,13 +45,16 @@ class DataLoader(abc.ABC):
     field mapping, type conversion, and filtering of transaction data.
     """
 
-    def __init__(self, dataPath: str, **kwargs):
+    def __init__(self, dataPath: str, timezone: Optional[str] = None, **kwargs):
         """Initialize the data loader with the path to the data file.
 
         Args:
             dataPath (str): Filesystem path to the data file to be loaded.
+            timezone (Optional[str]): IANA timezone assigned to dates without UTC offset.
+                Defaults to None (such dates stay naive and are interpreted by the server).
         """
         self._dataPath = dataPath
+        self._timezone = data.resolveTimezone(timezone)
 
         self._fieldTypes: List[type] = []
         for field in dc.fields(data.BaseTransaction):
@@ -59,11 +66,27 @@ class DataLoader(abc.ABC):
                     assert len(unionTypes) == 2 and unionTypes[1] is NoneType, "Second type in BaseTransaction field union must be NoneType"
                     self._fieldTypes.insert(Fields[field.name].value, unionTypes[0])
 
+        # Dates are kept as strings while merging source columns and parsed once afterwards
+        self._fieldTypes[Fields.date] = str
+
         self._fieldAliases: Dict[str, Fields] = {field.name: field for field in Fields}
-        self._dependentFields: Dict[Fields, Callable[[Dict], Any]] = {}
+        self._dependentFields: Dict[Fields, Callable[[Dict], Any]] = {
+            Fields.date: lambda transactionData: self._parseDate(transactionData[Fields.date.name]),
+        }
         self._fieldFilters: List[Callable[[str], str]] = [lambda content: content for _ in Fields]
         self._fieldMergeSep = " - "  # Separator used when merging multiple entries into one field
 
+    def _parseDate(self, content: str) -> pd.Timestamp:
+        """Parse the merged date field into a timestamp.
+
+        Args:
+            content (str): Date field content after filtering and merging.
+
+        Returns:
+            pd.Timestamp: Parsed date, localized to the loader timezone if it has no UTC offset.
+        """
+        return data.toTimestamp(content, self._timezone)
+
     @abc.abstractmethod
     def load(self) -> List[data.BaseTransaction]:
         """Load and parse data from the source file into `self._transactions`.
@@ -279,20 +302,22 @@ class DataLoaderUncommon:
         Args:
             accountName (str): Name of the account for source/destination mapping.
         """
-        self._dependentFields = {
-            Fields.type: lambda transactionData: (
-                data.TransactionType.WITHDRAWAL.value
-                if float(transactionData[Fields.amount.name]) < 0
-                else data.TransactionType.DEPOSIT.value
-            ),
-            Fields.source_name: lambda transactionData: (
-                accountName if float(transactionData[Fields.amount.name]) < 0 else None
-            ),
-            Fields.destination_name: lambda transactionData: (
-                accountName if float(transactionData[Fields.amount.name]) >= 0 else None
-            ),
-            Fields.amount: lambda transactionData: abs(float(transactionData[Fields.amount.name])),
-        }
+        self._dependentFields.update(
+            {
+                Fields.type: lambda transactionData: (
+                    data.TransactionType.WITHDRAWAL.value
+                    if float(transactionData[Fields.amount.name]) < 0
+                    else data.TransactionType.DEPOSIT.value
+                ),
+                Fields.source_name: lambda transactionData: (
+                    accountName if float(transactionData[Fields.amount.name]) < 0 else None
+                ),
+                Fields.destination_name: lambda transactionData: (
+                    accountName if float(transactionData[Fields.amount.name]) >= 0 else None
+                ),
+                Fields.amount: lambda transactionData: abs(float(transactionData[Fields.amount.name])),
+            }
+        )
 
 
 class DataLoaderPaypal(DataLoaderCsv, DataLoaderUncommon):
@@ -300,6 +325,7 @@ class DataLoaderPaypal(DataLoaderCsv, DataLoaderUncommon):
 
     Specializes DataLoaderCsv for PayPal's CSV format, handling German-formatted
     numbers and currency symbols, and mapping PayPal transaction amounts to source/destination accounts.
+    The transaction date is combined from the date, time and timezone columns.
     """
 
     def __init__(self, dataPath: str, accountName: Optional[str] = None, **kwargs):
@@ -318,12 +344,34 @@ class DataLoaderPaypal(DataLoaderCsv, DataLoaderUncommon):
             "Absender E-Mail-Adresse": Fields.description,
             "Name": Fields.description,
             "Datum": Fields.date,
+            "Uhrzeit": Fields.date,
+            "Zeitzone": Fields.date,
             "Brutto": Fields.amount,
         }
         # Convert German-formatted numbers (e.g., "1.234,56 €") to standard float format ("1234.56")
         self._fieldFilters[Fields.amount] = lambda content: content.replace('"', "").replace(",", ".")
         self._fieldFilters[Fields.date] = lambda content: "-".join(str(content).split("T")[0].split(".")[::-1])
 
+    def _parseDate(self, content: str) -> pd.Timestamp:
+        """Parse the merged date, time and timezone columns of a PayPal export.
+
+        Args:
+            content (str): Merged date field, e.g. "2025-07-04 - 21:34:24 - Europe/Berlin".
+
+        Returns:
+            pd.Timestamp: Parsed date in the timezone given by the export, or the loader
+                timezone if the timezone column is empty or unknown.
+        """
+        parts = content.split(self._fieldMergeSep)
+        timezone = self._timezone
+        if len(parts) > 1 and not parts[-1][:1].isdigit():
+            name = parts.pop().strip()
+            try:
+                timezone = data.resolveTimezone(name) if name else self._timezone
+            except (ZoneInfoNotFoundError, ValueError):
+                logger.warning(f"Unknown timezone '{name}', assuming {self._timezone or 'the server timezone'}")
+        return data.toTimestamp(" ".join(parts), timezone)
+
 
 class DataLoaderBarclays(DataLoaderXlsx, DataLoaderUncommon):
     """Data loader for Barclays Excel exports.
@@ -0,0 +1,169 @@
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fireflyConverter import data
+from fireflyConverter.fireflyPayload import PayloadFactory
+
+logger = logging.getLogger(__name__)
+
+# Input positions and payload of a transaction group ready to be posted
+PreparedGroup = Tuple[List[int], Dict[str, Any]]
+
+# Fields every transaction needs to be posted
+REQUIRED_FIELDS: Tuple[str, ...] = ("date", "amount", "description", "type")
+
+# Accounts that have to be named or referenced by ID per transaction type
+REQUIRED_ACCOUNTS: Dict[str, Tuple[str, ...]] = {
+    "withdrawal": ("source",),
+    "deposit": ("destination",),
+    "transfer": ("source", "destination"),
+}
+
+
+def validateTransaction(transaction: data.BaseTransaction) -> List[str]:
+    """Check a transaction for errors Firefly III would reject it for.
+
+    Args:
+        transaction (data.BaseTransaction): Transaction to check.
+
+    Returns:
+        List[str]: Description of each problem, empty if the transaction is valid.
+    """
+    problems = [f"Missing {field}" for field in REQUIRED_FIELDS if getattr(transaction, field, None) in (None, "")]
+    try:
+        amount = float(transaction.amount)
+    except (TypeError, ValueError):
+        amount = None
+        if transaction.amount not in (None, ""):
+            problems.append(f"Invalid amount: {transaction.amount}")
+    if amount is not None and not amount > 0:
+        problems.append(f"Amount must be positive, got {transaction.amount}")
+    for side in REQUIRED_ACCOUNTS.get(transaction.type, ()):
+        if getattr(transaction, f"{side}_name") is None and getattr(transaction, f"{side}_id") is None:
+            problems.append(f"Missing {side} account")
+    return problems
+
+
+def _buildGroup(
+    factory: PayloadFactory, group: Tuple[List[int], List[data.BaseTransaction]]
+) -> Tuple[List[int], Optional[Dict[str, Any]], List[Tuple[int, str]]]:
+    """Validate the transactions of a group and build the payload of the valid ones.
+
+    Defined at module level so it can be sent to worker processes.
+
+    Args:
+        factory (PayloadFactory): Factory building the payload.
+        group (Tuple[List[int], List[data.BaseTransaction]]): Input positions and transactions of the group.
+
+    Returns:
+        Tuple[List[int], Optional[Dict[str, Any]], List[Tuple[int, str]]]: Input positions and
+            payload of the valid transactions, None if there are none, and the position and
+            problems of each invalid transaction.
+    """
+    indices, transactions = group
+    valid: List[Tuple[int, data.BaseTransaction]] = []
+    invalid: List[Tuple[int, str]] = []
+    for index, transaction in zip(indices, transactions):
+        problems = validateTransaction(transaction)
+        if problems:
+            invalid.append((index, "; ".join(problems)))
+        else:
+            valid.append((index, transaction))
+    payload = factory.postTransactionGroup([transaction for _, transaction in valid]) if valid else None
+    return [index for index, _ in valid], payload, invalid
+
+
+class PayloadPipeline:
+    """Stage building and validating the payloads of a batch before any request is sent.
+
+    All payloads are built up front, optionally in a pool of worker processes, so the
+    network stage only sends ready-made bodies. Invalid transactions are reported
+    without a request. The payloads can be spilled to a JSON Lines file and streamed
+    back from it, which keeps them out of memory and leaves a record of what was sent.
+
+    Attributes:
+        _processes (int): Number of worker processes building payloads, 0 builds them in the calling thread.
+        _payloadFile (Optional[str]): JSON Lines file the payloads are spilled to.
+    """
+
+    def __init__(self, processes: int = 0, payloadFile: Optional[str] = None):
+        """Configure the stage.
+
+        Args:
+            processes (int): Number of worker processes building payloads. Defaults to 0,
+                building them in the calling thread.
+            payloadFile (Optional[str]): JSON Lines file the payloads are spilled to. Defaults
+                to None (kept in memory).
+
+        Raises:
+            ValueError: If processes is negative.
+        """
+        if processes < 0:
+            raise ValueError(f"Number of processes must not be negative, got {processes}")
+        self._processes = processes
+        self._payloadFile = payloadFile
+
+    def prepare(
+        self, factory: PayloadFactory, groups: Iterable[Tuple[List[int], List[data.BaseTransaction]]]
+    ) -> Tuple[Iterable[PreparedGroup], List[Tuple[int, str]]]:
+        """Validate the transactions and build the payload of each group.
+
+        Args:
+            factory (PayloadFactory): Factory building the payloads.
+            groups (Iterable[Tuple[List[int], List[data.BaseTransaction]]]): Input positions and
+                transactions of each group.
+
+        Returns:
+            Tuple[Iterable[PreparedGroup], List[Tuple[int, str]]]: Input positions and payload of
+                each group, and the position and problems of each invalid transaction.
+        """
+        groups = list(groups)
+        if self._processes > 0 and len(groups) > 1:
+            chunksize = max(1, len(groups) // (4 * self._processes))
+            with ProcessPoolExecutor(max_workers=self._processes) as executor:
+                built = list(executor.map(_buildGroup, [factory] * len(groups), groups, chunksize=chunksize))
+        else:
+            built = [_buildGroup(factory, group) for group in groups]
+
+        prepared: List[PreparedGroup] = [(indices, payload) for indices, payload, _ in built if payload is not None]
+        invalid = [problem for _, _, problems in built for problem in problems]
+        logger.info(f"Prepared {len(prepared)} payloads, {len(invalid)} transactions failed validation")
+        if self._payloadFile is None:
+            return prepared, invalid
+        writePayloads(self._payloadFile, prepared)
+        return readPayloads(self._payloadFile), invalid
+
+
+def writePayloads(path: str, prepared: Iterable[PreparedGroup]) -> None:
+    """Write prepared payloads to a JSON Lines file, one group per line.
+
+    Args:
+        path (str): Path of the file.
+        prepared (Iterable[PreparedGroup]): Input positions and payload of each group.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        for indices, payload in prepared:
+            file.write(json.dumps({"indices": indices, "payload": payload}, default=str) + "\n")
+    logger.debug(f"Spilled payloads to {path}")
+
+
+def readPayloads(path: str) -> Iterator[PreparedGroup]:
+    """Stream prepared payloads from a JSON Lines file.
+
+    Args:
+        path (str): Path of the file.
+
+    Yields:
+        PreparedGroup: Input positions and payload of each group.
+    """
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                entry = json.loads(line)
+                yield entry["indices"], entry["payload"]
@@ -0,0 +1,666 @@
+import abc
+import ast
+import dataclasses as dc
+import functools
+import logging
+import operator
+import tomllib
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fireflyConverter import data
+
+logger = logging.getLogger(__name__)
+
+# Columns that may be referenced by queries
+QUERY_COLUMNS: FrozenSet[str] = frozenset(field.name for field in dc.fields(data.GetTransaction))
+
+COMPARISON_OPERATORS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+# Mirrored operators used when the literal is on the left-hand side of a comparison
+MIRRORED_OPERATORS: Dict[type, type] = {
+    ast.Eq: ast.Eq,
+    ast.NotEq: ast.NotEq,
+    ast.Lt: ast.Gt,
+    ast.LtE: ast.GtE,
+    ast.Gt: ast.Lt,
+    ast.GtE: ast.LtE,
+}
+
+# Supported `column.str.<method>` predicates and their accepted keyword arguments
+STRING_METHODS: Dict[str, Tuple[str, ...]] = {
+    "contains": ("pat", "case", "na", "regex", "flags"),
+    "startswith": ("pat", "na"),
+    "endswith": ("pat", "na"),
+    "match": ("pat", "case", "na", "flags"),
+    "fullmatch": ("pat", "case", "na", "flags"),
+}
+
+NULL_METHODS: Dict[str, bool] = {"isna": False, "isnull": False, "notna": True, "notnull": True}
+
+# Comparison operators that can be resolved by a sorted index
+RANGE_OPERATORS: FrozenSet[str] = frozenset({"Eq", "Lt", "LtE", "Gt", "GtE"})
+
+
+class QueryCompileError(ValueError):
+    """Raised when a query expression is invalid."""
+
+
+class UnsupportedQueryError(QueryCompileError):
+    """Raised when a valid pandas query uses constructs the compiler does not support."""
+
+
+class SortedIndex:
+    """Sorted index over a column for resolving range predicates by binary search.
+
+    Range comparisons on the indexed column resolve to a contiguous slice of the
+    sorted positions, located with ``np.searchsorted``, instead of a comparison
+    against every row. Missing values are kept at the end of the sort order and
+    never match.
+
+    Attributes:
+        _order (np.ndarray): Row positions in ascending order of the column values.
+        _sorted (np.ndarray): Column values in ascending order without missing values.
+        _toKey (Callable[[Any], Any]): Converts query literals to the index value type.
+    """
+
+    def __init__(self, values: np.ndarray, toKey: Callable[[Any], Any] = lambda value: value):
+        """Build the index by sorting the column values.
+
+        Args:
+            values (np.ndarray): Column values in row order.
+            toKey (Callable[[Any], Any]): Converts query literals to the index value type.
+                Defaults to the identity.
+        """
+        self._order = np.argsort(values, kind="stable")
+        sortedValues = values[self._order]
+        valid = int((~pd.isna(sortedValues)).sum())
+        self._sorted = sortedValues[:valid]
+        self._size = len(values)
+        self._toKey = toKey
+
+    @classmethod
+    def forDates(cls, series: pd.Series) -> "SortedIndex":
+        """Build an index over date values with native datetime keys.
+
+        The dates are indexed as UTC datetime64 values. Literals without UTC offset
+        are interpreted in the timezone of the column.
+
+        Args:
+            series (pd.Series): Column of ISO 8601 date strings or datetimes.
+
+        Returns:
+            SortedIndex: Index over datetime64 values.
+        """
+        timezone = getattr(series.dtype, "tz", None) or "UTC"
+        dates = pd.to_datetime(series, format="ISO8601", errors="coerce", utc=True)
+
+        def toKey(value: Any) -> np.datetime64:
+            return toColumnTimestamp(value, timezone).tz_convert("UTC").tz_localize(None).to_datetime64()
+
+        return cls(dates.dt.tz_localize(None).to_numpy(), toKey)
+
+    def select(self, comparisons: Sequence["Comparison"]) -> np.ndarray:
+        """Resolve a conjunction of range comparisons on the indexed column.
+
+        Args:
+            comparisons (Sequence[Comparison]): Comparisons with operators in RANGE_OPERATORS.
+
+        Returns:
+            np.ndarray: Boolean mask of the rows satisfying all comparisons.
+        """
+        start, stop = 0, len(self._sorted)
+        for comparison in comparisons:
+            key = self._toKey(comparison.value)
+            if comparison.operator in ("Gt", "GtE", "Eq"):
+                side = "right" if comparison.operator == "Gt" else "left"
+                start = max(start, int(np.searchsorted(self._sorted, key, side=side)))
+            if comparison.operator in ("Lt", "LtE", "Eq"):
+                side = "left" if comparison.operator == "Lt" else "right"
+                stop = min(stop, int(np.searchsorted(self._sorted, key, side=side)))
+
+        mask = np.zeros(self._size, dtype=bool)
+        if start < stop:
+            mask[self._order[start:stop]] = True
+        return mask
+
+    def canResolve(self, comparison: "Comparison") -> bool:
+        """Check whether a comparison can be resolved by the index.
+
+        Args:
+            comparison (Comparison): Comparison on the indexed column.
+
+        Returns:
+            bool: True if the operator is a range operator and the literal converts to a key.
+        """
+        if comparison.operator not in RANGE_OPERATORS:
+            return False
+        try:
+            self._toKey(comparison.value)
+        except (TypeError, ValueError):
+            return False
+        return True
+
+
+# Sorted indexes keyed by column name
+Indexes = Dict[str, SortedIndex]
+
+
+def toColumnTimestamp(value: Any, timezone: Any) -> pd.Timestamp:
+    """Convert a query literal to a timestamp comparable with a datetime column.
+
+    Args:
+        value (Any): Date literal, e.g. "2025-01-01".
+        timezone (Any): Timezone of the column, or None for naive columns.
+
+    Returns:
+        pd.Timestamp: Timestamp in the timezone of the column.
+    """
+    timestamp = pd.Timestamp(value)
+    if timezone is None:
+        return timestamp.tz_convert(None) if timestamp.tzinfo is not None else timestamp
+    if timestamp.tzinfo is None:
+        return timestamp.tz_localize(timezone)
+    return timestamp.tz_convert(timezone)
+
+
+class Query(abc.ABC):
+    """Executable query expression evaluated against a transaction DataFrame.
+
+    Attributes:
+        expression (str): Source expression of the query.
+    """
+
+    expression: str
+
+    @abc.abstractmethod
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        """Evaluate the query into a boolean mask.
+
+        Args:
+            dataframe (pd.DataFrame): Transaction DataFrame.
+            indexes (Optional[Indexes]): Sorted column indexes used to resolve range
+                predicates. Defaults to None.
+
+        Returns:
+            np.ndarray: Boolean mask with one entry per row.
+        """
+
+
+class Node(abc.ABC):
+    """Node of a compiled query expression tree."""
+
+    @abc.abstractmethod
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        """Evaluate the node into a boolean mask.
+
+        Args:
+            dataframe (pd.DataFrame): Transaction DataFrame.
+            indexes (Optional[Indexes]): Sorted column indexes used to resolve range
+                predicates. Defaults to None.
+
+        Returns:
+            np.ndarray: Boolean mask with one entry per row.
+        """
+
+
+@dc.dataclass(frozen=True)
+class Comparison(Node):
+    """Comparison of a column with a literal value, e.g. ``amount > 100``.
+
+    Attributes:
+        column (str): Compared column.
+        operator (str): Name of the comparison operator class (e.g. "Gt").
+        value (Any): Literal the column is compared with.
+    """
+
+    column: str
+    operator: str
+    value: Any
+
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        index = indexes.get(self.column) if indexes else None
+        if index is not None and index.canResolve(self):
+            return index.select([self])
+
+        compare = COMPARISON_OPERATORS[getattr(ast, self.operator)]
+        series = dataframe[self.column]
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            # Datetime columns compare as integers against the literal converted to the column timezone
+            value = toColumnTimestamp(self.value, getattr(series.dtype, "tz", None))
+            return np.asarray(compare(series, value), dtype=bool)
+
+        values = series.to_numpy()
+        if values.dtype != object:
+            return np.asarray(compare(values, self.value), dtype=bool)
+
+        # Object columns may contain missing values, which never match an ordering
+        present = series.notna().to_numpy()
+        mask = np.full(len(values), self.operator == "NotEq")
+        if present.any():
+            mask[present] = np.asarray(compare(values[present], self.value), dtype=bool)
+        return mask
+
+
+@dc.dataclass(frozen=True)
+class Membership(Node):
+    """Membership test of a column in a list of literals, e.g. ``type in ['deposit']``.
+
+    Attributes:
+        column (str): Tested column.
+        values (Tuple[Any, ...]): Accepted values.
+        negate (bool): Whether the test is negated (``not in``).
+    """
+
+    column: str
+    values: Tuple[Any, ...]
+    negate: bool = False
+
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        mask = dataframe[self.column].isin(self.values).to_numpy(dtype=bool)
+        return ~mask if self.negate else mask
+
+
+@dc.dataclass(frozen=True)
+class StringMethod(Node):
+    """Vectorized string predicate, e.g. ``description.str.contains('Tax', case=False)``.
+
+    Missing values evaluate to the ``na`` argument, which defaults to False. Datetime
+    columns are matched against their ISO 8601 representation.
+
+    Attributes:
+        column (str): Tested column.
+        method (str): Name of the pandas string method.
+        arguments (Tuple[Tuple[str, Any], ...]): Keyword arguments of the call.
+    """
+
+    column: str
+    method: str
+    arguments: Tuple[Tuple[str, Any], ...]
+
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        arguments = dict(self.arguments)
+        arguments.setdefault("na", False)
+        series = dataframe[self.column]
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            series = series.map(lambda value: value.isoformat(), na_action="ignore")
+        elif series.dtype != object and not pd.api.types.is_string_dtype(series.dtype):
+            series = series.astype("string")
+        result = getattr(series.str, self.method)(**arguments)
+        return result.fillna(arguments["na"]).to_numpy(dtype=bool)
+
+
+@dc.dataclass(frozen=True)
+class NullCheck(Node):
+    """Missing-value test of a column, e.g. ``notes.isna()``.
+
+    Attributes:
+        column (str): Tested column.
+        negate (bool): Whether the test checks for present values instead.
+    """
+
+    column: str
+    negate: bool = False
+
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        mask = dataframe[self.column].isna().to_numpy(dtype=bool)
+        return ~mask if self.negate else mask
+
+
+@dc.dataclass(frozen=True)
+class BooleanColumn(Node):
+    """Boolean column used as a predicate, e.g. ``reconciled``.
+
+    Attributes:
+        column (str): Boolean column.
+    """
+
+    column: str
+
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        return dataframe[self.column].fillna(False).to_numpy(dtype=bool)
+
+
+@dc.dataclass(frozen=True)
+class Not(Node):
+    """Logical negation of a predicate.
+
+    Attributes:
+        operand (Node): Negated predicate.
+    """
+
+    operand: Node
+
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        return ~self.operand.evaluate(dataframe, indexes)
+
+
+@dc.dataclass(frozen=True)
+class And(Node):
+    """Logical conjunction of predicates.
+
+    Range comparisons on an indexed column are collected and resolved together as
+    one slice of the sorted index, e.g. both bounds of a date window.
+
+    Attributes:
+        operands (Tuple[Node, ...]): Combined predicates.
+    """
+
+    operands: Tuple[Node, ...]
+
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        ranges: Dict[str, list[Comparison]] = {}
+        remaining: list[Node] = []
+        for operand in self.operands:
+            index = indexes.get(operand.column) if indexes and isinstance(operand, Comparison) else None
+            if index is not None and index.canResolve(operand):
+                ranges.setdefault(operand.column, []).append(operand)
+            else:
+                remaining.append(operand)
+
+        mask = np.ones(len(dataframe), dtype=bool)
+        for column, comparisons in ranges.items():
+            mask &= indexes[column].select(comparisons)
+        for operand in remaining:
+            mask &= operand.evaluate(dataframe, indexes)
+        return mask
+
+
+@dc.dataclass(frozen=True)
+class Or(Node):
+    """Logical disjunction of predicates.
+
+    Attributes:
+        operands (Tuple[Node, ...]): Combined predicates.
+    """
+
+    operands: Tuple[Node, ...]
+
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        mask = self.operands[0].evaluate(dataframe, indexes)
+        for operand in self.operands[1:]:
+            mask = mask | operand.evaluate(dataframe, indexes)
+        return mask
+
+
+@dc.dataclass(frozen=True)
+class CompiledQuery(Query):
+    """Query compiled into an expression tree of column operations.
+
+    Attributes:
+        expression (str): Source expression of the query.
+        root (Node): Root node of the expression tree.
+    """
+
+    expression: str
+    root: Node
+
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        return self.root.evaluate(dataframe, indexes)
+
+
+@dc.dataclass(frozen=True)
+class PandasQuery(Query):
+    """Query evaluated by pandas for constructs the compiler does not support.
+
+    Timezone-aware columns are evaluated in their local wall time, so that date
+    literals without UTC offset have the same meaning as in compiled queries.
+
+    Attributes:
+        expression (str): Source expression of the query.
+    """
+
+    expression: str
+
+    def evaluate(self, dataframe: pd.DataFrame, indexes: Optional[Indexes] = None) -> np.ndarray:
+        return np.asarray(toWallTime(dataframe).eval(self.expression), dtype=bool)
+
+
+def toWallTime(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Replace timezone-aware columns by their naive local wall time.
+
+    Args:
+        dataframe (pd.DataFrame): Data with possibly timezone-aware datetime columns.
+
+    Returns:
+        pd.DataFrame: Data with naive datetime columns, the input if nothing changed.
+    """
+    awareColumns = [column for column, dtype in dataframe.dtypes.items() if getattr(dtype, "tz", None) is not None]
+    if not awareColumns:
+        return dataframe
+    return dataframe.assign(**{column: dataframe[column].dt.tz_localize(None) for column in awareColumns})
+
+
+class QueryCompiler:
+    """Compiler of pandas-style query expressions into expression trees.
+
+    Parses an expression with the Python parser and translates the supported subset
+    of the pandas query syntax into ``Node`` objects: comparisons of columns with
+    literals, ``in``/``not in`` lists, ``column.str.<method>(...)`` predicates,
+    ``column.isna()``-style null checks, boolean columns and the logical operators
+    ``and``/``or``/``not`` (and their bitwise forms ``&``/``|``/``~``).
+
+    Attributes:
+        _columns (FrozenSet[str]): Column names queries may reference.
+    """
+
+    def __init__(self, columns: FrozenSet[str] = QUERY_COLUMNS):
+        """Create a compiler validating column names against a set of columns.
+
+        Args:
+            columns (FrozenSet[str]): Column names queries may reference.
+                Defaults to the transaction fields.
+        """
+        self._columns = columns
+
+    def compile(self, expression: str) -> CompiledQuery:
+        """Compile a query expression.
+
+        Args:
+            expression (str): A pandas-compatible query expression.
+
+        Returns:
+            CompiledQuery: The compiled query.
+
+        Raises:
+            QueryCompileError: If the expression is not valid.
+            UnsupportedQueryError: If the expression uses unsupported constructs.
+        """
+        try:
+            tree = ast.parse(expression.strip(), mode="eval")
+        except SyntaxError as e:
+            raise QueryCompileError(f"Invalid query '{expression}': {e.msg}") from None
+
+        try:
+            return CompiledQuery(expression, self._predicate(tree.body))
+        except QueryCompileError as e:
+            raise type(e)(f"Invalid query '{expression}': {e}") from None
+
+    def _predicate(self, node: ast.expr) -> Node:
+        if isinstance(node, ast.BoolOp):
+            operands = tuple(self._predicate(value) for value in node.values)
+            return And(operands) if isinstance(node.op, ast.And) else Or(operands)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+            operands = (self._predicate(node.left), self._predicate(node.right))
+            return And(operands) if isinstance(node.op, ast.BitAnd) else Or(operands)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.Invert)):
+            return Not(self._predicate(node.operand))
+        if isinstance(node, ast.Compare):
+            return self._comparison(node)
+        if isinstance(node, ast.Call):
+            return self._call(node)
+        if isinstance(node, ast.Name):
+            return BooleanColumn(self._column(node))
+        raise UnsupportedQueryError(f"unsupported expression '{ast.unparse(node)}'")
+
+    def _comparison(self, node: ast.Compare) -> Node:
+        # Chained comparisons like `1 < amount <= 5` are split into a conjunction
+        comparisons: list[Node] = []
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            comparisons.append(self._singleComparison(left, op, right))
+            left = right
+        return comparisons[0] if len(comparisons) == 1 else And(tuple(comparisons))
+
+    def _singleComparison(self, left: ast.expr, op: ast.cmpop, right: ast.expr) -> Node:
+        if isinstance(op, (ast.In, ast.NotIn)):
+            return Membership(self._column(left), self._literalList(right), isinstance(op, ast.NotIn))
+
+        if type(op) not in COMPARISON_OPERATORS:
+            raise UnsupportedQueryError(f"unsupported operator '{type(op).__name__}'")
+
+        if isinstance(left, ast.Name) and not isinstance(right, ast.Name):
+            column, literal, opType = left, right, type(op)
+        elif isinstance(right, ast.Name) and not isinstance(left, ast.Name):
+            column, literal, opType = right, left, MIRRORED_OPERATORS[type(op)]
+        else:
+            raise UnsupportedQueryError(f"unsupported comparison '{ast.unparse(left)} ... {ast.unparse(right)}'")
+
+        if isinstance(literal, (ast.List, ast.Tuple)) and opType in (ast.Eq, ast.NotEq):
+            # pandas treats `column == [...]` as a membership test
+            return Membership(self._column(column), self._literalList(literal), opType is ast.NotEq)
+
+        value = self._literal(literal)
+        if value is None:
+            raise UnsupportedQueryError("comparisons with None are not supported, use isna() or notna()")
+        return Comparison(self._column(column), opType.__name__, value)
+
+    def _call(self, node: ast.Call) -> Node:
+        function = node.func
+        if not isinstance(function, ast.Attribute):
+            raise UnsupportedQueryError(f"unsupported call '{ast.unparse(node)}'")
+
+        # column.isna()
+        if isinstance(function.value, ast.Name) and function.attr in NULL_METHODS:
+            if node.args or node.keywords:
+                raise QueryCompileError(f"{function.attr}() takes no arguments")
+            return NullCheck(self._column(function.value), NULL_METHODS[function.attr])
+
+        # column.str.method(...)
+        accessor = function.value
+        if not (isinstance(accessor, ast.Attribute) and accessor.attr == "str" and isinstance(accessor.value, ast.Name)):
+            raise UnsupportedQueryError(f"unsupported call '{ast.unparse(node)}'")
+        column = self._column(accessor.value)
+        if function.attr not in STRING_METHODS:
+            raise UnsupportedQueryError(f"unsupported string method '{function.attr}'")
+
+        parameters = STRING_METHODS[function.attr]
+        if len(node.args) > len(parameters):
+            raise QueryCompileError(f"too many arguments for str.{function.attr}()")
+        arguments: Dict[str, Any] = dict(zip(parameters, (self._literal(arg) for arg in node.args)))
+        for keyword in node.keywords:
+            if keyword.arg not in parameters:
+                raise QueryCompileError(f"unexpected argument '{keyword.arg}' for str.{function.attr}()")
+            arguments[keyword.arg] = self._literal(keyword.value)
+        if not isinstance(arguments.get("pat"), (str, tuple)):
+            raise QueryCompileError(f"str.{function.attr}() requires a string pattern")
+        return StringMethod(column, function.attr, tuple(arguments.items()))
+
+    def _column(self, node: ast.expr) -> str:
+        if not isinstance(node, ast.Name):
+            raise UnsupportedQueryError(f"expected a column name, got '{ast.unparse(node)}'")
+        if node.id not in self._columns:
+            raise QueryCompileError(f"unknown column '{node.id}'")
+        return node.id
+
+    def _literal(self, node: ast.expr) -> Any:
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+            if isinstance(node.operand.value, (int, float)) and not isinstance(node.operand.value, bool):
+                return -node.operand.value
+        if isinstance(node, ast.Tuple):
+            return self._literalList(node)
+        raise UnsupportedQueryError(f"expected a literal, got '{ast.unparse(node)}'")
+
+    def _literalList(self, node: ast.expr) -> Tuple[Any, ...]:
+        if not isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            raise UnsupportedQueryError(f"expected a list of literals, got '{ast.unparse(node)}'")
+        return tuple(self._literal(element) for element in node.elts)
+
+
+@functools.lru_cache(maxsize=256)
+def compileQuery(expression: str, strict: bool = False) -> Query:
+    """Compile a query expression, falling back to pandas for unsupported constructs.
+
+    Args:
+        expression (str): A pandas-compatible query expression.
+        strict (bool): Raise for unsupported constructs instead of falling back to
+            pandas evaluation. Defaults to False.
+
+    Returns:
+        Query: The compiled query, or a pandas-evaluated query if the expression is
+            valid but not supported by the compiler.
+
+    Raises:
+        QueryCompileError: If the expression is invalid.
+    """
+    try:
+        return QueryCompiler().compile(expression)
+    except UnsupportedQueryError as e:
+        if strict:
+            raise
+        logger.debug(f"Falling back to pandas evaluation: {e}")
+        return PandasQuery(expression)
+
+
+def compileQueries(queries: Dict[str, str]) -> Dict[str, Query]:
+    """Compile a mapping of named query expressions.
+
+    Args:
+        queries (Dict[str, str]): Query expressions keyed by name.
+
+    Returns:
+        Dict[str, Query]: Compiled queries keyed by name.
+
+    Raises:
+        QueryCompileError: If any expression is invalid. The message names the query.
+    """
+    compiled: Dict[str, Query] = {}
+    for name, expression in queries.items():
+        if not isinstance(expression, str):
+            raise QueryCompileError(f"Query '{name}' must be a string, got {type(expression).__name__}")
+        try:
+            compiled[name] = compileQuery(expression)
+        except QueryCompileError as e:
+            raise QueryCompileError(f"Query '{name}': {e}") from None
+    return compiled
+
+
+def loadQueryFile(configPath: str) -> Tuple[Dict[str, str], Dict[str, Query]]:
+    """Load and compile the [queries] section of a TOML file.
+
+    Compiled expressions are memoized in-process by `compileQuery`, so reloading a file
+    only recompiles the queries whose expressions changed.
+
+    Args:
+        configPath (str): Path to the TOML configuration file.
+
+    Returns:
+        Tuple[Dict[str, str], Dict[str, Query]]: Query expressions and compiled queries keyed by name.
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist.
+        ValueError: If the TOML file does not contain a [queries] section.
+        QueryCompileError: If any query expression is invalid.
+    """
+    configFile = Path(configPath)
+    if not configFile.exists():
+        raise FileNotFoundError(f"Query configuration file not found: {configPath}")
+
+    config = tomllib.loads(configFile.read_text())
+    if "queries" not in config:
+        raise ValueError(f"Configuration file {configPath} must contain a [queries] section")
+
+    queries: Dict[str, str] = config["queries"]
+    return queries, compileQueries(queries)
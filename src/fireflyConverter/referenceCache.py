@@ -0,0 +1,348 @@
+import contextlib
+import enum
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Identifiers of the objects by name, a name may be shared by several objects
+ReferenceMap = Dict[str, List[Union[int, str]]]
+
+
+class ReferenceKind(enum.Enum):
+    """Kinds of reference data resolved by name.
+
+    Attributes:
+        ACCOUNTS (str): Account names to account IDs.
+        RULES (str): Rule titles to rule IDs.
+        RULE_GROUPS (str): Rule group titles to rule group IDs.
+        CURRENCIES (str): Currency codes to currency IDs.
+    """
+
+    ACCOUNTS = "accounts"
+    RULES = "rules"
+    RULE_GROUPS = "rule_groups"
+    CURRENCIES = "currencies"
+
+
+def addReference(mapping: ReferenceMap, name: str, id: Union[int, str]) -> None:
+    """Add an object to a mapping of reference data.
+
+    Args:
+        mapping (ReferenceMap): Identifiers by name, updated in place.
+        name (str): Name of the object.
+        id (Union[int, str]): ID of the object.
+    """
+    mapping.setdefault(name, []).append(id)
+
+
+def discardReference(mapping: ReferenceMap, id: Union[int, str]) -> None:
+    """Remove an object from a mapping of reference data.
+
+    Args:
+        mapping (ReferenceMap): Identifiers by name, updated in place.
+        id (Union[int, str]): ID of the object, compared as string.
+    """
+    for name, ids in list(mapping.items()):
+        remaining = [known for known in ids if str(known) != str(id)]
+        if not remaining:
+            del mapping[name]
+        elif len(remaining) < len(ids):
+            mapping[name] = remaining
+
+
+class ReferenceCache:
+    """Thread-safe cache of reference data with a time to live.
+
+    Maps the names of accounts, rule groups and currencies to their IDs, so that
+    resolving a name does not require listing the objects on every call. Entries
+    expire after the time to live and can be updated or invalidated explicitly when
+    the client itself creates or deletes objects.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups of missing or expired entries.
+        _ttl (float): Time to live of an entry in seconds.
+        _clock (Callable[[], float]): Monotonic clock in seconds.
+        _entries (Dict[ReferenceKind, Tuple[float, ReferenceMap]]): Load time and mapping per kind.
+        _lock (threading.Lock): Lock guarding the entries and counters.
+    """
+
+    def __init__(self, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        """Create an empty cache.
+
+        Args:
+            ttl (float): Time to live of an entry in seconds. Zero disables caching. Defaults to 300.
+            clock (Callable[[], float]): Monotonic clock in seconds. Defaults to time.monotonic.
+        """
+        self.hits = 0
+        self.misses = 0
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: Dict[ReferenceKind, Tuple[float, ReferenceMap]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: ReferenceKind) -> Optional[ReferenceMap]:
+        """Look up the mapping of a kind.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+
+        Returns:
+            Optional[ReferenceMap]: Cached mapping, None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(kind)
+            if entry is None or self._clock() - entry[0] >= self._ttl:
+                self.misses += 1
+                logger.debug(f"Reference cache miss for {kind.value}")
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def put(self, kind: ReferenceKind, mapping: ReferenceMap) -> None:
+        """Store a freshly loaded mapping.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+            mapping (ReferenceMap): Identifiers by name.
+        """
+        with self._lock:
+            self._entries[kind] = (self._clock(), mapping)
+
+    def add(self, kind: ReferenceKind, name: str, id: Union[int, str]) -> None:
+        """Record an object created by the client in a cached mapping.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+            name (str): Name of the object.
+            id (Union[int, str]): ID of the object.
+        """
+        with self._lock:
+            entry = self._entries.get(kind)
+            if entry is not None:
+                addReference(entry[1], name, id)
+
+    def discard(self, kind: ReferenceKind, id: Union[int, str]) -> None:
+        """Remove an object deleted by the client from a cached mapping.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+            id (Union[int, str]): ID of the object.
+        """
+        with self._lock:
+            entry = self._entries.get(kind)
+            if entry is not None:
+                discardReference(entry[1], id)
+
+    def invalidate(self, kind: Optional[ReferenceKind] = None) -> None:
+        """Drop the cached mapping of a kind.
+
+        Args:
+            kind (Optional[ReferenceKind]): Kind of reference data. Defaults to None, dropping all kinds.
+        """
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(kind, None)
+
+    @staticmethod
+    def select(kind: ReferenceKind, mapping: ReferenceMap, name: str) -> Union[int, str]:
+        """Select the ID of an object by name.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data, used in error messages.
+            mapping (ReferenceMap): Identifiers by name.
+            name (str): Name of the object.
+
+        Returns:
+            Union[int, str]: ID of the object.
+
+        Raises:
+            ValueError: If no object or several objects have the name.
+        """
+        label, attribute = REFERENCE_LABELS[kind]
+        ids = mapping.get(name, [])
+        if len(ids) == 0:
+            raise ValueError(f"No {label} found with {attribute}: {name}")
+        elif len(ids) > 1:
+            raise ValueError(f"Ambiguous {label} {attribute} '{name}': found {len(ids)} matches")
+        return ids[0]
+
+
+# Object label and name attribute of each kind used in error messages
+REFERENCE_LABELS: Dict[ReferenceKind, Tuple[str, str]] = {
+    ReferenceKind.ACCOUNTS: ("account", "name"),
+    ReferenceKind.RULES: ("rule", "title"),
+    ReferenceKind.RULE_GROUPS: ("rule group", "title"),
+    ReferenceKind.CURRENCIES: ("currency", "code"),
+}
+
+
+def defaultStorePath() -> Path:
+    """Default location of the reference store file.
+
+    Returns:
+        Path: File in the user cache directory, honouring XDG_CACHE_HOME.
+    """
+    cacheHome = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cacheHome) / "firefly-cash-converter" / "references.json"
+
+
+class ReferenceStore:
+    """Reference data persisted to a file across invocations.
+
+    Entries are stored per Firefly III instance and user, identified by the base URL
+    and a hash of the API token, so the token itself is never written to disk. The
+    store only holds the data and the version of the server listing it was loaded at;
+    revalidating an entry against the server is left to the interface loading it.
+    Entries older than the maximum age are not returned.
+
+    Attributes:
+        _path (Path): Location of the store file.
+        _key (str): Key of the entries of the instance and user.
+        _maxAge (float): Maximum age of a returned entry in seconds.
+        _clock (Callable[[], float]): Wall clock in seconds since the epoch.
+        _data (Dict[str, Dict[str, Any]]): Entries of all instances and users in the file.
+        _lock (threading.Lock): Lock guarding the entries and the file.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        base_url: str,
+        api_token: str,
+        maxAge: float = 86400.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Open a reference store file.
+
+        A missing or unreadable file is treated as an empty store.
+
+        Args:
+            path (Union[str, Path]): Location of the store file.
+            base_url (str): Base URL of the Firefly III instance.
+            api_token (str): API token of the user.
+            maxAge (float): Maximum age of a returned entry in seconds. Defaults to one day.
+            clock (Callable[[], float]): Wall clock in seconds since the epoch. Defaults to time.time.
+        """
+        self._path = Path(path)
+        tokenHash = hashlib.sha256(api_token.encode()).hexdigest()[:16]
+        self._key = f"{base_url.rstrip('/')}#{tokenHash}"
+        self._maxAge = maxAge
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self._path, encoding="utf-8") as file:
+                self._data = json.load(file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable reference store {self._path}: {e}")
+
+    @property
+    def _entries(self) -> Dict[str, Any]:
+        return self._data.setdefault(self._key, {})
+
+    def load(self, kind: ReferenceKind) -> Optional[Tuple[ReferenceMap, Optional[str]]]:
+        """Read the stored mapping of a kind.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+
+        Returns:
+            Optional[Tuple[ReferenceMap, Optional[str]]]: Copy of the stored mapping and the version
+                it was saved with, None if it is missing or too old.
+        """
+        with self._lock:
+            entry = self._entries.get(kind.value)
+            if entry is None or self._clock() - entry["saved_at"] > self._maxAge:
+                return None
+            return {name: list(ids) for name, ids in entry["mapping"].items()}, entry.get("version")
+
+    def save(self, kind: ReferenceKind, mapping: ReferenceMap, version: Optional[str] = None) -> None:
+        """Store a freshly loaded mapping.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+            mapping (ReferenceMap): Identifiers by name.
+            version (Optional[str]): Version of the server listing the mapping was loaded at.
+                Defaults to None.
+        """
+        with self._lock:
+            self._entries[kind.value] = {
+                "saved_at": self._clock(),
+                "version": version,
+                "mapping": {name: list(ids) for name, ids in mapping.items()},
+            }
+            self._write()
+
+    def add(self, kind: ReferenceKind, name: str, id: Union[int, str]) -> None:
+        """Record an object created by the client in a stored mapping.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+            name (str): Name of the object.
+            id (Union[int, str]): ID of the object.
+        """
+        with self._lock:
+            entry = self._entries.get(kind.value)
+            if entry is not None:
+                addReference(entry["mapping"], name, id)
+                self._write()
+
+    def discard(self, kind: ReferenceKind, id: Union[int, str]) -> None:
+        """Remove an object deleted by the client from a stored mapping.
+
+        Args:
+            kind (ReferenceKind): Kind of reference data.
+            id (Union[int, str]): ID of the object.
+        """
+        with self._lock:
+            entry = self._entries.get(kind.value)
+            if entry is not None:
+                discardReference(entry["mapping"], id)
+                self._write()
+
+    def clear(self, kind: Optional[ReferenceKind] = None) -> None:
+        """Drop the stored mapping of a kind.
+
+        Args:
+            kind (Optional[ReferenceKind]): Kind of reference data. Defaults to None, dropping all kinds.
+        """
+        with self._lock:
+            entries = self._entries
+            kinds = list(entries) if kind is None else [kind.value]
+            if any(name in entries for name in kinds):
+                for name in kinds:
+                    entries.pop(name, None)
+                self._write()
+
+    def _write(self) -> None:
+        """Replace the store file atomically with the current entries.
+
+        Failures are logged and otherwise ignored, as the store is only an optimization.
+        """
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tempPath = tempfile.mkstemp(dir=self._path.parent, prefix=f".{self._path.name}.")
+        except OSError as e:
+            logger.warning(f"Could not write reference store {self._path}: {e}")
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(self._data, file)
+            os.replace(tempPath, self._path)
+        except OSError as e:
+            logger.warning(f"Could not write reference store {self._path}: {e}")
+            with contextlib.suppress(OSError):
+                os.unlink(tempPath)
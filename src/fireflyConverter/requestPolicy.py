@@ -0,0 +1,286 @@
+import asyncio
+import dataclasses as dc
+import email.utils
+import logging
+import random
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Methods without side effects beyond their first execution, safe to repeat after a failure
+IDEMPOTENT_METHODS: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+
+@dc.dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before repeating a failed request.
+
+    Requests are repeated after transient failures with exponential backoff and full
+    jitter, i.e. a random delay between zero and `backoffFactor * 2 ** retry` seconds.
+    A `Retry-After` header of the response sets the minimum delay. Only idempotent
+    requests are repeated after server errors and connection failures, since the
+    server may have processed the first attempt. Rate-limited requests (429) were
+    rejected before processing and are repeated regardless of the method.
+
+    Attributes:
+        maxRetries (int): Maximum number of repetitions of a request. Defaults to 4.
+        backoffFactor (float): Base delay of the backoff in seconds. Defaults to 0.5.
+        maxDelay (float): Maximum delay before a repetition in seconds, also capping
+            `Retry-After`. Defaults to 60.
+        statuses (Tuple[int, ...]): Server error statuses repeated for idempotent requests.
+            Defaults to 502, 503 and 504.
+    """
+
+    maxRetries: int = 4
+    backoffFactor: float = 0.5
+    maxDelay: float = 60.0
+    statuses: Tuple[int, ...] = (502, 503, 504)
+
+    def retryStatus(self, status: int, idempotent: bool) -> bool:
+        """Whether a response status is worth repeating the request for.
+
+        Args:
+            status (int): HTTP status of the response.
+            idempotent (bool): Whether the request is safe to repeat.
+
+        Returns:
+            bool: True if the request should be repeated.
+        """
+        return status == 429 or (idempotent and status in self.statuses)
+
+    def delay(self, retry: int, retryAfter: Optional[str] = None) -> float:
+        """Compute the delay before a repetition.
+
+        Args:
+            retry (int): Number of the repetition, starting at 0.
+            retryAfter (Optional[str]): Value of the `Retry-After` header. Defaults to None.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        backoff = random.uniform(0.0, min(self.maxDelay, self.backoffFactor * 2**retry))
+        return min(self.maxDelay, max(backoff, parseRetryAfter(retryAfter)))
+
+
+def parseRetryAfter(value: Optional[str], now: Optional[float] = None) -> float:
+    """Parse the value of a `Retry-After` header.
+
+    Args:
+        value (Optional[str]): Delay in seconds or HTTP date.
+        now (Optional[float]): Current time in seconds since the epoch. Defaults to the system time.
+
+    Returns:
+        float: Delay in seconds, 0 if the value is missing or invalid.
+    """
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.debug(f"Ignoring invalid Retry-After header: {value}")
+        return 0.0
+    return max(0.0, date.timestamp() - (time.time() if now is None else now))
+
+
+class TokenBucket:
+    """Client-side pacing of requests with a token bucket.
+
+    The bucket holds up to `capacity` tokens and refills at `rate` tokens per second.
+    Every request takes one token; if none is left, the request waits until its token
+    has been refilled. Reservations are thread-safe and may be awaited by asyncio code,
+    since `reserve` returns the delay instead of sleeping.
+
+    Attributes:
+        _rate (float): Refill rate in tokens per second.
+        _capacity (float): Maximum number of tokens, i.e. the size of a burst.
+        _tokens (float): Available tokens, negative if requests are queued.
+        _updated (float): Time of the last refill.
+        _clock (Callable[[], float]): Monotonic clock in seconds.
+        _lock (threading.Lock): Lock guarding the tokens.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """Create a full bucket.
+
+        Args:
+            rate (float): Requests per second.
+            capacity (Optional[float]): Size of a burst. Defaults to one second of requests, at least 1.
+            clock (Callable[[], float]): Monotonic clock in seconds. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If rate is not positive.
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate limit must be positive, got {rate}")
+        self._rate = rate
+        self._capacity = max(1.0, rate) if capacity is None else capacity
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token for a request.
+
+        Returns:
+            float: Delay in seconds until the request may be sent.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+
+class AdaptiveLimiter:
+    """Adaptive limit on the number of concurrent requests (AIMD).
+
+    Requests take a slot before being sent and return it with their outcome. While the
+    latency stays close to the lowest latency observed, every request completed at the
+    full limit raises the limit by 1/limit, i.e. by one slot per round of requests. If the
+    smoothed latency exceeds `tolerance` times the lowest latency, or the server answers
+    with a server error or 429 or cannot be reached, the limit is multiplied by `backoff`.
+    It is reduced at most once per round: outcomes of requests sent before the last
+    reduction do not reduce it again.
+
+    Slots are thread-safe and may be awaited by asyncio code through `acquireAsync`.
+
+    Attributes:
+        _limit (float): Current limit, the number of slots is its integer part.
+        _minimum (int): Lowest limit.
+        _maximum (int): Highest limit.
+        _tolerance (float): Factor of the lowest latency regarded as rising latency.
+        _backoff (float): Factor the limit is multiplied with on overload.
+        _inFlight (int): Number of taken slots.
+        _baseline (Optional[float]): Lowest latency observed, slowly following the current latency.
+        _smoothed (Optional[float]): Exponentially smoothed latency.
+        _reduced (float): Time of the last reduction.
+        _peak (int): Highest number of slots taken at once.
+        _clock (Callable[[], float]): Monotonic clock in seconds.
+    """
+
+    def __init__(
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 32,
+        tolerance: float = 2.0,
+        backoff: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create a limiter.
+
+        Args:
+            initial (int): Initial limit. Defaults to 2.
+            minimum (int): Lowest limit. Defaults to 1.
+            maximum (int): Highest limit. Defaults to 32.
+            tolerance (float): Factor of the lowest latency regarded as rising latency. Defaults to 2.
+            backoff (float): Factor the limit is multiplied with on overload. Defaults to 0.5.
+            clock (Callable[[], float]): Monotonic clock in seconds. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If the limits are not ordered 1 <= minimum <= maximum, tolerance is not
+                above 1 or backoff is not between 0 and 1.
+        """
+        if not 1 <= minimum <= maximum:
+            raise ValueError(f"Limits must satisfy 1 <= minimum <= maximum, got {minimum} and {maximum}")
+        if tolerance <= 1.0:
+            raise ValueError(f"Latency tolerance must be above 1, got {tolerance}")
+        if not 0.0 < backoff < 1.0:
+            raise ValueError(f"Backoff factor must be between 0 and 1, got {backoff}")
+        self._minimum = minimum
+        self._maximum = maximum
+        self._limit = float(min(maximum, max(minimum, initial)))
+        self._tolerance = tolerance
+        self._backoff = backoff
+        self._clock = clock
+        self._inFlight = 0
+        self._peak = 0
+        self._baseline: Optional[float] = None
+        self._smoothed: Optional[float] = None
+        self._reduced = float("-inf")
+        self._condition = threading.Condition()
+        self._waiters: List[asyncio.Future] = []
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent requests allowed."""
+        return int(self._limit)
+
+    @property
+    def peak(self) -> int:
+        """Highest number of concurrent requests so far."""
+        return self._peak
+
+    def _tryAcquire(self) -> Optional[float]:
+        if self._inFlight >= int(self._limit):
+            return None
+        self._inFlight += 1
+        self._peak = max(self._peak, self._inFlight)
+        return self._clock()
+
+    def acquire(self) -> float:
+        """Take a slot, waiting until one is free.
+
+        Returns:
+            float: Time the slot was taken, to be passed to `release`.
+        """
+        with self._condition:
+            while (acquired := self._tryAcquire()) is None:
+                self._condition.wait()
+            return acquired
+
+    async def acquireAsync(self) -> float:
+        """Take a slot, awaiting until one is free.
+
+        Returns:
+            float: Time the slot was taken, to be passed to `release`.
+        """
+        while True:
+            with self._condition:
+                acquired = self._tryAcquire()
+                if acquired is not None:
+                    return acquired
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+            await waiter
+
+    def release(self, acquired: float, overloaded: bool = False) -> None:
+        """Return a slot and adapt the limit to the outcome of its request.
+
+        Args:
+            acquired (float): Time the slot was taken, as returned by `acquire`.
+            overloaded (bool): Whether the server answered with a server error or 429 or
+                could not be reached. Defaults to False.
+        """
+        with self._condition:
+            latency = self._clock() - acquired
+            atLimit = self._inFlight >= int(self._limit)
+            self._inFlight -= 1
+            if not overloaded:
+                self._baseline = latency if self._baseline is None else min(latency, self._baseline * 1.01)
+                self._smoothed = latency if self._smoothed is None else 0.8 * self._smoothed + 0.2 * latency
+                overloaded = self._smoothed > self._tolerance * self._baseline
+            if overloaded and acquired >= self._reduced:
+                self._limit = max(float(self._minimum), self._limit * self._backoff)
+                self._reduced = self._clock()
+                self._smoothed = self._baseline
+                logger.debug(f"Reduced concurrency limit to {self.limit}")
+            elif not overloaded and atLimit:
+                self._limit = min(float(self._maximum), self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
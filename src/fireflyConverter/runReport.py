@@ -0,0 +1,204 @@
+import collections
+import contextlib
+import dataclasses as dc
+import heapq
+import json
+import logging
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Percentiles of the request latency included in the report
+PERCENTILES: Sequence[int] = (50, 95, 99)
+
+
+@dc.dataclass(frozen=True)
+class RequestSample:
+    """Measurement of a single attempt of a request.
+
+    Attributes:
+        method (str): HTTP method.
+        endpoint (str): Path relative to the API URL with object IDs replaced by "{id}", e.g. "/rules/{id}".
+        status (Optional[int]): Status of the response, None if the attempt failed without a response.
+        latency (float): Time until the response was received in seconds.
+        sent (int): Size of the request body in bytes.
+        received (int): Size of the response body in bytes.
+        retry (int): Number of the repetition, 0 for the first attempt.
+    """
+
+    method: str
+    endpoint: str
+    status: Optional[int]
+    latency: float
+    sent: int = 0
+    received: int = 0
+    retry: int = 0
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Compute a percentile with linear interpolation between the closest ranks.
+
+    Args:
+        values (Sequence[float]): Sorted values.
+        q (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The percentile, 0 if there are no values.
+    """
+    if not values:
+        return 0.0
+    rank = (len(values) - 1) * q / 100
+    lower = math.floor(rank)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+class RunRecorder:
+    """Thread-safe collector of the requests, stage timings and outcomes of a run.
+
+    Attach it to an interface (see `FireflyInterface.recorder`) to record every attempt
+    of every request. The report summarizes the run as a JSON-compatible dictionary with
+    throughput, latency percentiles per method, the slowest requests, counts by outcome,
+    transferred bytes and the time spent per stage.
+
+    Attributes:
+        _clock (Callable[[], float]): Monotonic clock in seconds.
+        _slowest (int): Number of slowest requests kept for the report.
+        _samples (List[RequestSample]): Recorded request attempts.
+        _outcomes (collections.Counter): Number of transactions by outcome.
+        _stages (Dict[str, float]): Time spent per stage in seconds.
+        _gauges (Dict[str, float]): Last value of each gauge, e.g. the settled concurrency.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter, slowest: int = 10):
+        """Start recording a run.
+
+        Args:
+            clock (Callable[[], float]): Monotonic clock in seconds. Defaults to time.perf_counter.
+            slowest (int): Number of slowest requests kept for the report. Defaults to 10.
+        """
+        self._clock = clock
+        self._slowest = slowest
+        self._lock = threading.Lock()
+        self._samples: List[RequestSample] = []
+        self._outcomes: collections.Counter = collections.Counter()
+        self._stages: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+        self._started = clock()
+        self._startedAt = datetime.now(timezone.utc)
+
+    def recordRequest(self, sample: RequestSample) -> None:
+        """Record an attempt of a request.
+
+        Args:
+            sample (RequestSample): Measurement of the attempt.
+        """
+        with self._lock:
+            self._samples.append(sample)
+
+    def recordOutcome(self, outcome: str, count: int = 1) -> None:
+        """Count transactions with an outcome, e.g. "created" or "failed".
+
+        Args:
+            outcome (str): Name of the outcome.
+            count (int): Number of transactions. Defaults to 1.
+        """
+        with self._lock:
+            self._outcomes[outcome] += count
+
+    def recordGauge(self, name: str, value: float) -> None:
+        """Record the value of a gauge, replacing an earlier value.
+
+        Args:
+            name (str): Name of the gauge, e.g. "concurrency_limit".
+            value (float): Value of the gauge.
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the time spent in a stage of the run, added up over repeated stages.
+
+        Args:
+            name (str): Name of the stage, e.g. "load" or "transfer".
+        """
+        started = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - started
+            with self._lock:
+                self._stages[name] = self._stages.get(name, 0.0) + elapsed
+
+    def report(self) -> Dict[str, Any]:
+        """Summarize the run.
+
+        Returns:
+            Dict[str, Any]: JSON-compatible report of the run. Durations are in seconds,
+                latencies in milliseconds.
+        """
+        with self._lock:
+            samples = list(self._samples)
+            outcomes = dict(self._outcomes)
+            stages = dict(self._stages)
+            gauges = dict(self._gauges)
+        duration = self._clock() - self._started
+
+        latency: Dict[str, Dict[str, float]] = {}
+        for method in sorted({sample.method for sample in samples}):
+            values = sorted(sample.latency * 1000 for sample in samples if sample.method == method)
+            latency[method] = {
+                "count": len(values),
+                "mean_ms": sum(values) / len(values),
+                **{f"p{q}_ms": percentile(values, q) for q in PERCENTILES},
+                "max_ms": values[-1],
+            }
+        slowest = heapq.nlargest(self._slowest, samples, key=lambda sample: sample.latency)
+        statuses = collections.Counter("error" if sample.status is None else str(sample.status) for sample in samples)
+        return {
+            "started": self._startedAt.isoformat(),
+            "duration_s": duration,
+            "requests": {
+                "total": len(samples),
+                "per_second": len(samples) / duration if duration > 0 else 0.0,
+                "retried": sum(1 for sample in samples if sample.retry > 0),
+                "by_status": dict(sorted(statuses.items())),
+            },
+            "latency": latency,
+            "slowest": [
+                {
+                    "method": sample.method,
+                    "endpoint": sample.endpoint,
+                    "status": sample.status,
+                    "latency_ms": sample.latency * 1000,
+                    "retry": sample.retry,
+                }
+                for sample in slowest
+            ],
+            "outcomes": outcomes,
+            "bytes": {
+                "sent": sum(sample.sent for sample in samples),
+                "received": sum(sample.received for sample in samples),
+            },
+            "stages_s": stages,
+            "gauges": gauges,
+        }
+
+    def write(self, path: str) -> None:
+        """Write the report as JSON to a file, or to standard output if path is "-".
+
+        Args:
+            path (str): Path of the file or "-".
+        """
+        content = json.dumps(self.report(), indent=2)
+        if path == "-":
+            print(content)
+            return
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content + "\n")
+        logger.info(f"Wrote run report to {path}")
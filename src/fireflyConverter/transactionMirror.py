@@ -0,0 +1,343 @@
+import dataclasses as dc
+import datetime as dt
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from fireflyConverter import data
+from fireflyConverter.convertData import ConvertData
+from fireflyConverter.fireflyInterface import FireflyInterface
+
+logger = logging.getLogger(__name__)
+
+# Tables of the mirror, with the indexed columns of each table besides the primary key
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    journal_id TEXT PRIMARY KEY,
+    group_id TEXT NOT NULL,
+    date TEXT,
+    amount REAL,
+    type TEXT,
+    description TEXT,
+    source_name TEXT,
+    destination_name TEXT,
+    external_id TEXT,
+    updated_at TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_group ON transactions (group_id);
+CREATE INDEX IF NOT EXISTS transactions_date ON transactions (date);
+CREATE INDEX IF NOT EXISTS transactions_amount ON transactions (amount);
+CREATE INDEX IF NOT EXISTS transactions_source ON transactions (source_name);
+CREATE INDEX IF NOT EXISTS transactions_destination ON transactions (destination_name);
+CREATE INDEX IF NOT EXISTS transactions_external_id ON transactions (external_id);
+CREATE TABLE IF NOT EXISTS accounts (id TEXT PRIMARY KEY, name TEXT, type TEXT, payload TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS accounts_name ON accounts (name);
+CREATE TABLE IF NOT EXISTS rules (id TEXT PRIMARY KEY, title TEXT, rule_group_id TEXT, payload TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS sync_state (kind TEXT PRIMARY KEY, synced_at REAL NOT NULL);
+"""
+
+# Page size of the requests listing objects for the mirror
+PAGE_SIZE = 500
+
+
+@dc.dataclass(frozen=True)
+class MirrorSyncResult:
+    """Outcome of synchronizing the mirror with the server.
+
+    Attributes:
+        full (bool): Whether all transactions were reloaded instead of only the changed ones.
+        transactions (int): Number of transaction splits written to the mirror.
+        accounts (int): Number of accounts in the mirror.
+        rules (int): Number of rules in the mirror.
+    """
+
+    full: bool
+    transactions: int
+    accounts: int
+    rules: int
+
+
+def _payload(item: Any) -> str:
+    """Serialize a data object for the payload column.
+
+    Args:
+        item (Any): Dataclass instance.
+
+    Returns:
+        str: JSON of the fields of the object.
+    """
+    return json.dumps(dc.asdict(item), default=str)
+
+
+def _utcDate(date: Any) -> Optional[str]:
+    """Normalize a transaction date to an ISO 8601 string in UTC, which sorts chronologically.
+
+    Args:
+        date (Any): Date of a transaction.
+
+    Returns:
+        Optional[str]: Date in UTC, unchanged if it has no UTC offset, None if the transaction has no date.
+    """
+    if date is None:
+        return None
+    timestamp = data.toTimestamp(date)
+    return (timestamp.tz_convert("UTC") if timestamp.tzinfo is not None else timestamp).isoformat()
+
+
+class TransactionMirror:
+    """Local SQLite copy of the transactions, accounts and rules of a Firefly III instance.
+
+    The first synchronization loads all transactions. Later ones only request the
+    transaction groups updated since the previous synchronization, using the
+    `updated_at_after` search operator, and replace their splits in the mirror. The
+    operator has a resolution of days, so the window starts one day before the
+    previous synchronization. Deleted groups do not show up in the search; if the
+    number of groups in the mirror differs from the server afterwards, all
+    transactions are reloaded. Accounts and rules cannot be filtered by update time
+    and are reloaded on every synchronization.
+
+    Transactions are stored with their full data and indexed by date, amount,
+    account names and external ID, so they can be selected and queried with
+    `ConvertData` without contacting the server.
+
+    Attributes:
+        _path (str): Path of the database file.
+        _connection (sqlite3.Connection): Connection to the database.
+        _clock (Callable[[], float]): Wall clock in seconds since the epoch.
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        """Open the mirror, creating the database if it does not exist.
+
+        Args:
+            path (str): Path of the database file.
+            clock (Callable[[], float]): Wall clock in seconds since the epoch. Defaults to time.time.
+        """
+        self._path = path
+        self._clock = clock
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "TransactionMirror":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        self._connection.close()
+
+    @property
+    def syncedAt(self) -> Optional[float]:
+        """Time of the last synchronization of the transactions in seconds since the epoch.
+
+        Returns:
+            Optional[float]: Time of the last synchronization, None if never synchronized.
+        """
+        row = self._connection.execute("SELECT synced_at FROM sync_state WHERE kind = 'transactions'").fetchone()
+        return None if row is None else row[0]
+
+    def sync(self, interface: FireflyInterface, full: bool = False, prefetch: int = 0) -> MirrorSyncResult:
+        """Synchronize the mirror with the server.
+
+        Args:
+            interface (FireflyInterface): Interface to the Firefly III instance.
+            full (bool): Reload all transactions even if the mirror was synchronized before.
+                Defaults to False.
+            prefetch (int): Maximum number of pages requested concurrently. Defaults to 0.
+
+        Returns:
+            MirrorSyncResult: Outcome of the synchronization.
+
+        Raises:
+            requests.HTTPError: If an HTTP request fails.
+        """
+        startedAt = self._clock()
+        syncedAt = self.syncedAt
+        full = full or syncedAt is None
+        if full:
+            written = self._replaceTransactions(interface.iterTransactions(limit=PAGE_SIZE, prefetch=prefetch))
+        else:
+            since = (dt.datetime.fromtimestamp(syncedAt, dt.timezone.utc) - dt.timedelta(days=1)).date()
+            changed = interface.searchTransactions(f"updated_at_after:{since}", limit=PAGE_SIZE, prefetch=prefetch)
+            written = self._upsertTransactions(changed)
+            if self._groupCount() != interface.countTransactions():
+                logger.info("Transaction groups were deleted on the server, reloading all transactions")
+                full = True
+                written = self._replaceTransactions(interface.iterTransactions(limit=PAGE_SIZE, prefetch=prefetch))
+
+        accounts = interface.getAccounts()
+        rules = list(interface.iterRules(limit=PAGE_SIZE, prefetch=prefetch))
+        with self._connection:
+            self._connection.execute("DELETE FROM accounts")
+            self._connection.executemany(
+                "INSERT INTO accounts VALUES (?, ?, ?, ?)",
+                [(str(account.id), account.name, account.type, _payload(account)) for account in accounts],
+            )
+            self._connection.execute("DELETE FROM rules")
+            self._connection.executemany(
+                "INSERT INTO rules VALUES (?, ?, ?, ?)",
+                [(str(rule.id), rule.title, str(rule.rule_group_id), _payload(rule)) for rule in rules],
+            )
+            self._connection.execute("INSERT OR REPLACE INTO sync_state VALUES ('transactions', ?)", (startedAt,))
+
+        logger.info(
+            f"Synchronized mirror {self._path} ({'full' if full else 'incremental'}): "
+            f"{written} transactions written, {len(accounts)} accounts, {len(rules)} rules"
+        )
+        return MirrorSyncResult(full, written, len(accounts), len(rules))
+
+    @staticmethod
+    def _transactionRow(transaction: data.GetTransaction) -> Tuple:
+        """Build the row of a transaction split.
+
+        The API reports amounts as strings; they are stored as numbers, so queries on
+        the mirrored transactions can compare them.
+
+        Args:
+            transaction (data.GetTransaction): Transaction split.
+
+        Returns:
+            Tuple: Values of the columns of the transactions table.
+        """
+        amount = None if transaction.amount is None else float(transaction.amount)
+        return (
+            str(transaction.transaction_journal_id),
+            str(transaction.transaction_id),
+            _utcDate(transaction.date),
+            amount,
+            transaction.type,
+            transaction.description,
+            transaction.source_name,
+            transaction.destination_name,
+            transaction.external_id,
+            transaction.updated_at,
+            _payload(dc.replace(transaction, amount=amount)),
+        )
+
+    def _replaceTransactions(self, transactions: Iterable[data.GetTransaction]) -> int:
+        """Replace all transactions of the mirror.
+
+        Args:
+            transactions (Iterable[data.GetTransaction]): All transaction splits on the server.
+
+        Returns:
+            int: Number of splits written.
+        """
+        rows = [self._transactionRow(transaction) for transaction in transactions]
+        with self._connection:
+            self._connection.execute("DELETE FROM transactions")
+            self._connection.executemany("INSERT INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def _upsertTransactions(self, transactions: Iterable[data.GetTransaction]) -> int:
+        """Replace the splits of changed transaction groups.
+
+        All splits of a changed group are removed first, so splits deleted from a group
+        on the server disappear from the mirror as well.
+
+        Args:
+            transactions (Iterable[data.GetTransaction]): All splits of the changed groups.
+
+        Returns:
+            int: Number of splits written.
+        """
+        rows = [self._transactionRow(transaction) for transaction in transactions]
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM transactions WHERE group_id = ?", [(groupId,) for groupId in {row[1] for row in rows}]
+            )
+            self._connection.executemany("INSERT INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def _groupCount(self) -> int:
+        return self._connection.execute("SELECT COUNT(DISTINCT group_id) FROM transactions").fetchone()[0]
+
+    def transactions(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        account: Optional[str] = None,
+        externalId: Optional[str] = None,
+        minAmount: Optional[float] = None,
+        maxAmount: Optional[float] = None,
+    ) -> List[data.GetTransaction]:
+        """Select transaction splits from the mirror using its indexes.
+
+        Args:
+            start (Optional[str]): First day in UTC (YYYY-MM-DD format). Defaults to None.
+            end (Optional[str]): Last day in UTC (YYYY-MM-DD format). Defaults to None.
+            account (Optional[str]): Name of the source or destination account. Defaults to None.
+            externalId (Optional[str]): External ID of the transaction. Defaults to None.
+            minAmount (Optional[float]): Minimum amount. Defaults to None.
+            maxAmount (Optional[float]): Maximum amount. Defaults to None.
+
+        Returns:
+            List[data.GetTransaction]: Matching transaction splits, ordered by date.
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+        if start is not None:
+            conditions.append("date >= ?")
+            params.append(start)
+        if end is not None:
+            conditions.append("date < ?")
+            params.append((pd.Timestamp(end) + pd.Timedelta(days=1)).strftime("%Y-%m-%d"))
+        if account is not None:
+            conditions.append("(source_name = ? OR destination_name = ?)")
+            params += [account, account]
+        if externalId is not None:
+            conditions.append("external_id = ?")
+            params.append(externalId)
+        if minAmount is not None:
+            conditions.append("amount >= ?")
+            params.append(minAmount)
+        if maxAmount is not None:
+            conditions.append("amount <= ?")
+            params.append(maxAmount)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._connection.execute(f"SELECT payload FROM transactions{where} ORDER BY date, journal_id", params)
+        return [data.GetTransaction(**json.loads(payload)) for (payload,) in rows]
+
+    def accounts(self) -> List[data.GetAccount]:
+        """List the accounts of the mirror.
+
+        Returns:
+            List[data.GetAccount]: Accounts ordered by name.
+        """
+        return self._load("SELECT payload FROM accounts ORDER BY name", data.GetAccount)
+
+    def rules(self) -> List[data.GetRule]:
+        """List the rules of the mirror.
+
+        Returns:
+            List[data.GetRule]: Rules ordered by title.
+        """
+        return self._load("SELECT payload FROM rules ORDER BY title", data.GetRule)
+
+    def _load(self, query: str, cls: Callable[..., Any]) -> List[Any]:
+        return [cls(**json.loads(payload)) for (payload,) in self._connection.execute(query)]
+
+    def convertData(self, start: Optional[str] = None, end: Optional[str] = None, **kwargs: Any) -> ConvertData:
+        """Create a converter over the mirrored transactions, e.g. to run queries offline.
+
+        Args:
+            start (Optional[str]): First day in UTC (YYYY-MM-DD format). Defaults to None.
+            end (Optional[str]): Last day in UTC (YYYY-MM-DD format). Defaults to None.
+            **kwargs (Any): Further arguments of ConvertData, e.g. queries or lazy.
+
+        Returns:
+            ConvertData: Converter over the selected transactions.
+        """
+        return ConvertData(self.transactions(start, end), **kwargs)
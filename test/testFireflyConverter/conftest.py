@@ -0,0 +1,22 @@
+import os
+from unittest import mock
+
+import pytest
+
+from fireflyConverter.fakeFirefly import FakeFireflyServer
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fireflyServer():
+    """Serve the interface tests from the in-process fake Firefly III if no instance is configured.
+
+    An instance is configured by TEST_API_TOKEN, e.g. in the .env file written by
+    test/fireflyServer/createToken.sh, and TEST_BASE_URL, which defaults to http://localhost.
+    Otherwise the fake server listens on a free port and both variables point to it.
+    """
+    if os.getenv("TEST_API_TOKEN"):
+        yield
+        return
+    with FakeFireflyServer(apiToken="test-token") as server:
+        with mock.patch.dict(os.environ, {"TEST_API_TOKEN": "test-token", "TEST_BASE_URL": server.url}):
+            yield
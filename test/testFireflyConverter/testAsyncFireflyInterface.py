@@ -0,0 +1,100 @@
+import os
+import unittest
+
+import httpx
+
+from fireflyConverter import asyncFireflyInterface as affi
+from fireflyConverter import data
+from fireflyConverter import fireflyInterface as ffi
+from fireflyConverter import loadData as ldb
+
+
+class TestAsyncInterface(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        api_token = os.getenv("TEST_API_TOKEN")
+        assert api_token is not None, "TEST_API_TOKEN environment variable must be set for tests."
+        self._base_url = os.getenv("TEST_BASE_URL", "http://localhost")
+
+        self._fireflyInterface = ffi.FireflyInterface(base_url=self._base_url, api_token=api_token)
+        self.addCleanup(self._removeFireflyData)
+        self._asyncInterface = affi.AsyncFireflyInterface(base_url=self._base_url, api_token=api_token)
+        self.addAsyncCleanup(self._asyncInterface.aclose)
+        self._transactions = ldb.DataLoaderCommon("test/data/common").load()
+
+    def _removeFireflyData(self):
+        """Purges data generated during test runs from test server."""
+        self._fireflyInterface.deleteAccounts()
+        self._fireflyInterface.deleteRules()
+        self._fireflyInterface.deleteRuleGroups()
+        self._fireflyInterface.purgeUserData()
+
+    async def testCreateTransactions(self):
+        await self._asyncInterface.createAccount(data.PostAssetAccount("tr"))
+
+        results = [result async for result in self._asyncInterface.createTransactions(self._transactions, workers=4)]
+
+        self.assertEqual([result.index for result in results], list(range(len(self._transactions))))
+        self.assertTrue(all(result.status == ffi.TransactionStatus.CREATED for result in results))
+        server_transactions = await self._asyncInterface.getTransactions(limit=100, page=1)
+        self.assertEqual(len(server_transactions), len(self._transactions))
+
+        prefetched = [transaction async for transaction in self._asyncInterface.iterTransactions(limit=2, prefetch=2)]
+        self.assertEqual(
+            [transaction.transaction_journal_id for transaction in prefetched],
+            [transaction.transaction_journal_id for transaction in server_transactions],
+        )
+
+        result = await self._asyncInterface.deleteTransactions(workers=2)
+        self.assertTrue(result.ok)
+        self.assertEqual(len(result.deleted), len(self._transactions))
+        self.assertEqual(len(await self._asyncInterface.getTransactions(limit=100, page=1)), 0)
+
+    async def testCreateDeleteAccounts(self):
+        await self._asyncInterface.createAccount(data.PostAssetAccount("Async Account"))
+        self.assertEqual([account.name for account in await self._asyncInterface.getAccounts()], ["Async Account"])
+
+        await self._asyncInterface.deleteAccounts()
+        self.assertEqual(len(await self._asyncInterface.getAccounts()), 0)
+
+    async def testRuleGroups(self):
+        await self._asyncInterface.createRuleGroup(data.PostRuleGroup(title="Async Rule Group", order=1, active=True))
+
+        response = await self._asyncInterface.applyRuleGroup("Async Rule Group")
+        self.assertEqual(response.status_code, 204)
+        with self.assertRaises(ValueError):
+            await self._asyncInterface.applyRuleGroup("Non-Existent Rule Group")
+
+        await self._asyncInterface.deleteRuleGroups()
+        self.assertEqual(len(await self._asyncInterface.getRuleGroups()), 0)
+
+    async def testResolveCurrencyId(self):
+        currency_id = await self._asyncInterface.resolveCurrencyId("EUR")
+        self.assertEqual(await self._asyncInterface.resolveCurrencyId("EUR"), currency_id)
+        self.assertEqual(self._asyncInterface.referenceCache.hits, 1)
+
+
+
+class TestAsyncRequestRetries(unittest.IsolatedAsyncioTestCase):
+    async def testRepeatedPostRejectedAsDuplicateIsCreated(self):
+        attempts = []
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ReadTimeout("timed out", request=request)
+            message = "Duplicate of transaction #12."
+            return httpx.Response(422, json={"message": message, "errors": {"transactions.0.description": [message]}})
+
+        interface = affi.AsyncFireflyInterface(base_url="http://localhost", api_token="token", backoff_factor=0.0)
+        await interface._client.aclose()
+        interface._client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        self.addAsyncCleanup(interface.aclose)
+
+        payload = {"error_if_duplicate_hash": True, "transactions": [{"description": "Buy"}]}
+        results = await interface._createGroupResults([0], payload)
+        self.assertEqual(results, [ffi.TransactionResult(0, ffi.TransactionStatus.CREATED, id="12")])
+        self.assertEqual(len(attempts), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+
+from fireflyConverter import checkpointJournal as cpj
+from fireflyConverter import data
+from fireflyConverter import fireflyInterface as ffi
+
+
+class TestCheckpointJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        journal_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(journal_dir.cleanup)
+        self._path = os.path.join(journal_dir.name, "checkpoint.sqlite")
+        self._transactions = [
+            data.PostTransaction("2025-07-01", 10.0, "Coffee", "withdrawal", source_name="tr"),
+            data.PostTransaction("2025-07-01", 10.0, "Coffee", "withdrawal", source_name="tr"),
+            data.PostTransaction("2025-07-02", 20.0, "Lunch", "withdrawal", source_name="tr"),
+        ]
+        self._posted = []
+
+    def _create(self, statuses):
+        def create(transactions, onResult):
+            self._posted.append([transaction.description for transaction in transactions])
+            results = []
+            for index, status in enumerate(statuses[: len(transactions)]):
+                id = None if status == ffi.TransactionStatus.FAILED else str(index + 1)
+                results.append(ffi.TransactionResult(index, status, id=id))
+            # Later rows complete before the first one is yielded
+            for result in reversed(results):
+                onResult(result)
+            yield from results
+
+        return create
+
+    def testFingerprints(self):
+        fingerprints = cpj.transactionFingerprints(self._transactions)
+        self.assertEqual(len(set(fingerprints)), 3)
+        self.assertEqual(fingerprints[0].split(":")[0], fingerprints[1].split(":")[0])
+        self.assertEqual(cpj.transactionFingerprints(reversed(self._transactions))[0], fingerprints[2])
+
+    def testResumeSkipsCompletedRows(self):
+        created, failed = ffi.TransactionStatus.CREATED, ffi.TransactionStatus.FAILED
+        with cpj.CheckpointJournal(self._path) as journal:
+            list(journal.run(self._transactions, self._create([created, failed, created])))
+            self.assertEqual(len(journal), 3)
+
+        with cpj.CheckpointJournal(self._path) as journal:
+            results = list(journal.run(self._transactions, self._create([created]), resume=True))
+
+        self.assertEqual(self._posted, [["Coffee", "Coffee", "Lunch"], ["Coffee"]])
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertEqual(
+            [(result.status, result.id) for result in results],
+            [(ffi.TransactionStatus.SKIPPED, "1"), (created, "1"), (ffi.TransactionStatus.SKIPPED, "3")],
+        )
+
+    def testRecordsRowsAsTheyComplete(self):
+        created = ffi.TransactionStatus.CREATED
+        with cpj.CheckpointJournal(self._path) as journal:
+            results = journal.run(self._transactions, self._create([created] * 3))
+            next(results)
+            # Interrupted after the first result, the rows completed meanwhile are journaled
+            results.close()
+            self.assertEqual(len(journal), 3)
+
+        with cpj.CheckpointJournal(self._path) as journal:
+            results = list(journal.run(self._transactions, self._create([]), resume=True))
+        self.assertEqual([result.status for result in results], [ffi.TransactionStatus.SKIPPED] * 3)
+        self.assertEqual(self._posted, [["Coffee", "Coffee", "Lunch"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
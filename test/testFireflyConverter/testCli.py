@@ -1,3 +1,4 @@
+import json
 import os
 import tempfile
 import unittest
@@ -12,16 +13,17 @@ class TestTransferCli(unittest.TestCase):
     def setUp(self):
         api_token = os.getenv("TEST_API_TOKEN")
         assert api_token is not None, "TEST_API_TOKEN environment variable must be set for tests."
+        self._base_url = os.getenv("TEST_BASE_URL", "http://localhost")
 
         self._fireflyInterface = ffi.FireflyInterface(
-            base_url="http://localhost",
+            base_url=self._base_url,
             api_token=api_token,
         )
         self.addCleanup(self._removeFireflyData)
 
         self._temp_config = tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False)
         self._temp_config.write(
-            f'[firefly_interface]\nbase_url = "http://localhost"\napi_token = "{api_token}"\nduplicate_transaction = "ignore"\n'
+            f'[firefly_interface]\nbase_url = "{self._base_url}"\napi_token = "{api_token}"\nduplicate_transaction = "ignore"\n'
         )
         self._temp_config.flush()
         self._temp_config.close()
@@ -84,6 +86,36 @@ class TestTransferCli(unittest.TestCase):
         for description in expected_descriptions:
             self.assertIn(description, transaction_descriptions, f"Transaction '{description}' not found on server")
 
+    def testFailedTransactionsRaise(self):
+        """Test that the transfer command fails if transactions cannot be created."""
+        test_data_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "data"))
+        self._fireflyInterface.createAccount(data.PostAssetAccount(name="tr"))
+        with open(self._temp_config.name, "w") as config:
+            config.write(
+                f'[firefly_interface]\nbase_url = "{self._base_url}"\napi_token = "{os.getenv("TEST_API_TOKEN")}"\n'
+                'duplicate_transaction = "error"\n'
+            )
+        args = self._parser.parse_args(
+            [
+                "transfer",
+                "common",
+                "--config_path",
+                self._temp_config.name,
+                "--input_directory",
+                test_data_dir,
+                "--input_name",
+                "common",
+                "--account_name",
+                "tr",
+            ]
+        )
+        cli.transfer(args)
+
+        # Posting the same transactions again fails on their duplicate hashes
+        with self.assertRaises(RuntimeError) as context:
+            cli.transfer(args)
+        self.assertIn("5 of 5 transactions failed", str(context.exception))
+
     def testApplyRuleGroups(self):
         """Test the transfer CLI command with rule group application by name."""
         # Prepare test data paths
@@ -175,6 +207,64 @@ class TestTransferCli(unittest.TestCase):
         except Exception as e:
             self.fail(f"Applying rule groups by name raised an exception: {e}")
 
+    def testResumeFromCheckpoint(self):
+        """Test that a resumed transfer skips the rows completed according to the checkpoint journal."""
+        test_data_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "data"))
+        self._fireflyInterface.createAccount(data.PostAssetAccount(name="tr"))
+        checkpoint_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(checkpoint_dir.cleanup)
+        arguments = [
+            "transfer",
+            "common",
+            "--config_path",
+            self._temp_config.name,
+            "--input_directory",
+            test_data_dir,
+            "--input_name",
+            "common",
+            "--account_name",
+            "tr",
+            "--checkpoint",
+            os.path.join(checkpoint_dir.name, "transfer.sqlite"),
+        ]
+        cli.transfer(self._parser.parse_args(arguments))
+        self.assertEqual(len(self._fireflyInterface.getTransactions(limit=100, page=1)), 5)
+
+        # Without contacting the server for completed rows, the purged transactions are not posted again
+        self._fireflyInterface.purgeUserData()
+        cli.transfer(self._parser.parse_args(arguments + ["--resume"]))
+        self.assertEqual(len(self._fireflyInterface.getTransactions(limit=100, page=1)), 0)
+
+        with self.assertRaises(ValueError):
+            cli.transfer(self._parser.parse_args(arguments[:-2] + ["--resume"]))
+
+    def testRunReport(self):
+        """Test that the transfer writes a JSON report of its requests and outcomes."""
+        test_data_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "data"))
+        self._fireflyInterface.createAccount(data.PostAssetAccount(name="tr"))
+        report_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(report_dir.cleanup)
+        report_path = os.path.join(report_dir.name, "report.json")
+        arguments = [
+            "transfer",
+            "common",
+            "--config_path",
+            self._temp_config.name,
+            "--input_directory",
+            test_data_dir,
+            "--input_name",
+            "common",
+            "--report",
+            report_path,
+        ]
+        cli.transfer(self._parser.parse_args(arguments))
+
+        with open(report_path) as file:
+            report = json.load(file)
+        self.assertEqual(report["outcomes"], {"created": 5})
+        self.assertEqual(report["latency"]["POST"]["count"], 5)
+        self.assertEqual(set(report["stages_s"]), {"load", "transfer"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,14 @@
 import unittest
 
+import pandas as pd
+
 from fireflyConverter import convertData as cvd
 from fireflyConverter import loadData as ldb
 
 
 class TestConvertData(unittest.TestCase):
     def setUp(self) -> None:
-        self._loader = ldb.DataLoaderCommon("test/data/common")
+        self._loader = ldb.DataLoaderCommon("test/data/common", timezone="Europe/Berlin")
         self._transactions = self._loader.load()
         self._converter = cvd.ConvertData(self._transactions, queries="test/config/queries.toml")
 
@@ -86,7 +88,12 @@ class TestFilterByQuery(TestConvertData):
         result = self._converter.filterByNamedQuery("specific_date")
         self.assertEqual(len(result.transactions), 1)
         for transaction in result.transactions:
-            self.assertEqual(transaction.date, "2025-12-30T00:00:00")
+            self.assertEqual(transaction.date, pd.Timestamp("2025-12-30", tz="Europe/Berlin"))
+
+    def testSpecificDateRange(self):
+        result = self._converter.filterByNamedQuery("specific_date_range")
+        self.assertEqual(len(result.transactions), 1)
+        self.assertEqual(result.transactions[0].date, pd.Timestamp("2025-12-30", tz="Europe/Berlin"))
 
     def testDateRange(self):
         result = self._converter.filterByNamedQuery("date_range")
@@ -175,5 +182,85 @@ class TestFilterByNamedQueryExpression(TestConvertData):
         self.assertIn("Tax", transaction.description)
 
 
+class TestLazyFilter(TestConvertData):
+    def setUp(self) -> None:
+        super().setUp()
+        self._lazyConverter = cvd.ConvertData(self._transactions, queries="test/config/queries.toml", lazy=True)
+
+    def testChainMatchesEager(self):
+        eager = self._converter.filterByNamedQuery("deposits_only").filterByQuery("amount > 100")
+        lazy = self._lazyConverter.filterByNamedQuery("deposits_only").filterByQuery("amount > 100")
+        self.assertEqual(
+            [transaction.description for transaction in lazy.transactions],
+            [transaction.description for transaction in eager.transactions],
+        )
+
+    def testChainIsDeferred(self):
+        result = self._lazyConverter.filterByQuery("amount > 'text'").filterByNamedQuery("deposits_only")
+        with self.assertRaises(ValueError):
+            result.transactions
+
+    def testChainThroughEmptySelection(self):
+        result = self._lazyConverter.filterByNamedQuery("small_withdrawals").filterByNamedQuery("reconciled")
+        self.assertEqual(len(result.transactions), 0)
+
+    def testSourceUnchanged(self):
+        self._lazyConverter.filterByNamedQuery("withdrawals_only").transactions
+        self.assertEqual(len(self._lazyConverter.transactions), len(self._transactions))
+
+
+class TestQueryCache(TestConvertData):
+    def testNamedQueriesEvaluatedOnce(self):
+        self._converter.filterByNamedQueries("deposits_only", "large_transactions", logic="and")
+        self._converter.filterByNamedQueries("deposits_only", "large_transactions", logic="or")
+        self._converter.filterByNamedQueryExpression(["large_transactions", "or", "deposits_only"])
+        self.assertEqual(self._converter.cache.misses, 2)
+        self.assertEqual(self._converter.cache.hits, 4)
+
+    def testQueriesChangeInvalidates(self):
+        self._converter.filterByNamedQuery("deposits_only")
+        self._converter.queries = {"deposits_only": "type == 'withdrawal'"}
+        result = self._converter.filterByNamedQuery("deposits_only")
+        self.assertEqual(len(result.transactions), 1)
+        self.assertEqual(self._converter.cache.misses, 2)
+
+    def testDataChangeInvalidates(self):
+        self.assertEqual(len(self._converter.filterByQuery("destination_name == 'tr'").transactions), 4)
+        for transaction in self._converter.transactions:
+            transaction.destination_name = "other"
+        self._converter.invalidateCache()
+        self.assertEqual(len(self._converter.filterByQuery("destination_name == 'tr'").transactions), 0)
+
+
+class TestDateIndex(TestConvertData):
+    def setUp(self) -> None:
+        super().setUp()
+        self._indexedConverter = cvd.ConvertData(
+            self._transactions, queries="test/config/queries.toml", dateIndex=True
+        )
+
+    def testDateRange(self):
+        result = self._indexedConverter.filterByNamedQuery("date_range")
+        self.assertEqual(len(result.transactions), 4)
+        self.assertIn("date", self._indexedConverter.cache.indexes)
+
+    def testMatchesUnindexed(self):
+        queries = [
+            "date >= '2025-07-01'",
+            "date < '2025-07-02' and amount > 40",
+            "'2025-07-01' < date and date <= '2025-08-01T12:14:31'",
+            "date == '2025-12-30T00:00:00'",
+            "date > '2026-01-01' or type == 'withdrawal'",
+        ]
+        for query in queries:
+            expected = self._converter.filterByQuery(query).transactions
+            result = self._indexedConverter.filterByQuery(query).transactions
+            self.assertEqual(
+                [transaction.description for transaction in result],
+                [transaction.description for transaction in expected],
+                query,
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from fireflyConverter import data
+from fireflyConverter import duplicateIndex as dpi
+from fireflyConverter import loadData as ldb
+
+
+class TestDuplicateIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self._transactions = ldb.DataLoaderCommon("test/data/common", timezone="Europe/Berlin").load()
+        self._index = dpi.DuplicateIndex(self._transactions[:2])
+
+    def testContains(self):
+        self.assertEqual(len(self._index), 2)
+        self.assertEqual([transaction in self._index for transaction in self._transactions], [True, True, False, False, False])
+
+    def testServerRepresentationMatches(self):
+        existing = data.PostTransaction(
+            "2024-02-06T14:46:07+00:00", 10000.0, "asdf - Deposit ", "deposit", source_name="Unknown", destination_name="tr"
+        )
+        self.assertIn(existing, self._index)
+
+    def testDifferentAccountDoesNotMatch(self):
+        other = data.PostTransaction("2024-02-06T15:46:07", 10000.0, "asdf - Deposit", "deposit", destination_name="other")
+        self.assertNotIn(other, self._index)
+
+    def testNaiveDateMatchesServerWallTime(self):
+        naive = ldb.DataLoaderCommon("test/data/common").load()
+        self.assertIsNone(naive[0].date.tzinfo)
+        self.assertEqual([transaction in self._index for transaction in naive], [True, True, False, False, False])
+
+    def testDateRange(self):
+        self.assertEqual(dpi.DuplicateIndex.dateRange(self._transactions), ("2024-02-05", "2025-12-31"))
+        self.assertIsNone(dpi.DuplicateIndex.dateRange([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
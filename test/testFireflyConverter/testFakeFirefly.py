@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+from fireflyConverter import data
+from fireflyConverter import fakeFirefly as ff
+from fireflyConverter import fireflyInterface as ffi
+from fireflyConverter import referenceCache as rfc
+
+
+class TestFakeFirefly(unittest.TestCase):
+    def setUp(self) -> None:
+        self._server = ff.FakeFireflyServer(apiToken="token")
+        self._server.start()
+        self.addCleanup(self._server.stop)
+        self._interface = ffi.FireflyInterface(
+            base_url=self._server.url, api_token="token", duplicate_transaction="ignore", backoff_factor=0.0
+        )
+        self.addCleanup(self._interface.close)
+        self._transactions = [
+            data.PostTransaction(f"2025-07-0{day}T10:00:00", 10.0 * day, f"Buy {day}", "withdrawal", source_name="tr")
+            for day in range(1, 9)
+        ]
+
+    def testDuplicateHash(self):
+        self._interface.createAccount(data.PostAssetAccount("tr"))
+        results = list(self._interface.createTransactions(self._transactions[:2] * 2))
+        statuses = [result.status for result in results]
+        self.assertEqual(statuses, [ffi.TransactionStatus.CREATED] * 2 + [ffi.TransactionStatus.DUPLICATE] * 2)
+        self.assertEqual(results[2].code, ffi.ErrorCode.DUPLICATE)
+
+        # Withdrawals create the missing expense account of their destination
+        accounts = {account.name: account.type for account in self._interface.getAccounts()}
+        self.assertEqual(accounts, {"tr": "asset", "(no name)": "expense"})
+        self.assertEqual(len(self._interface.getTransactions(start="2025-07-02", end="2025-07-02")), 1)
+
+    def testInjectedErrorsAreRetried(self):
+        self._server.fake.failNext(503, count=2, retryAfter=0)
+        self.assertEqual(self._interface.getAccounts(), [])
+        self.assertEqual(self._server.fake.stats.requests[("GET", "accounts")], 3)
+        self.assertEqual(self._server.fake.stats.injected, 2)
+
+    def testLatencyAndConcurrency(self):
+        self._server.fake.latency = 0.05
+        results = list(self._interface.createTransactions(self._transactions, workers=4))
+        self.assertTrue(all(result.status == ffi.TransactionStatus.CREATED for result in results))
+        self.assertEqual(self._server.fake.stats.maxInFlight, 4)
+
+    def testSessionsOfFinishedWorkersAreClosed(self):
+        self._interface.createAccount(data.PostAssetAccount("tr"))
+        session = self._interface._session
+        with mock.patch.object(requests.Session, "close", autospec=True) as closeSession:
+            for _ in range(5):
+                list(self._interface.createTransactions(self._transactions, workers=4))
+                self._interface.deleteTransactions(workers=4)
+            self.assertLessEqual(len(self._interface._sessions), 1 + 4)
+            self.assertIs(self._interface._session, session)
+            self.assertGreater(closeSession.call_count, 0)
+            self.assertNotIn(session, [call.args[0] for call in closeSession.call_args_list])
+        self.assertEqual(session.get_adapter(self._server.url)._pool_maxsize, 10)
+
+    def testStoredReferencesDetectRecreatedAccount(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        cache_file = os.path.join(cache_dir.name, "references.json")
+        self._interface.createAccount(data.PostAssetAccount("tr"))
+
+        first_run = ffi.FireflyInterface(base_url=self._server.url, api_token="token", cache_file=cache_file)
+        self.addCleanup(first_run.close)
+        stale_id = first_run.resolveAccountId("tr")
+
+        # Recreated by another client, the number of accounts stays the same
+        self._interface.deleteAccount(stale_id)
+        self._interface.createAccount(data.PostAssetAccount("tr"))
+        second_run = ffi.FireflyInterface(base_url=self._server.url, api_token="token", cache_file=cache_file)
+        self.addCleanup(second_run.close)
+        self.assertNotEqual(second_run.resolveAccountId("tr"), stale_id)
+
+    def testPurgeClearsDefaultStore(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_dir.name}):
+            store = rfc.ReferenceStore(rfc.defaultStorePath(), self._server.url, "token")
+            store.save(rfc.ReferenceKind.ACCOUNTS, {"tr": ["1"]})
+
+            self._interface.purgeUserData()
+            reopened = rfc.ReferenceStore(rfc.defaultStorePath(), self._server.url, "token")
+            self.assertIsNone(reopened.load(rfc.ReferenceKind.ACCOUNTS))
+
+    def testRuleGroupTrigger(self):
+        self._interface.createRuleGroup(data.PostRuleGroup("Imports"))
+        self.assertEqual(self._interface.applyRuleGroup("Imports").status_code, 204)
+        self.assertEqual([kind for kind, _, _ in self._server.fake.triggers], ["rule-groups"])
+
+    def testRequiresToken(self):
+        interface = ffi.FireflyInterface(base_url=self._server.url, api_token="wrong")
+        self.addCleanup(interface.close)
+        with self.assertRaises(requests.HTTPError):
+            interface.getAccounts()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
 import os
+import tempfile
 import unittest
 from typing import Set
 
-from fireflyConverter import data
+import requests
+
+from fireflyConverter import data, fakeFirefly
 from fireflyConverter import fireflyInterface as ffi
 from fireflyConverter import loadData as ldb
 
@@ -121,9 +124,10 @@ class TestInterfaceBase(unittest.TestCase):
     def setUp(self):
         api_token = os.getenv("TEST_API_TOKEN")
         assert api_token is not None, "TEST_API_TOKEN environment variable must be set for tests."
+        self._base_url = os.getenv("TEST_BASE_URL", "http://localhost")
 
         self._fireflyInterface = ffi.FireflyInterface(
-            base_url="http://localhost",
+            base_url=self._base_url,
             api_token=api_token,
         )
         self.addCleanup(self._removeFireflyData)
@@ -167,6 +171,14 @@ class TestAccountInterface(TestInterfaceBase):
         self._fireflyInterface.deleteAccounts()
         self.assertEqual(len(self._fireflyInterface.getAccounts()), 0, "Accounts were not deleted from the server.")
 
+    def testResolveAccountId(self):
+        response = self._fireflyInterface.createAccount(data.PostAssetAccount("Cached Account"))
+        self.assertEqual(self._fireflyInterface.resolveAccountId("Cached Account"), response.json()["data"]["id"])
+
+        self._fireflyInterface.deleteAccount(response.json()["data"]["id"])
+        with self.assertRaises(ValueError):
+            self._fireflyInterface.resolveAccountId("Cached Account")
+
 
 class TestTransactionInterface(TestInterfaceBase):
     def setUp(self):
@@ -186,6 +198,98 @@ class TestTransactionInterface(TestInterfaceBase):
             "Number of transactions on the server does not match the number of created transactions.",
         )
 
+    def testCreateTransactionsConcurrently(self):
+        results = list(self._fireflyInterface.createTransactions(self._transactions, workers=4))
+
+        self.assertEqual([result.index for result in results], list(range(len(self._transactions))))
+        self.assertTrue(all(result.status == ffi.TransactionStatus.CREATED for result in results))
+        self.assertEqual(len({result.id for result in results}), len(self._transactions))
+        self.assertEqual(len(self._fireflyInterface.getTransactions(limit=100, page=1)), len(self._transactions))
+
+    def testCreateTransactionsReportsDuplicates(self):
+        self._fireflyInterface.createTransaction(self._transactions[0])
+
+        results = list(self._fireflyInterface.createTransactions(self._transactions, workers=2))
+
+        self.assertEqual(results[0].status, ffi.TransactionStatus.FAILED)
+        self.assertIn("Duplicate", results[0].reason)
+        self.assertEqual(results[0].code, ffi.ErrorCode.DUPLICATE)
+        self.assertTrue(all(result.status == ffi.TransactionStatus.CREATED for result in results[1:]))
+
+        ignoringInterface = ffi.FireflyInterface(
+            base_url=self._base_url, api_token=os.environ["TEST_API_TOKEN"], duplicate_transaction="ignore"
+        )
+        results = list(ignoringInterface.createTransactions(self._transactions[:2]))
+        self.assertEqual([result.status for result in results], [ffi.TransactionStatus.DUPLICATE] * 2)
+
+        with self.assertRaises(ffi.FireflyApiError) as context:
+            self._fireflyInterface.createTransaction(self._transactions[0])
+        self.assertEqual((context.exception.statusCode, context.exception.code), (422, ffi.ErrorCode.DUPLICATE))
+
+    def testLeanResponses(self):
+        leanInterface = ffi.FireflyInterface(
+            base_url=self._base_url, api_token=os.environ["TEST_API_TOKEN"], lean_responses=True
+        )
+        results = list(leanInterface.createTransactions(self._transactions, workers=2))
+
+        self.assertTrue(all(result.status == ffi.TransactionStatus.CREATED for result in results))
+        serverTransactions = self._fireflyInterface.getTransactions(limit=100, page=1)
+        self.assertEqual({result.id for result in results}, {str(t.transaction_id) for t in serverTransactions})
+
+    def testPreflightSkipsExistingTransactions(self):
+        list(self._fireflyInterface.createTransactions(self._transactions[:2]))
+        ignoringInterface = ffi.FireflyInterface(
+            base_url=self._base_url, api_token=os.environ["TEST_API_TOKEN"], duplicate_transaction="ignore"
+        )
+
+        results = list(ignoringInterface.createTransactions(self._transactions, workers=2, preflight=True))
+
+        self.assertEqual([result.index for result in results], list(range(len(self._transactions))))
+        self.assertEqual([result.status for result in results[:2]], [ffi.TransactionStatus.DUPLICATE] * 2)
+        self.assertIn("pre-flight", results[0].reason)
+        self.assertTrue(all(result.status == ffi.TransactionStatus.CREATED for result in results[2:]))
+
+    def testDeleteTransactionsConcurrently(self):
+        results = list(self._fireflyInterface.createTransactions(self._transactions))
+        group_ids = [result.id for result in results]
+
+        result = self._fireflyInterface.deleteTransactions(group_ids[1:] + ["999999"], workers=4)
+
+        self.assertEqual(sorted(result.deleted), sorted(group_ids[1:]))
+        self.assertEqual(list(result.failed), ["999999"])
+        self.assertIn("404", result.failed["999999"])
+        self.assertEqual(len(self._fireflyInterface.getTransactions(limit=100, page=1)), 1)
+
+    def testIterTransactionsPaginates(self):
+        list(self._fireflyInterface.createTransactions(self._transactions))
+
+        descriptions = [transaction.description for transaction in self._fireflyInterface.iterTransactions(limit=2)]
+        self.assertEqual(sorted(descriptions), sorted(transaction.description for transaction in self._transactions))
+
+        prefetched = [transaction.description for transaction in self._fireflyInterface.iterTransactions(limit=2, prefetch=2)]
+        self.assertEqual(prefetched, descriptions)
+
+    def testCreateTransactionGroups(self):
+        transactions = [
+            data.PostTransaction("2025-07-01T10:00:00", 100.0, "Buy", "withdrawal", source_name="tr"),
+            data.PostTransaction("2025-07-01T10:00:00", 1.0, "Fee", "withdrawal", source_name="tr"),
+            data.PostTransaction("2025-07-01T10:00:00", 2.0, "Tax", "withdrawal", source_name="tr"),
+        ]
+        ignoringInterface = ffi.FireflyInterface(
+            base_url=self._base_url, api_token=os.environ["TEST_API_TOKEN"], duplicate_transaction="ignore"
+        )
+        ignoringInterface.createTransaction(transactions[1])
+
+        results = list(ignoringInterface.createTransactions(transactions, grouping="timestamp"))
+
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertEqual(
+            [result.status for result in results],
+            [ffi.TransactionStatus.CREATED, ffi.TransactionStatus.DUPLICATE, ffi.TransactionStatus.CREATED],
+        )
+        self.assertEqual(results[0].id, results[2].id)
+        self.assertEqual(len(self._fireflyInterface.getTransactions(limit=100, page=1)), 3)
+
 
 class TestRuleInterface(TestInterfaceBase):
     def setUp(self):
@@ -293,6 +397,13 @@ class TestRuleGroupInterface(TestInterfaceBase):
                 f"{rule_group.title} was not found on the server.",
             )
 
+    def testIterRuleGroupsPaginates(self):
+        self._fireflyInterface.createRuleGroup(data.PostRuleGroup(title="Test Rule Group 3", order=3, active=True))
+
+        titles = [rule_group.title for rule_group in self._fireflyInterface.iterRuleGroups(limit=2)]
+        self.assertEqual(sorted(titles), ["Test Rule Group 1", "Test Rule Group 2", "Test Rule Group 3"])
+        self.assertEqual(len(self._fireflyInterface.getRuleGroups(limit=2)), 2)
+
     def testDeleteRuleGroups(self):
         # Verify rule groups exist before deletion
         server_rule_groups_before = self._fireflyInterface.getRuleGroups()
@@ -359,6 +470,98 @@ class TestRuleGroupInterface(TestInterfaceBase):
             "Expected error message about missing rule group title",
         )
 
+    def testResolveRuleGroupTitlesFromCache(self):
+        cache = self._fireflyInterface.referenceCache
+        first_id = self._fireflyInterface.resolveRuleGroupId("Test Rule Group 1")
+        self.assertEqual(self._fireflyInterface.resolveRuleGroupId("Test Rule Group 1"), first_id)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # Rule groups created and deleted by the interface are tracked without reloading
+        self._fireflyInterface.createRuleGroup(data.PostRuleGroup(title="Test Rule Group 3", order=3, active=True))
+        self._fireflyInterface.deleteRuleGroups(["Test Rule Group 1", "Test Rule Group 3"])
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+        with self.assertRaises(ValueError):
+            self._fireflyInterface.resolveRuleGroupId("Test Rule Group 1")
+        self.assertEqual([rule_group.title for rule_group in self._fireflyInterface.getRuleGroups()], ["Test Rule Group 2"])
+
+    def testReuseStoredRuleGroups(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        cache_file = os.path.join(cache_dir.name, "references.json")
+        api_token = os.environ["TEST_API_TOKEN"]
+
+        first_run = ffi.FireflyInterface(base_url=self._base_url, api_token=api_token, cache_file=cache_file)
+        rule_group_id = first_run.resolveRuleGroupId("Test Rule Group 1")
+        second_run = ffi.FireflyInterface(base_url=self._base_url, api_token=api_token, cache_file=cache_file)
+        self.assertEqual(second_run.resolveRuleGroupId("Test Rule Group 1"), rule_group_id)
+
+        # A rule group recreated by another client changes the version of the listing
+        self._fireflyInterface.deleteRuleGroup(rule_group_id)
+        self._fireflyInterface.createRuleGroup(data.PostRuleGroup(title="Test Rule Group 1", order=1, active=True))
+        third_run = ffi.FireflyInterface(base_url=self._base_url, api_token=api_token, cache_file=cache_file)
+        self.assertEqual(third_run.applyRuleGroup("Test Rule Group 1").status_code, 204)
+        self.assertNotEqual(third_run.resolveRuleGroupId("Test Rule Group 1"), rule_group_id)
+
+
+class TestResponseHandling(unittest.TestCase):
+    def _response(self, statusCode: int, content: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = statusCode
+        response._content = content
+        return response
+
+    def testApiErrorFromJsonBody(self):
+        body = self._response(
+            422, b'{"message": "Invalid", "errors": {"transactions.0.amount": ["Amount is required."]}, "ok": false, "x": null}'
+        ).json()
+        error = ffi.FireflyApiError.fromBody(422, body)
+        self.assertEqual(error.code, ffi.ErrorCode.VALIDATION)
+        self.assertEqual(error.errors, {"transactions.0.amount": ["Amount is required."]})
+        self.assertEqual(ffi.FireflyApiError.fromBody(503, {}).code, ffi.ErrorCode.SERVER)
+
+    def testResolveGroupResponse(self):
+        interface = ffi.FireflyInterface(base_url="http://localhost", api_token="token", lean_responses=True)
+        created = self._response(200, b'{"data":{"type":"transaction_groups","id":"42","attributes":{"x":true}}}')
+        self.assertEqual(interface._resolveGroupResponse([0, 1], created)[0][0].id, "42")
+
+        rejected = self._response(
+            422, b'{"message":"Duplicate","errors":{"transactions.1.description":["Duplicate of transaction #7."]}}'
+        )
+        results, remaining = interface._resolveGroupResponse([0, 1], rejected)
+        self.assertEqual([(result.index, result.code) for result in results], [(1, ffi.ErrorCode.DUPLICATE)])
+        self.assertEqual(remaining, [0])
+
+
+class TestRuleGroupScope(unittest.TestCase):
+    def setUp(self) -> None:
+        self._server = fakeFirefly.FakeFireflyServer()
+        self._server.start()
+        self.addCleanup(self._server.stop)
+        self._interface = ffi.FireflyInterface(base_url=self._server.url, api_token="token")
+        self.addCleanup(self._interface.close)
+
+    def testScopeOfTransferredTransactions(self):
+        tr = self._interface.createAccount(data.PostAssetAccount("tr")).json()["data"]["id"]
+        giro = self._interface.createAccount(data.PostAssetAccount("giro")).json()["data"]["id"]
+        transactions = [
+            data.PostTransaction("2025-07-01T10:00:00", 10.0, "Buy", "withdrawal", source_name="tr"),
+            data.PostTransaction("2025-07-05T10:00:00", 20.0, "Salary", "deposit", destination_name="giro"),
+            data.PostTransaction("2025-07-03T10:00:00", 5.0, "Refund", "deposit", destination_id=99),
+        ]
+
+        scope = self._interface.ruleGroupScope(transactions)
+        self.assertEqual(scope, ffi.RuleGroupScope("2025-06-30", "2025-07-06", sorted([tr, giro, "99"])))
+        self.assertEqual(self._interface.ruleGroupScope([]), ffi.RuleGroupScope())
+
+        # Unknown accounts do not limit the scope to the other accounts
+        unknown = data.PostTransaction("2025-07-01T10:00:00", 1.0, "Fee", "withdrawal", source_name="unknown")
+        self.assertEqual(self._interface.ruleGroupScope([unknown]), ffi.RuleGroupScope("2025-06-30", "2025-07-02"))
+
+        self._interface.createRuleGroup(data.PostRuleGroup("Imports"))
+        self._interface.applyRuleGroup("Imports", scope.start_date, scope.end_date, scope.accounts)
+        _, _, payload = self._server.fake.triggers[-1]
+        self.assertEqual(payload, {"start_date": "2025-06-30", "end_date": "2025-07-06", "accounts": scope.accounts})
+
 
 if __name__ == "__main__":
     unittest.main()
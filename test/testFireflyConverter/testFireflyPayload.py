@@ -0,0 +1,48 @@
+import unittest
+
+from fireflyConverter import data
+from fireflyConverter import fireflyPayload as ffp
+
+
+class TestTransactionGroups(unittest.TestCase):
+    def setUp(self) -> None:
+        self._transactions = [
+            data.PostTransaction("2025-07-01T10:00:00", 100.0, "Buy", "withdrawal", source_name="tr"),
+            data.PostTransaction("2025-07-01T10:00:00", 1.0, "Fee", "withdrawal", source_name="tr"),
+            data.PostTransaction("2025-07-01T12:00:00", 5.0, "Tax", "withdrawal", source_name="tr"),
+            data.PostTransaction("2025-07-01T10:00:00", 50.0, "Dividend", "deposit", destination_name="tr"),
+            data.PostTransaction("2025-07-02T10:00:00", 2.0, "Fee", "withdrawal", source_name="tr"),
+        ]
+        self._factory = ffp.PayloadFactory()
+
+    def testNoGrouping(self):
+        self.assertEqual(ffp.groupTransactions(self._transactions), [[0], [1], [2], [3], [4]])
+
+    def testGroupByTimestamp(self):
+        groups = ffp.groupTransactions(self._transactions, ffp.TransactionGrouping.TIMESTAMP)
+        self.assertEqual(groups, [[0, 1], [2], [3], [4]])
+
+    def testGroupByDateAccount(self):
+        groups = ffp.groupTransactions(self._transactions, ffp.TransactionGrouping.DATE_ACCOUNT)
+        self.assertEqual(groups, [[0, 1, 2], [3], [4]])
+
+    def testMaxSplits(self):
+        groups = ffp.groupTransactions(self._transactions, ffp.TransactionGrouping.DATE_ACCOUNT, maxSplits=2)
+        self.assertEqual(groups, [[0, 1], [2], [3], [4]])
+
+    def testTransactionGroupPayload(self):
+        payload = self._factory.postTransactionGroup(self._transactions[:3])
+        self.assertEqual([split["description"] for split in payload["transactions"]], ["Buy", "Fee", "Tax"])
+        self.assertEqual(payload["group_title"], "Buy")
+
+        single = self._factory.postTransactionGroup(self._transactions[:1])
+        self.assertEqual(single, self._factory.toPayload(self._transactions[0]))
+
+    def testSelectSplits(self):
+        payload = self._factory.postTransactionGroup(self._transactions[:3])
+        self.assertEqual(ffp.selectSplits(payload, [1, 2]), self._factory.postTransactionGroup(self._transactions[1:3]))
+        self.assertEqual(ffp.selectSplits(payload, [2]), self._factory.postTransactionGroup(self._transactions[2:3]))
+
+
+if __name__ == "__main__":
+    unittest.main()
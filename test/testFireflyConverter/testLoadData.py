@@ -1,4 +1,7 @@
 import unittest
+from zoneinfo import ZoneInfoNotFoundError
+
+import pandas as pd
 
 from fireflyConverter import data
 from fireflyConverter import loadData as ldb
@@ -6,7 +9,7 @@ from fireflyConverter import loadData as ldb
 
 class TestLoaderBarclays(unittest.TestCase):
     def setUp(self) -> None:
-        self._loader = ldb.DataLoaderBarclays("test/data/barclays", "Barclays")
+        self._loader = ldb.DataLoaderBarclays("test/data/barclays", "Barclays", timezone="Europe/Berlin")
 
     def testLoad(self):
         """
@@ -14,13 +17,13 @@ class TestLoaderBarclays(unittest.TestCase):
         """
         transactions = self._loader.load()
 
-        self.assertEqual(transactions[0].date, "2025-05-30")
+        self.assertEqual(transactions[0].date, pd.Timestamp("2025-05-30", tz="Europe/Berlin"))
         self.assertEqual(transactions[0].amount, 1619.25)
         self.assertEqual(transactions[0].description, "Test1 - Test2Händler")
         self.assertEqual(transactions[0].source_name, "Barclays")
         self.assertEqual(transactions[0].type, data.TransactionType.WITHDRAWAL.value)
 
-        self.assertEqual(transactions[1].date, "2024-05-30")
+        self.assertEqual(transactions[1].date, pd.Timestamp("2024-05-30", tz="Europe/Berlin"))
         self.assertEqual(transactions[1].amount, 13.32)
         self.assertEqual(transactions[1].description, "Test2 - Test1h")
         self.assertEqual(transactions[1].source_name, "Barclays")
@@ -29,7 +32,7 @@ class TestLoaderBarclays(unittest.TestCase):
 
 class TestLoaderPaypal(unittest.TestCase):
     def setUp(self) -> None:
-        self._loader = ldb.DataLoaderPaypal("test/data/paypal", "Paypal")
+        self._loader = ldb.DataLoaderPaypal("test/data/paypal", "Paypal", timezone="Europe/Berlin")
 
     def testLoad(self):
         """
@@ -37,22 +40,47 @@ class TestLoaderPaypal(unittest.TestCase):
         """
         transactions = self._loader.load()
 
-        self.assertEqual(transactions[0].date, "2025-07-04")
+        self.assertEqual(transactions[0].date, pd.Timestamp("2025-07-04T21:34:24", tz="Europe/Berlin"))
         self.assertEqual(transactions[0].amount, 60.0)
         self.assertEqual(transactions[0].description, "Handyzahlung; asdf - rf@gmx.net - asdf")
         self.assertEqual(transactions[0].destination_name, "Paypal")
         self.assertEqual(transactions[0].type, data.TransactionType.DEPOSIT.value)
 
-        self.assertEqual(transactions[1].date, "2025-07-04")
+        self.assertEqual(transactions[1].date, pd.Timestamp("2025-07-04T22:27:43", tz="Europe/Berlin"))
         self.assertEqual(transactions[1].amount, 3.0)
         self.assertEqual(transactions[1].description, "Handyzahlung - pbfd")
         self.assertEqual(transactions[1].source_name, "Paypal")
         self.assertEqual(transactions[1].type, data.TransactionType.WITHDRAWAL.value)
 
+    def testLoadTimezoneAbbreviation(self):
+        transactions = self._loader.load()
+
+        self.assertEqual(transactions[2].date, pd.Timestamp("2025-01-12T09:15:00+01:00"))
+        self.assertEqual(transactions[2].date.utcoffset(), pd.Timedelta(hours=1))
+
+    def testLoadUnknownTimezone(self):
+        transactions = self._loader.load()
+
+        self.assertEqual(transactions[3].date, pd.Timestamp("2025-01-13T08:00:00", tz="Europe/Berlin"))
+
+
+class TestResolveTimezone(unittest.TestCase):
+    def testDefaultKeepsDatesNaive(self):
+        self.assertIsNone(data.resolveTimezone())
+        self.assertIsNone(data.toTimestamp("2025-07-01T10:00:00").tzinfo)
+
+    def testZoneinfoAbbreviationObservesDaylightSavingTime(self):
+        self.assertEqual(data.toTimestamp("2025-07-01T10:00:00", "CET").utcoffset(), pd.Timedelta(hours=2))
+        self.assertEqual(data.toTimestamp("2025-07-01T10:00:00", "MEZ").utcoffset(), pd.Timedelta(hours=2))
+
+    def testAmbiguousAbbreviationIsRejected(self):
+        with self.assertRaises(ZoneInfoNotFoundError):
+            data.resolveTimezone("BST")
+
 
 class TestLoaderTr(unittest.TestCase):
     def setUp(self) -> None:
-        self._loader = ldb.DataLoaderTr("test/data/trade_republic", "tr")
+        self._loader = ldb.DataLoaderTr("test/data/trade_republic", "tr", timezone="Europe/Berlin")
 
     def testLoad(self):
         """
@@ -60,28 +88,28 @@ class TestLoaderTr(unittest.TestCase):
         """
         transactions = self._loader.load()
 
-        self.assertEqual(transactions[0].date, "2024-02-06T15:46:07")
+        self.assertEqual(transactions[0].date, pd.Timestamp("2024-02-06T15:46:07", tz="Europe/Berlin"))
         self.assertEqual(transactions[0].amount, 10000.0)
         self.assertEqual(transactions[0].description, "asdf - Deposit")
         self.assertEqual(transactions[0].destination_name, "tr")
         self.assertIs(transactions[0].source_name, None)
         self.assertEqual(transactions[0].type, data.TransactionType.DEPOSIT.value)
 
-        self.assertEqual(transactions[1].date, "2025-07-01T05:22:12")
+        self.assertEqual(transactions[1].date, pd.Timestamp("2025-07-01T05:22:12", tz="Europe/Berlin"))
         self.assertEqual(transactions[1].amount, 48.24)
         self.assertEqual(transactions[1].description, "ijkl - Interest")
         self.assertEqual(transactions[1].destination_name, "tr")
         self.assertIs(transactions[1].source_name, None)
         self.assertEqual(transactions[1].type, data.TransactionType.DEPOSIT.value)
 
-        self.assertEqual(transactions[2].date, "2025-07-02T00:41:26")
+        self.assertEqual(transactions[2].date, pd.Timestamp("2025-07-02T00:41:26", tz="Europe/Berlin"))
         self.assertEqual(transactions[2].amount, 128.74)
         self.assertEqual(transactions[2].description, "korrekt - Tax Refund")
         self.assertEqual(transactions[2].destination_name, "tr")
         self.assertIs(transactions[2].source_name, None)
         self.assertEqual(transactions[2].type, data.TransactionType.DEPOSIT.value)
 
-        self.assertEqual(transactions[3].date, "2025-08-01T12:14:31")
+        self.assertEqual(transactions[3].date, pd.Timestamp("2025-08-01T12:14:31", tz="Europe/Berlin"))
         self.assertEqual(transactions[3].amount, 115.0)
         self.assertEqual(transactions[3].description, "money - Removal")
         self.assertEqual(transactions[3].source_name, "tr")
@@ -91,7 +119,7 @@ class TestLoaderTr(unittest.TestCase):
 
 class TestLoaderCommon(TestLoaderTr):
     def setUp(self) -> None:
-        self._loader = ldb.DataLoaderCommon("test/data/common")
+        self._loader = ldb.DataLoaderCommon("test/data/common", timezone="Europe/Berlin")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+from fireflyConverter import data
+from fireflyConverter import fireflyInterface as ffi
+from fireflyConverter import fireflyPayload as ffp
+from fireflyConverter import payloadPipeline as ppl
+
+
+class TestPayloadPipeline(unittest.TestCase):
+    def setUp(self) -> None:
+        self._transactions = [
+            data.PostTransaction("2025-07-01T10:00:00", 100.0, "Buy", "withdrawal", source_name="tr"),
+            data.PostTransaction("2025-07-01T10:00:00", 1.0, "Fee", "withdrawal", source_name="tr"),
+            data.PostTransaction("2025-07-01T12:00:00", -5.0, "Tax", "withdrawal", source_name="tr"),
+            data.PostTransaction("2025-07-02T10:00:00", 50.0, "Dividend", "deposit"),
+        ]
+        self._groups = [([0, 1], self._transactions[:2]), ([2], [self._transactions[2]]), ([3], [self._transactions[3]])]
+        self._factory = ffp.PayloadFactory()
+
+    def testValidateTransaction(self):
+        self.assertEqual(ppl.validateTransaction(self._transactions[0]), [])
+        self.assertEqual(ppl.validateTransaction(self._transactions[2]), ["Amount must be positive, got -5.0"])
+        self.assertEqual(ppl.validateTransaction(self._transactions[3]), ["Missing destination account"])
+        invalid = data.PostTransaction("2025-07-01T10:00:00", "abc", "", "withdrawal", source_name="tr")
+        self.assertEqual(ppl.validateTransaction(invalid), ["Missing description", "Invalid amount: abc"])
+
+    def testPrepare(self):
+        prepared, invalid = ppl.PayloadPipeline().prepare(self._factory, self._groups)
+        self.assertEqual(prepared, [([0, 1], self._factory.postTransactionGroup(self._transactions[:2]))])
+        self.assertEqual([index for index, _ in invalid], [2, 3])
+
+        parallel, _ = ppl.PayloadPipeline(processes=2).prepare(self._factory, self._groups)
+        self.assertEqual(parallel, prepared)
+
+    def testPayloadFile(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "payloads", "batch.jsonl")
+
+        prepared, _ = ppl.PayloadPipeline(payloadFile=path).prepare(self._factory, self._groups)
+        expected = [([0, 1], self._factory.postTransactionGroup(self._transactions[:2]))]
+        self.assertEqual(list(prepared), expected)
+        with open(path) as file:
+            self.assertEqual(len(file.readlines()), 1)
+
+    def testDryRunSendsNoRequest(self):
+        interface = ffi.FireflyInterface(base_url="http://localhost", api_token="token")
+        self.addCleanup(interface.close)
+
+        with mock.patch.object(requests.Session, "request") as request:
+            results = list(interface.createTransactions(self._transactions, dryRun=True))
+        request.assert_not_called()
+        self.assertEqual(
+            [(result.index, result.status, result.code) for result in results],
+            [
+                (0, ffi.TransactionStatus.PLANNED, None),
+                (1, ffi.TransactionStatus.PLANNED, None),
+                (2, ffi.TransactionStatus.FAILED, ffi.ErrorCode.VALIDATION),
+                (3, ffi.TransactionStatus.FAILED, ffi.ErrorCode.VALIDATION),
+            ],
+        )
+        with self.assertRaises(ValueError):
+            list(interface.createTransactions(self._transactions, dryRun=True, preflight=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
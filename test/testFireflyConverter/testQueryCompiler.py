@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from fireflyConverter import convertData as cvd
+from fireflyConverter import loadData as ldb
+from fireflyConverter import queryCompiler as qc
+
+
+class TestQueryCompiler(unittest.TestCase):
+    def setUp(self) -> None:
+        transactions = ldb.DataLoaderCommon("test/data/common").load()
+        self._dataframe = cvd.ConvertData(transactions).cache.dataframe
+
+    def testConfigQueriesCompiled(self):
+        queries, compiled = qc.loadQueryFile("test/config/queries.toml")
+        # pandas cannot apply .str methods to datetime columns, compiled queries match the ISO representation
+        isoDates = self._dataframe.assign(date=self._dataframe["date"].map(lambda value: value.isoformat()))
+        for name, query in compiled.items():
+            self.assertIsInstance(query, qc.CompiledQuery, f"Query '{name}' was not compiled")
+            reference = isoDates if "date.str." in queries[name] else qc.toWallTime(self._dataframe)
+            expected = np.asarray(reference.eval(queries[name]), dtype=bool)
+            np.testing.assert_array_equal(query.evaluate(self._dataframe), expected, err_msg=name)
+
+    def testChainedComparison(self):
+        query = qc.compileQuery("48.24 <= amount <= 128.74")
+        self.assertEqual(query.evaluate(self._dataframe).sum(), 3)
+
+    def testMembership(self):
+        query = qc.compileQuery("type in ['withdrawal'] or description.str.startswith('year')")
+        self.assertEqual(query.evaluate(self._dataframe).sum(), 2)
+
+    def testDatetimeColumn(self):
+        self.assertEqual(qc.compileQuery("date.str.startswith('2025-12-30')").evaluate(self._dataframe).sum(), 1)
+        self.assertEqual(
+            qc.compileQuery("date >= '2025-12-30' and date < '2025-12-31'").evaluate(self._dataframe).sum(),
+            qc.PandasQuery("date >= '2025-12-30' and date < '2025-12-31'").evaluate(self._dataframe).sum(),
+        )
+
+    def testUnknownColumn(self):
+        with self.assertRaises(qc.QueryCompileError) as context:
+            qc.compileQueries({"broken": "amout > 100"})
+        self.assertIn("broken", str(context.exception))
+        self.assertIn("amout", str(context.exception))
+
+    def testInvalidSyntax(self):
+        with self.assertRaises(qc.QueryCompileError):
+            qc.compileQuery("amount >")
+
+    def testUnsupportedFallsBackToPandas(self):
+        self.assertIsInstance(qc.compileQuery("amount * 2 > 500"), qc.PandasQuery)
+        with self.assertRaises(qc.UnsupportedQueryError):
+            qc.compileQuery("amount * 2 > 500", strict=True)
+
+    def testInvalidQueryFailsOnLoad(self):
+        with self.assertRaises(ValueError):
+            cvd.ConvertData([], queries={"broken": "description.str.contains()"})
+
+    def testLoadQueryFileReusesCompiledQueries(self):
+        queries, compiled = qc.loadQueryFile("test/config/queries.toml")
+        reloadedQueries, reloadedCompiled = qc.loadQueryFile("test/config/queries.toml")
+        self.assertEqual(reloadedQueries, queries)
+        for name, query in compiled.items():
+            self.assertIs(reloadedCompiled[name], query)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+
+from fireflyConverter import referenceCache as rfc
+
+
+class TestReferenceCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._now = 0.0
+        self._cache = rfc.ReferenceCache(ttl=10.0, clock=lambda: self._now)
+        self._cache.put(rfc.ReferenceKind.RULE_GROUPS, {"Groceries": [1], "Rent": [2]})
+
+    def testExpiry(self):
+        self.assertEqual(self._cache.get(rfc.ReferenceKind.RULE_GROUPS), {"Groceries": [1], "Rent": [2]})
+        self.assertIsNone(self._cache.get(rfc.ReferenceKind.ACCOUNTS))
+        self._now = 10.0
+        self.assertIsNone(self._cache.get(rfc.ReferenceKind.RULE_GROUPS))
+        self.assertEqual((self._cache.hits, self._cache.misses), (1, 2))
+
+    def testAddDiscard(self):
+        self._cache.add(rfc.ReferenceKind.RULE_GROUPS, "Rent", 3)
+        self._cache.discard(rfc.ReferenceKind.RULE_GROUPS, "1")
+        self._cache.add(rfc.ReferenceKind.ACCOUNTS, "Checking", "4")
+
+        self.assertEqual(self._cache.get(rfc.ReferenceKind.RULE_GROUPS), {"Rent": [2, 3]})
+        self.assertIsNone(self._cache.get(rfc.ReferenceKind.ACCOUNTS))
+
+    def testInvalidate(self):
+        self._cache.put(rfc.ReferenceKind.CURRENCIES, {"EUR": ["1"]})
+        self._cache.invalidate(rfc.ReferenceKind.RULE_GROUPS)
+        self.assertIsNone(self._cache.get(rfc.ReferenceKind.RULE_GROUPS))
+        self.assertIsNotNone(self._cache.get(rfc.ReferenceKind.CURRENCIES))
+
+        self._cache.invalidate()
+        self.assertIsNone(self._cache.get(rfc.ReferenceKind.CURRENCIES))
+
+    def testSelect(self):
+        mapping = {"Rent": [2, 3], "Groceries": [1]}
+        self.assertEqual(rfc.ReferenceCache.select(rfc.ReferenceKind.RULE_GROUPS, mapping, "Groceries"), 1)
+        with self.assertRaisesRegex(ValueError, "No rule group found with title: Travel"):
+            rfc.ReferenceCache.select(rfc.ReferenceKind.RULE_GROUPS, mapping, "Travel")
+        with self.assertRaisesRegex(ValueError, "Ambiguous rule group title 'Rent': found 2 matches"):
+            rfc.ReferenceCache.select(rfc.ReferenceKind.RULE_GROUPS, mapping, "Rent")
+
+
+class TestReferenceStore(unittest.TestCase):
+    def setUp(self) -> None:
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self._path = os.path.join(cache_dir.name, "cache", "references.json")
+        self._now = 1000.0
+
+    def _open(self, api_token: str = "token") -> rfc.ReferenceStore:
+        return rfc.ReferenceStore(self._path, "http://localhost/", api_token, maxAge=60.0, clock=lambda: self._now)
+
+    def testPersistsPerUser(self):
+        self._open().save(rfc.ReferenceKind.ACCOUNTS, {"Checking": ["1"]}, "v1")
+
+        self.assertEqual(self._open().load(rfc.ReferenceKind.ACCOUNTS), ({"Checking": ["1"]}, "v1"))
+        self.assertIsNone(self._open("other token").load(rfc.ReferenceKind.ACCOUNTS))
+        with open(self._path) as file:
+            self.assertNotIn("token", file.read())
+
+    def testMaxAge(self):
+        self._open().save(rfc.ReferenceKind.RULES, {"Rule": [1]})
+        self._now += 61.0
+        self.assertIsNone(self._open().load(rfc.ReferenceKind.RULES))
+
+    def testAddDiscardClear(self):
+        store = self._open()
+        store.save(rfc.ReferenceKind.RULE_GROUPS, {"Groceries": [1]})
+        store.add(rfc.ReferenceKind.RULE_GROUPS, "Rent", 2)
+        store.discard(rfc.ReferenceKind.RULE_GROUPS, 1)
+        self.assertEqual(self._open().load(rfc.ReferenceKind.RULE_GROUPS), ({"Rent": [2]}, None))
+
+        store.clear()
+        self.assertIsNone(self._open().load(rfc.ReferenceKind.RULE_GROUPS))
+
+    def testUnreadableFile(self):
+        os.makedirs(os.path.dirname(self._path))
+        with open(self._path, "w") as file:
+            file.write("{not json")
+        self.assertIsNone(self._open().load(rfc.ReferenceKind.ACCOUNTS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+import asyncio
+import socket
+import unittest
+from unittest import mock
+
+import requests
+
+from fireflyConverter import data, fakeFirefly
+from fireflyConverter import fireflyInterface as ffi
+from fireflyConverter import requestPolicy as rqp
+
+
+def make_response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def testRetryStatus(self):
+        policy = rqp.RetryPolicy()
+        self.assertTrue(policy.retryStatus(503, idempotent=True))
+        self.assertFalse(policy.retryStatus(503, idempotent=False))
+        self.assertTrue(policy.retryStatus(429, idempotent=False))
+        self.assertFalse(policy.retryStatus(500, idempotent=True))
+
+    def testDelay(self):
+        policy = rqp.RetryPolicy(backoffFactor=1.0, maxDelay=10.0)
+        for retry in range(6):
+            self.assertLessEqual(policy.delay(retry), min(10.0, 2**retry))
+        self.assertEqual(policy.delay(0, retryAfter="5"), 5.0)
+        self.assertEqual(policy.delay(0, retryAfter="120"), 10.0)
+
+    def testParseRetryAfter(self):
+        self.assertEqual(rqp.parseRetryAfter("Wed, 21 Oct 2015 07:28:30 GMT", now=1445412480.0), 30.0)
+        self.assertEqual(rqp.parseRetryAfter("soon"), 0.0)
+        self.assertEqual(rqp.parseRetryAfter(None), 0.0)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def testPacesBursts(self):
+        now = [0.0]
+        bucket = rqp.TokenBucket(rate=2.0, capacity=2.0, clock=lambda: now[0])
+        self.assertEqual([bucket.reserve() for _ in range(4)], [0.0, 0.0, 0.5, 1.0])
+        now[0] = 10.0
+        self.assertEqual(bucket.reserve(), 0.0)
+
+    def testInvalidRate(self):
+        with self.assertRaises(ValueError):
+            rqp.TokenBucket(rate=0)
+
+
+class TestAdaptiveLimiter(unittest.TestCase):
+    def setUp(self) -> None:
+        self._now = [0.0]
+        self._limiter = rqp.AdaptiveLimiter(initial=2, maximum=4, clock=lambda: self._now[0])
+
+    def _round(self, latency: float, overloaded: bool = False) -> None:
+        """Send as many requests as the limit allows and complete them after latency seconds."""
+        slots = [self._limiter.acquire() for _ in range(self._limiter.limit)]
+        self._now[0] += latency
+        for acquired in slots:
+            self._limiter.release(acquired, overloaded)
+
+    def testGrowsWhileLatencyIsFlat(self):
+        for _ in range(10):
+            self._round(0.1)
+        self.assertEqual((self._limiter.limit, self._limiter.peak), (4, 4))
+
+    def testBacksOffOncePerRound(self):
+        for _ in range(10):
+            self._round(0.1)
+        self._round(0.1, overloaded=True)
+        self.assertEqual(self._limiter.limit, 2)
+        self._round(0.1, overloaded=True)
+        self.assertEqual(self._limiter.limit, 1)
+
+    def testBacksOffOnRisingLatency(self):
+        for _ in range(10):
+            self._round(0.1)
+        for _ in range(3):
+            self._round(1.0)
+        self.assertLess(self._limiter.limit, 4)
+
+    def testAsyncWaitersAreWoken(self):
+        limiter = rqp.AdaptiveLimiter(initial=1, maximum=1)
+
+        async def run():
+            acquired = await limiter.acquireAsync()
+            waiter = asyncio.create_task(limiter.acquireAsync())
+            await asyncio.sleep(0)
+            self.assertFalse(waiter.done())
+            limiter.release(acquired)
+            limiter.release(await asyncio.wait_for(waiter, 1.0))
+
+        asyncio.run(run())
+
+    def testInvalidLimits(self):
+        with self.assertRaises(ValueError):
+            rqp.AdaptiveLimiter(minimum=4, maximum=2)
+
+    def testLimitsRequestsToServer(self):
+        server = fakeFirefly.FakeFireflyServer(latency=0.01)
+        server.start()
+        self.addCleanup(server.stop)
+        interface = ffi.FireflyInterface(base_url=server.url, api_token="token", adaptive_concurrency=8)
+        self.addCleanup(interface.close)
+        transactions = [
+            data.PostTransaction("2025-07-01T10:00:00", float(amount), "Buy", "withdrawal", source_name="tr")
+            for amount in range(1, 41)
+        ]
+
+        results = list(interface.createTransactions(transactions, workers=8))
+        self.assertTrue(all(result.status == ffi.TransactionStatus.CREATED for result in results))
+        limiter = interface.concurrencyLimiter
+        self.assertLessEqual(server.fake.stats.maxInFlight, limiter.peak)
+        self.assertLessEqual(limiter.peak, 8)
+
+
+class TestRequestRetries(unittest.TestCase):
+    def setUp(self) -> None:
+        self._interface = ffi.FireflyInterface(base_url="http://localhost", api_token="token", backoff_factor=0.0)
+        self.addCleanup(self._interface.close)
+
+    def testRetriesTransientFailures(self):
+        responses = [requests.ConnectionError("reset"), make_response(503), make_response(429), make_response(200)]
+        with mock.patch.object(requests.Session, "request", side_effect=responses) as request:
+            response = self._interface._request("GET", "http://localhost/api/v1/accounts")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(request.call_count, 4)
+
+    def testPostWithoutDuplicateProtectionIsNotRepeated(self):
+        with mock.patch.object(requests.Session, "request", side_effect=[make_response(503)]) as request:
+            response = self._interface._request("POST", "http://localhost/api/v1/accounts", json={"name": "a"})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(request.call_count, 1)
+
+        payload = {"error_if_duplicate_hash": True, "transactions": []}
+        with mock.patch.object(requests.Session, "request", side_effect=[make_response(502), make_response(200)]):
+            response = self._interface._request("POST", "http://localhost/api/v1/transactions", json=payload)
+        self.assertEqual(response.status_code, 200)
+
+    def testRepeatedPostRejectedAsDuplicateIsCreated(self):
+        duplicate = make_response(422)
+        duplicate._content = (
+            b'{"message": "Duplicate of transaction #12.", '
+            b'"errors": {"transactions.0.description": ["Duplicate of transaction #12."]}}'
+        )
+        payload = {"error_if_duplicate_hash": True, "transactions": [{"description": "Buy"}]}
+        responses = [requests.ReadTimeout("timed out"), duplicate]
+        with mock.patch.object(requests.Session, "request", side_effect=responses):
+            results = self._interface._createGroupResults([0], payload)
+        self.assertEqual(results, [ffi.TransactionResult(0, ffi.TransactionStatus.CREATED, id="12")])
+
+        # Without an earlier attempt that may have been stored, the duplicate is reported as failure
+        with mock.patch.object(requests.Session, "request", side_effect=[make_response(429), duplicate]):
+            results = self._interface._createGroupResults([0], payload)
+        self.assertEqual(results[0].status, ffi.TransactionStatus.FAILED)
+        self.assertEqual(results[0].code, ffi.ErrorCode.DUPLICATE)
+
+    def testTransportErrorFailsGroup(self):
+        payload = {"error_if_duplicate_hash": True, "transactions": [{"description": "Buy"}]}
+        with mock.patch.object(requests.Session, "request", side_effect=[requests.ConnectionError("refused")] * 5):
+            results = self._interface._createGroupResults([0], payload)
+        self.assertEqual(results[0].status, ffi.TransactionStatus.FAILED)
+        self.assertEqual(results[0].code, ffi.ErrorCode.TRANSPORT)
+
+        # Programming errors are not reported as failed transactions
+        with mock.patch.object(requests.Session, "request", side_effect=TypeError("bug")):
+            with self.assertRaises(TypeError):
+                self._interface._createGroupResults([0], payload)
+
+    def testGivesUpAfterMaxRetries(self):
+        with mock.patch.object(requests.Session, "request", side_effect=[make_response(503)] * 5) as request:
+            response = self._interface._request("DELETE", "http://localhost/api/v1/rules/1")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(request.call_count, 5)
+
+
+class TestConnectionSettings(unittest.TestCase):
+    def testAdapterPoolSize(self):
+        interface = ffi.FireflyInterface(
+            base_url="http://localhost", api_token="token", pool_maxsize=32, keep_alive=False
+        )
+        self.addCleanup(interface.close)
+        adapter = interface._session.get_adapter("http://localhost")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter.max_retries.total, 0)
+        self.assertEqual(interface._session.headers["Connection"], "close")
+
+    def testStalledServerTimesOut(self):
+        # The server accepts connections but never answers
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        self.addCleanup(server.close)
+        interface = ffi.FireflyInterface(
+            base_url=f"http://127.0.0.1:{server.getsockname()[1]}",
+            api_token="token",
+            read_timeout=0.2,
+            max_retries=0,
+        )
+        self.addCleanup(interface.close)
+
+        with self.assertRaises(requests.ReadTimeout):
+            interface.getAccounts()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from fireflyConverter import data
+from fireflyConverter import fakeFirefly as ff
+from fireflyConverter import fireflyInterface as ffi
+from fireflyConverter import runReport as rr
+
+
+class TestRunRecorder(unittest.TestCase):
+    def testPercentile(self):
+        values = [float(value) for value in range(1, 101)]
+        self.assertEqual(rr.percentile(values, 50), 50.5)
+        self.assertAlmostEqual(rr.percentile(values, 99), 99.01)
+        self.assertEqual(rr.percentile([], 95), 0.0)
+
+    def testReport(self):
+        now = [0.0]
+        recorder = rr.RunRecorder(clock=lambda: now[0], slowest=1)
+        with recorder.stage("transfer"):
+            for latency in (0.01, 0.03, 0.02):
+                recorder.recordRequest(rr.RequestSample("POST", "/transactions", 200, latency, 100, 50))
+            recorder.recordRequest(rr.RequestSample("POST", "/transactions", 503, 0.2, 100, 0))
+            recorder.recordRequest(rr.RequestSample("POST", "/transactions", 200, 0.02, 100, 50, retry=1))
+            recorder.recordOutcome("created", 4)
+            now[0] = 2.0
+
+        report = recorder.report()
+        self.assertEqual(
+            report["requests"], {"total": 5, "per_second": 2.5, "retried": 1, "by_status": {"200": 4, "503": 1}}
+        )
+        self.assertAlmostEqual(report["latency"]["POST"]["p50_ms"], 20.0)
+        self.assertEqual([request["status"] for request in report["slowest"]], [503])
+        self.assertEqual(report["bytes"], {"sent": 500, "received": 200})
+        self.assertEqual((report["outcomes"], report["stages_s"]), ({"created": 4}, {"transfer": 2.0}))
+
+
+class TestRecordedRequests(unittest.TestCase):
+    def testRecordsEveryAttempt(self):
+        server = ff.FakeFireflyServer()
+        server.start()
+        self.addCleanup(server.stop)
+        interface = ffi.FireflyInterface(base_url=server.url, api_token="token", backoff_factor=0.0)
+        self.addCleanup(interface.close)
+        interface.recorder = rr.RunRecorder()
+
+        interface.createAccount(data.PostAssetAccount("tr"))
+        server.fake.failNext(503)
+        transaction = data.PostTransaction("2025-07-01T10:00:00", 10.0, "Buy", "withdrawal", source_name="tr")
+        list(interface.createTransactions([transaction]))
+        interface.deleteAccount(interface.getAccounts()[0].id)
+
+        report = interface.recorder.report()
+        self.assertEqual(report["requests"]["retried"], 1)
+        self.assertEqual(report["requests"]["by_status"], {"200": 3, "204": 1, "503": 1})
+        endpoints = {request["endpoint"] for request in report["slowest"]}
+        self.assertEqual(endpoints, {"/accounts", "/transactions", "/accounts/{id}"})
+        self.assertGreater(report["bytes"]["sent"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from fireflyConverter import data
+from fireflyConverter import fireflyInterface as ffi
+from fireflyConverter import loadData as ldb
+from fireflyConverter import transactionMirror as tm
+
+
+class TestTransactionMirror(unittest.TestCase):
+    def setUp(self):
+        api_token = os.getenv("TEST_API_TOKEN")
+        assert api_token is not None, "TEST_API_TOKEN environment variable must be set for tests."
+        self._base_url = os.getenv("TEST_BASE_URL", "http://localhost")
+
+        self._fireflyInterface = ffi.FireflyInterface(base_url=self._base_url, api_token=api_token)
+        self.addCleanup(self._removeFireflyData)
+        self._fireflyInterface.createAccount(data.PostAssetAccount("tr"))
+        self._transactions = ldb.DataLoaderCommon("test/data/common").load()
+
+        mirror_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(mirror_dir.cleanup)
+        self._mirror = tm.TransactionMirror(os.path.join(mirror_dir.name, "mirror.sqlite"))
+        self.addCleanup(self._mirror.close)
+
+    def _removeFireflyData(self):
+        """Purges data generated during test runs from test server."""
+        self._fireflyInterface.deleteAccounts()
+        self._fireflyInterface.purgeUserData()
+
+    def testIncrementalSync(self):
+        results = list(self._fireflyInterface.createTransactions(self._transactions[:4]))
+
+        result = self._mirror.sync(self._fireflyInterface)
+        accounts = len(self._fireflyInterface.getAccounts())
+        self.assertEqual((result.full, result.transactions, result.accounts), (True, 4, accounts))
+
+        list(self._fireflyInterface.createTransactions(self._transactions[4:]))
+        self.assertFalse(self._mirror.sync(self._fireflyInterface).full)
+        self.assertEqual(len(self._mirror.transactions()), 5)
+
+        self._fireflyInterface.deleteTransaction(results[0].id)
+        self.assertTrue(self._mirror.sync(self._fireflyInterface).full)
+        self.assertEqual(len(self._mirror.transactions()), 4)
+
+    def testQueriesWithoutServer(self):
+        list(self._fireflyInterface.createTransactions(self._transactions))
+        self._mirror.sync(self._fireflyInterface)
+        self._fireflyInterface.purgeUserData()
+
+        self.assertIn("tr", [account.name for account in self._mirror.accounts()])
+        july = self._mirror.transactions(start="2025-07-01", end="2025-07-31")
+        self.assertEqual([t.description for t in july], ["ijkl - Interest", "korrekt - Tax Refund"])
+        self.assertEqual(len(self._mirror.transactions(minAmount=150.0)), 2)
+
+        deposits = self._mirror.convertData().filterByQuery("type == 'deposit' and amount > 100")
+        self.assertEqual(len(deposits.transactions), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()